@@ -0,0 +1,7 @@
+"""Admin API
+
+운영 상태(커넥션 풀 등) 조회 API를 제공합니다.
+"""
+from app.api.admin.admin_controller import router as admin_router
+
+__all__ = ["admin_router"]
@@ -0,0 +1,26 @@
+from fastapi import APIRouter
+
+from app.common.cache import chart_cache, stock_count_cache, trading_count_cache
+from app.common.http_transport import http_transport
+from app.db import pool_stats
+
+router = APIRouter(prefix="/admin", tags=["운영"])
+
+
+@router.get("/pools")
+async def get_pool_stats():
+    '''커넥션 풀 / 캐시 상태 (JSON 스냅샷, 같은 지표의 시계열은 /metrics)
+
+    - db: DB 커넥션 풀 (크기, 사용 중/유휴, 오버플로, 사용률)
+    - http: 키움 API HTTP 커넥션 풀
+    - caches: 인메모리 캐시별 크기/적중률
+    '''
+    return {
+        "db": pool_stats(),
+        "http": http_transport.stats(),
+        "caches": {
+            "chart": chart_cache.stats(),
+            "stock_count": stock_count_cache.stats(),
+            "trading_count": trading_count_cache.stats(),
+        },
+    }
@@ -83,26 +83,23 @@ async def get_resistance_support_levels(
         # 1. 차트 데이터 조회
         chart_data = None
         if timeframe == "day":
-            result = await chart_service.get_day_chart(
+            chart_data = await chart_service.get_day_bars(
                 stk_cd=stock_code,
                 start_dt=start_dt,
                 end_dt=end_dt
             )
-            chart_data = result.items
         elif timeframe == "week":
-            result = await chart_service.get_week_chart(
+            chart_data = await chart_service.get_week_bars(
                 stk_cd=stock_code,
                 start_dt=start_dt,
                 end_dt=end_dt
             )
-            chart_data = result.items
         elif timeframe == "month":
-            result = await chart_service.get_month_chart(
+            chart_data = await chart_service.get_month_bars(
                 stk_cd=stock_code,
                 start_dt=start_dt,
                 end_dt=end_dt
             )
-            chart_data = result.items
         else:
             raise HTTPException(
                 status_code=400,
@@ -194,26 +191,23 @@ async def get_volume_profile(
         # 1. 차트 데이터 조회
         chart_data = None
         if timeframe == "day":
-            result = await chart_service.get_day_chart(
+            chart_data = await chart_service.get_day_bars(
                 stk_cd=stock_code,
                 start_dt=start_dt,
                 end_dt=end_dt
             )
-            chart_data = result.items
         elif timeframe == "week":
-            result = await chart_service.get_week_chart(
+            chart_data = await chart_service.get_week_bars(
                 stk_cd=stock_code,
                 start_dt=start_dt,
                 end_dt=end_dt
             )
-            chart_data = result.items
         elif timeframe == "month":
-            result = await chart_service.get_month_chart(
+            chart_data = await chart_service.get_month_bars(
                 stk_cd=stock_code,
                 start_dt=start_dt,
                 end_dt=end_dt
             )
-            chart_data = result.items
         else:
             raise HTTPException(
                 status_code=400,
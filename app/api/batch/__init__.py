@@ -0,0 +1,7 @@
+"""Batch API
+
+배치 작업 수동 실행, 재개, 실패 항목 재시도 API를 제공합니다.
+"""
+from app.api.batch.batch_controller import router as batch_router
+
+__all__ = ["batch_router"]
@@ -0,0 +1,133 @@
+import asyncio
+import json
+from typing import Optional
+
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from app.batch.checkpoint import DbBatchCheckpoint
+from app.batch.sync_jobs import JOB_CLASSES, run_job_by_name
+from app.common.progress import progress_registry
+
+router = APIRouter(prefix="/batch", tags=["배치 작업"])
+
+
+def _check_job(table_name: str) -> None:
+    if table_name not in JOB_CLASSES:
+        raise HTTPException(status_code=404, detail=f"배치 작업을 찾을 수 없습니다: {table_name}")
+
+
+def _check_checkpointed(table_name: str) -> None:
+    if not JOB_CLASSES[table_name].checkpointed:
+        raise HTTPException(
+            status_code=400,
+            detail=f"체크포인트를 사용하지 않는 작업입니다 (실행 단위 지정/실패 항목 재시도 불가): {table_name}",
+        )
+
+
+RUN_KEY_QUERY = Query(
+    None,
+    pattern=r"^\d{8}$",
+    description="실행 단위 = 기준일자(base_dt, YYYYMMDD), 미입력 시 작업 기본값 (체크포인트 작업만)",
+)
+
+
+@router.post("/jobs/{table_name}/run")
+async def run_job(
+    table_name: str,
+    background_tasks: BackgroundTasks,
+    resume: bool = Query(True, description="중단된 실행의 완료 항목은 건너뛰고 이어서 실행, false면 처음부터"),
+    run_key: Optional[str] = RUN_KEY_QUERY,
+):
+    '''배치 작업 수동 실행
+
+    같은 기준일자(run_key)의 이전 실행이 중단됐다면 체크포인트부터 이어서 실행합니다.
+    날짜가 바뀐 뒤 지난 실행을 이어서 하려면 그 실행의 run_key를 지정합니다.
+    작업은 백그라운드에서 실행되며, 진행 상황은 체크포인트 조회로 확인합니다.
+    '''
+    _check_job(table_name)
+    if run_key:
+        _check_checkpointed(table_name)
+    background_tasks.add_task(run_job_by_name, table_name, resume, False, run_key)
+    return {"message": f"{table_name} 배치 작업을 시작합니다", "resume": resume, "run_key": run_key}
+
+
+@router.post("/jobs/{table_name}/retry-failed")
+async def retry_failed_items(
+    table_name: str,
+    background_tasks: BackgroundTasks,
+    run_key: Optional[str] = Query(
+        None,
+        pattern=r"^\d{8}$",
+        description="실패 항목을 재시도할 실행 단위(기준일자 YYYYMMDD), 미입력 시 실패 항목이 있는 가장 최근 실행",
+    ),
+):
+    '''이전 실행에서 실패한 항목만 재시도
+
+    체크포인트 작업만 지원하며, 재시도할 실패 항목이 없으면 404를 반환합니다.
+    '''
+    _check_job(table_name)
+    _check_checkpointed(table_name)
+
+    runs = await DbBatchCheckpoint.summary(table_name, run_key)
+    failed_run = next((run for run in runs if run["failed_items"]), None)
+    if failed_run is None:
+        target = f"{table_name}:{run_key}" if run_key else table_name
+        raise HTTPException(status_code=404, detail=f"재시도할 실패 항목이 없습니다: {target}")
+
+    background_tasks.add_task(run_job_by_name, table_name, True, True, failed_run["run_key"])
+    return {
+        "message": f"{table_name} 실패 항목 재시도를 시작합니다",
+        "run_key": failed_run["run_key"],
+        "failed_items": failed_run["failed_items"],
+    }
+
+
+@router.get("/jobs/{table_name}/checkpoints")
+async def get_checkpoints(
+    table_name: str,
+    run_key: Optional[str] = Query(None, description="실행 단위 (기준일자 YYYYMMDD), 미입력 시 전체"),
+):
+    '''실행 단위별 체크포인트 상태 및 실패 항목 조회'''
+    _check_job(table_name)
+    return await DbBatchCheckpoint.summary(table_name, run_key)
+
+
+# ── 진행 상황 ────────────────────────────────────────────────────────────────
+
+@router.get("/progress")
+async def get_progress(running_only: bool = Query(False, description="실행 중인 작업만 조회")):
+    '''배치 작업 진행 지표 (처리 수/전체, 처리량, API 지연 백분위, 오류 수, ETA)'''
+    return progress_registry.snapshots(running_only)
+
+
+@router.get("/progress/stream")
+async def stream_progress(
+    request: Request,
+    interval: float = Query(1.0, ge=0.2, le=30.0, description="전송 간격(초)"),
+):
+    '''배치 작업 진행 지표 Server-Sent Events 스트림
+
+    interval마다 전체 작업의 진행 지표를 progress 이벤트로 전송합니다.
+    '''
+    async def events():
+        while not await request.is_disconnected():
+            data = json.dumps(progress_registry.snapshots(), ensure_ascii=False)
+            yield f"event: progress\ndata: {data}\n\n"
+            await asyncio.sleep(interval)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/progress/{table_name}")
+async def get_job_progress(table_name: str):
+    '''배치 작업 하나의 진행 지표 (실행 중이거나 마지막 실행)'''
+    _check_job(table_name)
+    progress = progress_registry.get(table_name)
+    if progress is None:
+        raise HTTPException(status_code=404, detail=f"실행 기록이 없습니다: {table_name}")
+    return progress.snapshot()
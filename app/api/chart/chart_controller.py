@@ -25,19 +25,24 @@ async def batch_sync_minute_chart(
     base_dt: Optional[str] = Query(None, description="기준일자 (YYYYMMDD), 미입력 시 당일"),
     tic_scope: str = Query("1", description="틱범위: 1, 3, 5, 10, 15, 30, 45, 60"),
     upd_stkpc_tp: str = Query("1", description="수정주가구분: 0(미적용), 1(적용)"),
-    delay: float = Query(0.5, description="종목 간 API 호출 딜레이(초)"),
+    max_workers: Optional[int] = Query(None, ge=1, le=32, description="동시 처리 종목 수, 미입력 시 기본값(CHART_SYNC_MAX_WORKERS)"),
+    incremental: bool = Query(True, description="종목별 마지막 저장 시점(워터마크) 이후만 동기화, false면 워터마크 무시"),
+    max_pages: Optional[int] = Query(None, ge=0, description="워터마크가 없는 종목의 조회 페이지 수, 미입력 시 기본값(CHART_BATCH_MAX_PAGES), 0이면 전체 이력"),
     chart_service: ChartService = Depends(Provide[Container.chart_service]),
 ) -> BatchSyncResponse:
     '''전체 종목 분봉 차트 배치 동기화
 
     DB에 등록된 모든 활성 종목의 분봉 데이터를 Kiwoom API에서 가져와 저장합니다.
-    자동 페이징을 지원하여 전체 이력 데이터를 한 번에 적재합니다.
+    자동 페이징을 지원하며, incremental이면 워터마크 이후 봉만 요청하고 그 이전 페이지는 조회하지 않습니다.
+    워터마크가 없는 종목은 최근 max_pages 페이지만 조회합니다.
     '''
     return await chart_service.batch_sync_minute_chart(
         base_dt=base_dt,
         tic_scope=tic_scope,
         upd_stkpc_tp=upd_stkpc_tp,
-        delay=delay,
+        max_workers=max_workers,
+        incremental=incremental,
+        max_pages=max_pages,
     )
 
 
@@ -46,18 +51,23 @@ async def batch_sync_minute_chart(
 async def batch_sync_day_chart(
     base_dt: str = Query(..., description="기준일자 (YYYYMMDD)"),
     upd_stkpc_tp: str = Query("1", description="수정주가구분: 0(미적용), 1(적용)"),
-    delay: float = Query(0.5, description="종목 간 API 호출 딜레이(초)"),
+    max_workers: Optional[int] = Query(None, ge=1, le=32, description="동시 처리 종목 수, 미입력 시 기본값(CHART_SYNC_MAX_WORKERS)"),
+    incremental: bool = Query(True, description="종목별 마지막 저장 시점(워터마크) 이후만 동기화, false면 워터마크 무시"),
+    max_pages: Optional[int] = Query(None, ge=0, description="워터마크가 없는 종목의 조회 페이지 수, 미입력 시 기본값(CHART_BATCH_MAX_PAGES), 0이면 전체 이력"),
     chart_service: ChartService = Depends(Provide[Container.chart_service]),
 ) -> BatchSyncResponse:
     '''전체 종목 일봉 차트 배치 동기화
 
     DB에 등록된 모든 활성 종목의 일봉 데이터를 Kiwoom API에서 가져와 저장합니다.
-    자동 페이징을 지원하여 전체 이력 데이터를 한 번에 적재합니다.
+    자동 페이징을 지원하며, incremental이면 워터마크 이후 봉만 요청하고 그 이전 페이지는 조회하지 않습니다.
+    워터마크가 없는 종목은 최근 max_pages 페이지만 조회합니다.
     '''
     return await chart_service.batch_sync_day_chart(
         base_dt=base_dt,
         upd_stkpc_tp=upd_stkpc_tp,
-        delay=delay,
+        max_workers=max_workers,
+        incremental=incremental,
+        max_pages=max_pages,
     )
 
 
@@ -66,18 +76,23 @@ async def batch_sync_day_chart(
 async def batch_sync_week_chart(
     base_dt: str = Query(..., description="기준일자 (YYYYMMDD)"),
     upd_stkpc_tp: str = Query("1", description="수정주가구분: 0(미적용), 1(적용)"),
-    delay: float = Query(0.5, description="종목 간 API 호출 딜레이(초)"),
+    max_workers: Optional[int] = Query(None, ge=1, le=32, description="동시 처리 종목 수, 미입력 시 기본값(CHART_SYNC_MAX_WORKERS)"),
+    incremental: bool = Query(True, description="종목별 마지막 저장 시점(워터마크) 이후만 동기화, false면 워터마크 무시"),
+    max_pages: Optional[int] = Query(None, ge=0, description="워터마크가 없는 종목의 조회 페이지 수, 미입력 시 기본값(CHART_BATCH_MAX_PAGES), 0이면 전체 이력"),
     chart_service: ChartService = Depends(Provide[Container.chart_service]),
 ) -> BatchSyncResponse:
     '''전체 종목 주봉 차트 배치 동기화
 
     DB에 등록된 모든 활성 종목의 주봉 데이터를 Kiwoom API에서 가져와 저장합니다.
-    자동 페이징을 지원하여 전체 이력 데이터를 한 번에 적재합니다.
+    자동 페이징을 지원하며, incremental이면 워터마크 이후 봉만 요청하고 그 이전 페이지는 조회하지 않습니다.
+    워터마크가 없는 종목은 최근 max_pages 페이지만 조회합니다.
     '''
     return await chart_service.batch_sync_week_chart(
         base_dt=base_dt,
         upd_stkpc_tp=upd_stkpc_tp,
-        delay=delay,
+        max_workers=max_workers,
+        incremental=incremental,
+        max_pages=max_pages,
     )
 
 
@@ -86,18 +101,23 @@ async def batch_sync_week_chart(
 async def batch_sync_month_chart(
     base_dt: str = Query(..., description="기준일자 (YYYYMMDD)"),
     upd_stkpc_tp: str = Query("1", description="수정주가구분: 0(미적용), 1(적용)"),
-    delay: float = Query(0.5, description="종목 간 API 호출 딜레이(초)"),
+    max_workers: Optional[int] = Query(None, ge=1, le=32, description="동시 처리 종목 수, 미입력 시 기본값(CHART_SYNC_MAX_WORKERS)"),
+    incremental: bool = Query(True, description="종목별 마지막 저장 시점(워터마크) 이후만 동기화, false면 워터마크 무시"),
+    max_pages: Optional[int] = Query(None, ge=0, description="워터마크가 없는 종목의 조회 페이지 수, 미입력 시 기본값(CHART_BATCH_MAX_PAGES), 0이면 전체 이력"),
     chart_service: ChartService = Depends(Provide[Container.chart_service]),
 ) -> BatchSyncResponse:
     '''전체 종목 월봉 차트 배치 동기화
 
     DB에 등록된 모든 활성 종목의 월봉 데이터를 Kiwoom API에서 가져와 저장합니다.
-    자동 페이징을 지원하여 전체 이력 데이터를 한 번에 적재합니다.
+    자동 페이징을 지원하며, incremental이면 워터마크 이후 봉만 요청하고 그 이전 페이지는 조회하지 않습니다.
+    워터마크가 없는 종목은 최근 max_pages 페이지만 조회합니다.
     '''
     return await chart_service.batch_sync_month_chart(
         base_dt=base_dt,
         upd_stkpc_tp=upd_stkpc_tp,
-        delay=delay,
+        max_workers=max_workers,
+        incremental=incremental,
+        max_pages=max_pages,
     )
 
 
@@ -111,7 +131,7 @@ async def sync_minute_chart_range(
     stock_code: Optional[str] = Query(None, description="종목코드 (미입력 시 전체 종목)"),
     tic_scope: str = Query("1", description="틱범위: 1, 3, 5, 10, 15, 30, 45, 60"),
     upd_stkpc_tp: str = Query("1", description="수정주가구분: 0(미적용), 1(적용)"),
-    delay: float = Query(0.5, description="종목 간 API 호출 딜레이(초)"),
+    max_workers: Optional[int] = Query(None, ge=1, le=32, description="동시 처리 종목 수, 미입력 시 기본값(CHART_SYNC_MAX_WORKERS)"),
     chart_service: ChartService = Depends(Provide[Container.chart_service]),
 ) -> BatchSyncResponse:
     '''분봉 날짜 범위 동기화
@@ -125,7 +145,7 @@ async def sync_minute_chart_range(
         stock_code=stock_code,
         tic_scope=tic_scope,
         upd_stkpc_tp=upd_stkpc_tp,
-        delay=delay,
+        max_workers=max_workers,
     )
 
 
@@ -136,7 +156,7 @@ async def sync_day_chart_range(
     end_dt: str = Query(..., description="종료일자 (YYYYMMDD)"),
     stock_code: Optional[str] = Query(None, description="종목코드 (미입력 시 전체 종목)"),
     upd_stkpc_tp: str = Query("1", description="수정주가구분: 0(미적용), 1(적용)"),
-    delay: float = Query(0.5, description="종목 간 API 호출 딜레이(초)"),
+    max_workers: Optional[int] = Query(None, ge=1, le=32, description="동시 처리 종목 수, 미입력 시 기본값(CHART_SYNC_MAX_WORKERS)"),
     chart_service: ChartService = Depends(Provide[Container.chart_service]),
 ) -> BatchSyncResponse:
     '''일봉 날짜 범위 동기화
@@ -149,7 +169,7 @@ async def sync_day_chart_range(
         end_dt=end_dt,
         stock_code=stock_code,
         upd_stkpc_tp=upd_stkpc_tp,
-        delay=delay,
+        max_workers=max_workers,
     )
 
 
@@ -160,7 +180,7 @@ async def sync_week_chart_range(
     end_dt: str = Query(..., description="종료일자 (YYYYMMDD)"),
     stock_code: Optional[str] = Query(None, description="종목코드 (미입력 시 전체 종목)"),
     upd_stkpc_tp: str = Query("1", description="수정주가구분: 0(미적용), 1(적용)"),
-    delay: float = Query(0.5, description="종목 간 API 호출 딜레이(초)"),
+    max_workers: Optional[int] = Query(None, ge=1, le=32, description="동시 처리 종목 수, 미입력 시 기본값(CHART_SYNC_MAX_WORKERS)"),
     chart_service: ChartService = Depends(Provide[Container.chart_service]),
 ) -> BatchSyncResponse:
     '''주봉 날짜 범위 동기화
@@ -173,7 +193,7 @@ async def sync_week_chart_range(
         end_dt=end_dt,
         stock_code=stock_code,
         upd_stkpc_tp=upd_stkpc_tp,
-        delay=delay,
+        max_workers=max_workers,
     )
 
 
@@ -184,7 +204,7 @@ async def sync_month_chart_range(
     end_dt: str = Query(..., description="종료일자 (YYYYMMDD)"),
     stock_code: Optional[str] = Query(None, description="종목코드 (미입력 시 전체 종목)"),
     upd_stkpc_tp: str = Query("1", description="수정주가구분: 0(미적용), 1(적용)"),
-    delay: float = Query(0.5, description="종목 간 API 호출 딜레이(초)"),
+    max_workers: Optional[int] = Query(None, ge=1, le=32, description="동시 처리 종목 수, 미입력 시 기본값(CHART_SYNC_MAX_WORKERS)"),
     chart_service: ChartService = Depends(Provide[Container.chart_service]),
 ) -> BatchSyncResponse:
     '''월봉 날짜 범위 동기화
@@ -197,7 +217,7 @@ async def sync_month_chart_range(
         end_dt=end_dt,
         stock_code=stock_code,
         upd_stkpc_tp=upd_stkpc_tp,
-        delay=delay,
+        max_workers=max_workers,
     )
 
 
@@ -288,10 +308,12 @@ async def get_day_chart_with_ma(
     end_dt: str = Query(..., description="조회 종료일 (YYYYMMDD)"),
     chart_service: ChartService = Depends(Provide[Container.chart_service]),
 ) -> DayChartWithMAResponse:
-    '''일봉 차트 + 5/10/20/60 이동평균선 조회
+    '''일봉 차트 + 5/10/20/60 이동평균선 및 지표 조회
 
-    DB에 저장된 일봉 데이터를 기반으로 5, 10, 20, 60일 이동평균선을 계산하여 반환합니다.
-    선행 데이터가 부족한 초기 구간은 해당 MA 값이 null로 반환됩니다.
+    DB에 저장된 일봉 데이터를 기반으로 5, 10, 20, 60일 이동평균선과
+    EMA(12/26), RSI(14), MACD(12/26/9), 볼린저 밴드(20, 2σ)를 계산하여 반환합니다.
+    start_dt 이전 선행 봉을 자동으로 함께 조회하므로 시작일부터 값이 채워지며,
+    상장 직후처럼 DB에 선행 데이터 자체가 부족한 경우에만 null로 반환됩니다.
     '''
     return await chart_service.get_day_chart_with_ma(
         stk_cd=stock_code,
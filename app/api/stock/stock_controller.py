@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from dependency_injector.wiring import inject, Provide
 from fastapi import APIRouter, Depends, Query
@@ -32,6 +32,8 @@ async def get_stock_list(
         description="정렬 기준",
         pattern="^(market_cap_desc|market_cap_asc|created_at_desc|created_at_asc|name_asc|name_desc)$"
     ),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (입력 시 skip 무시)"),
+    with_total: bool = Query(True, description="전체 개수 포함 여부 (false면 COUNT 생략)"),
     stock_service: StockService = Depends(get_stock_service)
 ):
     """종목 리스트 조회 (페이지네이션, 필터, 정렬 지원)
@@ -41,6 +43,8 @@ async def get_stock_list(
     **페이지네이션:**
     - skip: 건너뛸 개수 (0부터 시작)
     - limit: 조회할 개수 (최대 1000)
+    - cursor: 응답의 next_cursor를 그대로 넘기면 다음 페이지 조회 (깊은 페이지도 일정한 속도)
+    - with_total: 전체 개수는 짧게 캐시되며, 필요 없으면 false로 생략
 
     **필터:**
     - market_code: 시장구분 (0: KOSPI, 10: KOSDAQ, 30: K-OTC, 50: KONEX, 8: ETF, 60: ETN)
@@ -59,6 +63,7 @@ async def get_stock_list(
     - 시가총액 상위 100개: `?limit=100&order_by=market_cap_desc`
     - 코스피 최신 등록 종목: `?market_code=0&order_by=created_at_desc`
     - 2026년 1월 등록된 종목: `?start_date=2026-01-01&end_date=2026-01-31`
+    - 다음 페이지: `?order_by=market_cap_desc&cursor={next_cursor}`
 
     Args:
         skip: 페이지네이션 오프셋
@@ -67,9 +72,11 @@ async def get_stock_list(
         start_date: 조회 시작일 (YYYY-MM-DD)
         end_date: 조회 종료일 (YYYY-MM-DD)
         order_by: 정렬 기준
+        cursor: 다음 페이지 커서
+        with_total: 전체 개수 포함 여부
 
     Returns:
-        종목 리스트와 전체 개수
+        종목 리스트, 전체 개수, 다음 페이지 커서(next_cursor)
     """
     try:
         result = await stock_service.get_stock_list(
@@ -79,6 +86,8 @@ async def get_stock_list(
             start_date=start_date,
             end_date=end_date,
             order_by=order_by,
+            cursor=cursor,
+            with_total=with_total,
         )
         return APIResponse(
             success=True,
@@ -95,6 +104,33 @@ async def get_stock_list(
         )
 
 
+@router.post("/list/sync")
+async def sync_stock_list(
+    market_codes: Optional[List[MarketCode]] = Query(None, description="시장구분 목록, 미입력 시 KOSPI + KOSDAQ"),
+    stock_service: StockService = Depends(get_stock_service)
+):
+    """종목 리스트 동기화 (ka10099)
+
+    시장별 종목 리스트를 동시에 조회하여 종목코드 기준으로 일괄 upsert합니다.
+    신규/변경/동일 건수를 함께 반환합니다.
+    """
+    try:
+        result = await stock_service.sync_stock_list(
+            market_codes=[code.value for code in market_codes] if market_codes else None
+        )
+        return APIResponse(
+            success=True,
+            message=f"종목 리스트 동기화 완료: {result['synced_count']}건",
+            data=result
+        )
+    except Exception as e:
+        return APIResponse(
+            success=False,
+            message="종목 리스트 동기화 실패",
+            error=str(e)
+        )
+
+
 @router.get("/basic-info")
 @inject
 async def get_stock_basic_info(
@@ -177,10 +213,15 @@ async def sync_investor_daily_trade_stock(
                 stex_tp=stex_tp
             )
         )
+        failed = result.failed_combinations
         return APIResponse(
-            success=True,
-            message=f"투자자별 일별 매매 동기화 완료: {len(result)}건",
-            data=[r.model_dump() for r in result]
+            success=not failed,
+            message=(
+                f"투자자별 일별 매매 동기화 완료: {len(result.trades)}건"
+                + (f", 실패 조합 {len(failed)}개" if failed else "")
+            ),
+            data=[r.model_dump() for r in result.trades],
+            error=", ".join(failed) if failed else None
         )
     except Exception as e:
         return APIResponse(
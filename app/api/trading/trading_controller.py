@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date
 from typing import Optional
@@ -7,7 +7,7 @@ from app.db import get_db
 from app.repositories.trading_repository import TradingRepository
 from app.services.trading_service import TradingService
 from app.schemas.response import APIResponse
-from app.schemas.trading import TradingSyncRequest
+from app.schemas.trading import TradingRankingResponse, TradingSyncRequest
 from app.domain.rank.services.rank_service import RankService
 from app.domain.rank.enums.market_type import MarketType
 from app.domain.rank.enums.mang_stk_incls import MangStkIncls
@@ -15,7 +15,7 @@ from app.domain.rank.enums.mang_stk_incls import MangStkIncls
 # Direct imports for dependency injection
 from app.domain.rank.repositories.rank_repository import RankRepository
 from app.domain.rank.rank_client import RankClient
-from app.common.auth_client import AuthClient
+from app.common.auth_client import auth_client
 
 
 router = APIRouter(prefix="/trading", tags=["거래 정보"])
@@ -26,7 +26,6 @@ def get_trading_service(
 ) -> TradingService:
     """TradingService 의존성 주입"""
     # 직접 rank_service 생성
-    auth_client = AuthClient()
     rank_client = RankClient()
     rank_repository = RankRepository(auth_client, rank_client)
     rank_service = RankService(rank_repository)
@@ -58,7 +57,6 @@ async def sync_trading_data(
     """
     try:
         # Create dependencies directly
-        auth_client = AuthClient()
         rank_client = RankClient()
         rank_repository = RankRepository(auth_client, rank_client)
         rank_service = RankService(rank_repository)
@@ -90,35 +88,58 @@ async def sync_trading_data(
 
 @router.get("/ranking/latest")
 async def get_latest_ranking(
+    request: Request,
     skip: int = Query(0, ge=0, description="건너뛸 개수"),
     limit: int = Query(100, ge=1, le=500, description="조회 개수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (입력 시 skip 무시)"),
+    with_total: bool = Query(True, description="전체 개수 포함 여부 (스냅샷 응답은 항상 포함)"),
     trading_service: TradingService = Depends(get_trading_service)
 ):
     """최신 거래대금 순위 조회
 
-    DB에 저장된 가장 최근 날짜의 거래대금 순위를 조회합니다.
+    가장 최근 동기화된 거래일의 순위를 메모리 스냅샷에서 바로 반환합니다
+    (DB는 TRADING_SNAPSHOT_TTL_SECONDS마다 변경 여부만 확인).
+    응답의 ETag를 If-None-Match로 보내면 변경이 없을 때 304를 반환하므로
+    주기적으로 폴링하는 클라이언트는 본문 없이 확인만 할 수 있습니다.
+    cursor로 이어 조회하는 경우에만 DB에서 조회합니다.
 
     Args:
         skip: 페이지네이션 오프셋
         limit: 조회 개수
+        cursor: 다음 페이지 커서 (응답의 next_cursor)
+        with_total: 전체 개수 포함 여부
 
     Returns:
         최신 거래대금 순위 리스트
     """
     try:
-        # 오늘 날짜로 조회
-        today = date.today()
-        result = await trading_service.get_ranking_by_date(
-            trade_date=today,
-            skip=skip,
-            limit=limit
-        )
+        snapshot = await trading_service.get_latest_snapshot()
+        if snapshot is None:
+            return APIResponse(
+                success=True,
+                message="최신 거래대금 순위 조회 성공",
+                data=TradingRankingResponse(trade_date=date.today(), rankings=[], total_count=0).model_dump()
+            )
 
-        return APIResponse(
-            success=True,
-            message="최신 거래대금 순위 조회 성공",
-            data=result.model_dump()
-        )
+        if cursor:
+            result = await trading_service.get_ranking_by_date(
+                trade_date=snapshot.trade_date,
+                skip=skip,
+                limit=limit,
+                cursor=cursor,
+                with_total=with_total
+            )
+            return APIResponse(
+                success=True,
+                message="최신 거래대금 순위 조회 성공",
+                data=result.model_dump()
+            )
+
+        body, etag = snapshot.page(skip, limit)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
     except Exception as e:
         return APIResponse(
             success=False,
@@ -127,11 +148,21 @@ async def get_latest_ranking(
         )
 
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더(쉼표 구분 목록, W/ 약한 비교, *)와 ETag 비교"""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+
 @router.get("/ranking/{trade_date}")
 async def get_trading_ranking(
     trade_date: date,
     skip: int = Query(0, ge=0, description="건너뛸 개수"),
     limit: int = Query(100, ge=1, le=500, description="조회 개수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (입력 시 skip 무시)"),
+    with_total: bool = Query(True, description="전체 개수 포함 여부"),
     trading_service: TradingService = Depends(get_trading_service)
 ):
     """특정 날짜의 거래대금 순위 조회
@@ -142,6 +173,8 @@ async def get_trading_ranking(
         trade_date: 거래일자 (YYYY-MM-DD)
         skip: 페이지네이션 오프셋
         limit: 조회 개수
+        cursor: 다음 페이지 커서 (응답의 next_cursor)
+        with_total: 전체 개수 포함 여부 (지난 날짜는 캐시된 값 사용)
 
     Returns:
         거래대금 순위 리스트
@@ -150,7 +183,9 @@ async def get_trading_ranking(
         result = await trading_service.get_ranking_by_date(
             trade_date=trade_date,
             skip=skip,
-            limit=limit
+            limit=limit,
+            cursor=cursor,
+            with_total=with_total
         )
 
         return APIResponse(
@@ -173,6 +208,8 @@ async def get_stock_trading_history(
     end_date: Optional[date] = Query(None, description="종료일자 (YYYY-MM-DD)"),
     skip: int = Query(0, ge=0, description="건너뛸 개수"),
     limit: int = Query(30, ge=1, le=365, description="조회 개수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (입력 시 skip 무시)"),
+    with_total: bool = Query(True, description="전체 개수 포함 여부"),
     trading_service: TradingService = Depends(get_trading_service)
 ):
     """종목별 거래 히스토리 조회
@@ -185,6 +222,8 @@ async def get_stock_trading_history(
         end_date: 종료일자
         skip: 페이지네이션 오프셋
         limit: 조회 개수
+        cursor: 다음 페이지 커서 (응답의 next_cursor)
+        with_total: 전체 개수 포함 여부
 
     Returns:
         종목별 거래 히스토리
@@ -195,10 +234,12 @@ async def get_stock_trading_history(
             start_date=start_date,
             end_date=end_date,
             skip=skip,
-            limit=limit
+            limit=limit,
+            cursor=cursor,
+            with_total=with_total
         )
 
-        if result.total_count == 0:
+        if not result.history and skip == 0 and cursor is None:
             return APIResponse(
                 success=False,
                 message=f"종목 거래 히스토리를 찾을 수 없습니다: {stock_code}",
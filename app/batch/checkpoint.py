@@ -0,0 +1,157 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.mysql import insert
+
+from app.batch.models.batch_checkpoint import BatchCheckpoint
+from app.config import settings
+from app.db import get_session
+
+logger = logging.getLogger(__name__)
+
+
+class DbBatchCheckpoint:
+    """batch_checkpoint 테이블 기반 항목별 체크포인트
+
+    (table_name, run_key) 하나가 한 번의 배치 실행 단위입니다.
+    같은 run_key로 다시 실행하면 완료(DONE) 항목은 건너뛰고,
+    진행 중(RUNNING)이던 항목은 저장해 둔 next-key부터 이어서 조회합니다.
+    retry_failed=True면 실패(FAILED) 항목만 다시 처리합니다.
+    on_progress는 항목이 완료될 때마다 이번 실행의 누적 저장 건수로 호출됩니다.
+    """
+
+    def __init__(
+        self,
+        table_name: str,
+        run_key: str,
+        retry_failed: bool = False,
+        on_progress: Optional[Callable[[int], Awaitable]] = None,
+    ):
+        self.table_name = table_name
+        self.run_key = run_key
+        self.retry_failed = retry_failed
+        self.on_progress = on_progress
+        self.record_count = 0
+
+    def _scope(self):
+        return (
+            BatchCheckpoint.table_name == self.table_name,
+            BatchCheckpoint.run_key == self.run_key,
+        )
+
+    async def plan(self, item_keys: List[str]) -> Dict[str, Optional[str]]:
+        async for session in get_session():
+            rows = await session.execute(
+                select(BatchCheckpoint.item_key, BatchCheckpoint.status, BatchCheckpoint.page_key)
+                .where(*self._scope())
+            )
+            states = {row.item_key: (row.status, row.page_key) for row in rows}
+
+        if self.retry_failed:
+            planned = {key: None for key in item_keys if states.get(key, (None,))[0] == "FAILED"}
+        else:
+            planned = {
+                key: states[key][1] if key in states else None
+                for key in item_keys
+                if states.get(key, (None,))[0] != "DONE"
+            }
+        logger.info(
+            f"[{self.table_name}:{self.run_key}] 체크포인트: 대상 {len(item_keys)}, "
+            f"처리 {len(planned)}, 건너뜀 {len(item_keys) - len(planned)}"
+        )
+        return planned
+
+    async def _upsert(self, item_key: str, **values) -> None:
+        stmt = insert(BatchCheckpoint).values(
+            table_name=self.table_name,
+            run_key=self.run_key,
+            item_key=item_key,
+            updated_at=datetime.now(),
+            **values,
+        )
+        stmt = stmt.on_duplicate_key_update(
+            updated_at=stmt.inserted.updated_at,
+            **{column: stmt.inserted[column] for column in values},
+        )
+        async for session in get_session():
+            await session.execute(stmt)
+            await session.commit()
+
+    async def save_page(self, item_key: str, page_key: Optional[str]) -> None:
+        await self._upsert(item_key, status="RUNNING", page_key=page_key)
+
+    async def mark_done(self, item_key: str, record_count: int) -> None:
+        await self._upsert(
+            item_key, status="DONE", page_key=None, record_count=record_count, error_message=None
+        )
+        self.record_count += record_count
+        if self.on_progress:
+            await self.on_progress(self.record_count)
+
+    async def mark_failed(self, item_key: str, error_message: str) -> None:
+        await self._upsert(item_key, status="FAILED", error_message=error_message)
+
+    async def reset(self) -> None:
+        """이 실행의 체크포인트 전체 삭제 (처음부터 다시 실행)"""
+        async for session in get_session():
+            await session.execute(delete(BatchCheckpoint).where(*self._scope()))
+            await session.commit()
+
+    async def clear_done(self) -> None:
+        """완료 항목 정리 (실행이 끝난 뒤 호출, 실패 항목은 재시도용으로 남긴다)
+
+        재시도로 완료된 항목은 같은 행이 FAILED → DONE으로 바뀌므로 여기서 함께 지워진다.
+        """
+        async for session in get_session():
+            await session.execute(
+                delete(BatchCheckpoint).where(*self._scope(), BatchCheckpoint.status == "DONE")
+            )
+            await session.commit()
+
+    async def prune_expired(self) -> int:
+        """보존 기간(BATCH_CHECKPOINT_RETENTION_DAYS)보다 오래된 이 작업의 체크포인트 삭제
+
+        재시도되지 않은 실패 항목이나 재개되지 않은 실행이 쌓이지 않도록 실행마다 호출한다.
+        """
+        if settings.BATCH_CHECKPOINT_RETENTION_DAYS <= 0:
+            return 0
+        cutoff = datetime.now() - timedelta(days=settings.BATCH_CHECKPOINT_RETENTION_DAYS)
+        async for session in get_session():
+            result = await session.execute(
+                delete(BatchCheckpoint).where(
+                    BatchCheckpoint.table_name == self.table_name,
+                    BatchCheckpoint.updated_at < cutoff,
+                )
+            )
+            await session.commit()
+        if result.rowcount:
+            logger.info(f"[{self.table_name}] 보존 기간이 지난 체크포인트 {result.rowcount}건 삭제")
+        return result.rowcount
+
+    @staticmethod
+    async def summary(table_name: str, run_key: Optional[str] = None) -> List[dict]:
+        """실행 단위별 상태 집계 및 실패 항목 목록"""
+        async for session in get_session():
+            conditions = [BatchCheckpoint.table_name == table_name]
+            if run_key:
+                conditions.append(BatchCheckpoint.run_key == run_key)
+
+            counts = await session.execute(
+                select(BatchCheckpoint.run_key, BatchCheckpoint.status, func.count())
+                .where(*conditions)
+                .group_by(BatchCheckpoint.run_key, BatchCheckpoint.status)
+            )
+            failed = await session.execute(
+                select(BatchCheckpoint.run_key, BatchCheckpoint.item_key)
+                .where(*conditions, BatchCheckpoint.status == "FAILED")
+                .order_by(BatchCheckpoint.run_key, BatchCheckpoint.item_key)
+            )
+
+            runs: Dict[str, dict] = {}
+            for key, status, count in counts:
+                runs.setdefault(key, {"run_key": key, "counts": {}, "failed_items": []})["counts"][status] = count
+            for key, item_key in failed:
+                runs[key]["failed_items"].append(item_key)
+            return sorted(runs.values(), key=lambda run: run["run_key"], reverse=True)
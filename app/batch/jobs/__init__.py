@@ -4,6 +4,7 @@ from app.batch.jobs.minute_chart_sync_job import MinuteChartSyncJob
 from app.batch.jobs.weekly_chart_sync_job import WeeklyChartSyncJob
 from app.batch.jobs.monthly_chart_sync_job import MonthlyChartSyncJob
 from app.batch.jobs.trading_ranking_sync_job import TradingRankingSyncJob
+from app.batch.jobs.trading_ranking_intraday_job import TradingRankingIntradayJob
 from app.batch.jobs.investor_daily_trade_sync_job import InvestorDailyTradeSyncJob
 
 __all__ = [
@@ -13,5 +14,6 @@ __all__ = [
     "WeeklyChartSyncJob",
     "MonthlyChartSyncJob",
     "TradingRankingSyncJob",
+    "TradingRankingIntradayJob",
     "InvestorDailyTradeSyncJob",
 ]
@@ -1,7 +1,11 @@
+import asyncio
 import logging
 from abc import ABC, abstractmethod
+from typing import Optional
 
-from app.batch.schedule_manager import ScheduleManager
+from app.batch.checkpoint import DbBatchCheckpoint
+from app.batch.schedule_manager import JobRunContext
+from app.common.progress import JobProgress, current_progress, progress_registry
 
 logger = logging.getLogger(__name__)
 
@@ -9,43 +13,104 @@ logger = logging.getLogger(__name__)
 class BaseSyncJob(ABC):
     """배치 동기화 작업 추상 클래스 (템플릿 메서드 패턴)"""
 
-    def __init__(self, table_name: str):
+    # run_key(기준일자) 단위 항목 체크포인트 사용 여부
+    # True인 작업은 생성자에서 기준일자(base_dt)를 받아 지난 실행을 재개/재시도할 수 있다
+    checkpointed: bool = False
+
+    def __init__(self, table_name: str, run_key: Optional[str] = None):
         self.table_name = table_name
+        # 체크포인트 실행 단위 (예: 기준일자), None이면 체크포인트를 쓰지 않음
+        self.run_key = run_key
         self.history_id = None
+        self.checkpoint: Optional[DbBatchCheckpoint] = None
+        self.run_context: Optional[JobRunContext] = None
+        self.progress: Optional[JobProgress] = None
 
-    async def run(self) -> None:
+    async def run(self, resume: bool = True, retry_failed: bool = False) -> None:
         """배치 작업 실행 (템플릿 메서드)
 
         공통 로직:
         1. 활성화 여부 확인
         2. 히스토리 생성
         3. 동기화 시작 상태 업데이트
-        4. 실제 작업 실행 (execute() 호출)
+        4. 실제 작업 실행 (execute() 호출, 진행 건수는 heartbeat로 주기적 기록)
+           체크포인트 작업은 항목 완료마다, 그 외 작업은 heartbeat 간격마다 기록
         5. 성공/실패 상태 업데이트
+        1~3과 5는 각각 한 트랜잭션이며, 실행 전체가 세션 하나(JobRunContext)를 사용합니다.
+
+        run_key가 있는 작업은 항목별 체크포인트를 남깁니다.
+        - resume=True: 같은 run_key의 이전 실행이 중단됐다면 완료 항목을 건너뛰고 이어서 실행
+        - resume=False: 이전 체크포인트를 지우고 처음부터 실행
+        - retry_failed=True: 이전 실행에서 실패한 항목만 다시 실행
         """
         try:
-            # 활성화 여부 확인
-            if not await ScheduleManager.is_enabled(self.table_name):
-                logger.info(f"[{self.table_name}] 스케줄이 비활성화되어 있습니다.")
-                return
+            # 활성화 확인 ~ 시작 기록까지 한 트랜잭션, 이후 상태 기록도 같은 세션 사용
+            async with JobRunContext(self.table_name) as run:
+                if not run.enabled:
+                    logger.info(f"[{self.table_name}] 스케줄이 비활성화되어 있습니다.")
+                    return
+
+                self.run_context = run
+                self.history_id = run.history_id
+                # 진행 지표: execute() 안에서 만든 태스크와 HTTP 호출이 current_progress로 공유
+                self.progress = progress_registry.start(self.table_name, self.run_key)
+                progress_token = current_progress.set(self.progress)
+                try:
+                    if self.run_key:
+                        self.checkpoint = DbBatchCheckpoint(
+                            self.table_name, self.run_key, retry_failed, on_progress=run.heartbeat
+                        )
+                        if not resume and not retry_failed:
+                            await self.checkpoint.reset()
+                        await self.checkpoint.prune_expired()
+
+                    # 실제 동기화 작업 실행 (서브클래스에서 구현)
+                    # 체크포인트가 없는 작업은 항목 완료 콜백이 없으므로 주기적으로 진행 기록
+                    # 실행 세션을 공유하므로 취소하지 않고 종료 신호로 heartbeat 사이에서 멈춘다
+                    heartbeat_stop = asyncio.Event()
+                    heartbeat_task = (
+                        None if self.checkpoint else asyncio.create_task(self._heartbeat_loop(run, heartbeat_stop))
+                    )
+                    try:
+                        count = await self.execute()
+                    finally:
+                        if heartbeat_task:
+                            heartbeat_stop.set()
+                            await heartbeat_task
 
-            # 히스토리 생성 및 동기화 시작
-            self.history_id = await ScheduleManager.create_history(self.table_name)
-            await ScheduleManager.update_sync_start(self.table_name)
+                    # 끝까지 실행됐으므로 완료 항목 체크포인트 정리 (실패 항목은 재시도용으로 유지)
+                    if self.checkpoint:
+                        await self.checkpoint.clear_done()
 
-            # 실제 동기화 작업 실행 (서브클래스에서 구현)
-            count = await self.execute()
+                    # 동기화 완료
+                    self.progress.finish("SUCCESS")
+                    await run.succeed(count)
+                    logger.info(f"[{self.table_name}] 동기화 완료: {count}건")
 
-            # 동기화 완료
-            await ScheduleManager.update_sync_success(self.table_name, count)
-            await ScheduleManager.update_history_success(self.history_id, count)
-            logger.info(f"[{self.table_name}] 동기화 완료: {count}건")
+                except Exception as e:
+                    self.progress.finish("FAILED")
+                    logger.exception(f"[{self.table_name}] 동기화 중 오류 발생")
+                    await run.fail(str(e))
+                finally:
+                    if self.progress.status == "RUNNING":
+                        self.progress.finish("CANCELLED")
+                    current_progress.reset(progress_token)
 
-        except Exception as e:
-            logger.exception(f"[{self.table_name}] 동기화 중 오류 발생")
-            await ScheduleManager.update_sync_failed(self.table_name, str(e))
-            if self.history_id:
-                await ScheduleManager.update_history_failed(self.history_id, str(e))
+        except Exception:
+            logger.exception(f"[{self.table_name}] 배치 상태 기록 중 오류 발생")
+
+    async def _heartbeat_loop(self, run: JobRunContext, stop: asyncio.Event) -> None:
+        """execute() 실행 중 heartbeat 간격마다 진행 건수 기록 (stop이 설정되면 종료)
+
+        기록 중인 쿼리가 끊기지 않도록 취소 대신 대기 중에만 종료 신호를 확인한다.
+        """
+        interval = max(run.heartbeat_interval, 1.0)
+        while True:
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=interval)
+                return
+            except asyncio.TimeoutError:
+                await run.heartbeat(self.progress.record_count)
 
     @abstractmethod
     async def execute(self) -> int:
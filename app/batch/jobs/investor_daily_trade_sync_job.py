@@ -1,5 +1,6 @@
 import logging
 from datetime import datetime, timedelta
+from typing import Optional
 
 from app.batch.jobs.base_sync_job import BaseSyncJob
 from app.containers import Container
@@ -9,30 +10,38 @@ logger = logging.getLogger(__name__)
 
 
 class InvestorDailyTradeSyncJob(BaseSyncJob):
-    """투자자별 일별 매매 동기화 작업"""
+    """투자자별 일별 매매 동기화 작업 (조회 조합 단위 체크포인트)"""
 
-    def __init__(self):
-        super().__init__("investor_daily_trade")
+    checkpointed = True
+
+    def __init__(self, base_dt: Optional[str] = None):
+        # 기본은 오늘 기준 최근 5일 (지난 실행 재개/재시도는 그 실행의 종료일자를 지정)
+        self.end_dt = base_dt or datetime.now().strftime("%Y%m%d")
+        super().__init__("investor_daily_trade", run_key=self.end_dt)
 
     async def execute(self) -> int:
-        # 오늘 날짜 기준으로 동기화 (최근 5일)
-        end_dt = datetime.now().strftime("%Y%m%d")
-        start_dt = (datetime.now() - timedelta(days=5)).strftime("%Y%m%d")
+        start_dt = (datetime.strptime(self.end_dt, "%Y%m%d") - timedelta(days=5)).strftime("%Y%m%d")
 
         # Container에서 StockService 가져오기
         container = Container()
         stock_service = container.stock_service()
 
-        # 투자자별 일별 매매 동기화 실행 (모든 조합)
+        # 투자자별 일별 매매 동기화 실행 (모든 조합, 실패 조합은 체크포인트에 FAILED로 남음)
         result = await stock_service.sync_investor_daily_trade_stock(
             investorDailyTradeStockRequest=InvestorDailyTradeStockRequest(
                 strt_dt=start_dt,
-                end_dt=end_dt,
+                end_dt=self.end_dt,
                 trde_tp=None,  # 전체 (순매도 + 순매수)
                 mrkt_tp=None,  # 전체 (코스피 + 코스닥)
                 invsr_tp=None,  # 전체 투자자 타입
                 stex_tp=None,  # 전체 거래소
-            )
+            ),
+            checkpoint=self.checkpoint,
         )
 
-        return len(result)
+        if result.failed_combinations:
+            logger.warning(
+                f"[{self.table_name}] 실패 조합 {len(result.failed_combinations)}개 "
+                f"(retry-failed로 재시도): {result.failed_combinations}"
+            )
+        return len(result.trades)
@@ -1,5 +1,6 @@
 import logging
 from datetime import datetime
+from typing import Optional
 
 from app.batch.jobs.base_sync_job import BaseSyncJob
 from app.containers import Container
@@ -10,24 +11,29 @@ logger = logging.getLogger(__name__)
 class MinuteChartSyncJob(BaseSyncJob):
     """분봉 차트 동기화 작업"""
 
-    def __init__(self):
-        super().__init__("chart_minute")
+    checkpointed = True
 
-    async def execute(self) -> int:
-        # 오늘 날짜 기준으로 동기화
-        base_dt = datetime.now().strftime("%Y%m%d")
+    def __init__(self, base_dt: Optional[str] = None):
+        # 기본은 오늘 날짜 기준으로 동기화 (지난 실행 재개/재시도는 그 실행의 기준일자를 지정)
+        base_dt = base_dt or datetime.now().strftime("%Y%m%d")
+        super().__init__("chart_minute", run_key=base_dt)
+        self.base_dt = base_dt
 
+    async def execute(self) -> int:
         # Container에서 ChartService 가져오기
         container = Container()
         chart_service = container.chart_service()
 
         # 배치 동기화 실행 (1분봉)
         result = await chart_service.batch_sync_minute_chart(
-            base_dt=base_dt,
+            base_dt=self.base_dt,
             tic_scope="1",
             upd_stkpc_tp="1",
-            delay=0.5,
+            checkpoint=self.checkpoint,
         )
 
-        logger.info(f"[{self.table_name}] 성공 {result.success}건, 실패 {result.failed}건")
-        return result.success
+        logger.info(
+            f"[{self.table_name}] 성공 {result.success}종목, 실패 {result.failed}종목, "
+            f"건너뜀 {result.skipped}종목, 저장 {result.record_count}건"
+        )
+        return result.record_count
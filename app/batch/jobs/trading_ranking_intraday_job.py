@@ -0,0 +1,54 @@
+import logging
+from datetime import datetime, time
+
+from app.common.auth_client import auth_client
+from app.config import settings
+from app.db import get_session
+from app.domain.rank.enums.mang_stk_incls import MangStkIncls
+from app.domain.rank.enums.market_type import MarketType
+from app.domain.rank.rank_client import RankClient
+from app.domain.rank.repositories.rank_repository import RankRepository
+from app.domain.rank.services.rank_service import RankService
+from app.repositories.trading_repository import TradingRepository
+from app.services.trading_service import TradingService
+
+logger = logging.getLogger(__name__)
+
+
+def is_market_hours(now: datetime) -> bool:
+    """평일 TRADING_INTRADAY_START ~ TRADING_INTRADAY_END 여부"""
+    if now.weekday() >= 5:
+        return False
+    start = time.fromisoformat(settings.TRADING_INTRADAY_START)
+    end = time.fromisoformat(settings.TRADING_INTRADAY_END)
+    return start <= now.time() <= end
+
+
+class TradingRankingIntradayJob:
+    """장중 거래대금 순위 갱신 작업
+
+    짧은 간격으로 실행되므로 BaseSyncJob의 실행 이력/체크포인트 기록을 남기지 않습니다.
+    장 마감 후 전체 동기화는 TradingRankingSyncJob이 그대로 담당합니다.
+    """
+
+    async def run(self) -> None:
+        now = datetime.now()
+        if not is_market_hours(now):
+            return
+
+        try:
+            async for session in get_session():
+                rank_client = RankClient()
+                rank_repository = RankRepository(auth_client, rank_client)
+                rank_service = RankService(rank_repository)
+                trading_service = TradingService(TradingRepository(session), rank_service)
+
+                result = await trading_service.sync_intraday_ranking(
+                    trade_date=now.date(),
+                    limit=100,
+                    market_type=MarketType.ALL,
+                    include_managed=MangStkIncls.EXCLUDE,
+                )
+                logger.debug(f"[trading_ranking_intraday] 변경 {result.synced_count}건 저장")
+        except Exception:
+            logger.exception("[trading_ranking_intraday] 장중 순위 갱신 중 오류 발생")
@@ -2,7 +2,7 @@ import logging
 from datetime import date
 
 from app.batch.jobs.base_sync_job import BaseSyncJob
-from app.common.auth_client import AuthClient
+from app.common.auth_client import auth_client
 from app.db import get_session
 from app.domain.rank.enums.mang_stk_incls import MangStkIncls
 from app.domain.rank.enums.market_type import MarketType
@@ -27,7 +27,6 @@ class TradingRankingSyncJob(BaseSyncJob):
 
         # 의존성 주입 (DB 세션 필요)
         async for session in get_session():
-            auth_client = AuthClient()
             rank_client = RankClient()
             rank_repository = RankRepository(auth_client, rank_client)
             rank_service = RankService(rank_repository)
@@ -1,4 +1,5 @@
 from app.batch.models.data_sync_schedule import DataSyncSchedule
 from app.batch.models.batch_execution_history import BatchExecutionHistory
+from app.batch.models.batch_checkpoint import BatchCheckpoint
 
-__all__ = ["DataSyncSchedule", "BatchExecutionHistory"]
+__all__ = ["DataSyncSchedule", "BatchExecutionHistory", "BatchCheckpoint"]
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, BigInteger, String, DateTime, Integer, Text, Index
+from app.db import Base
+
+
+class BatchCheckpoint(Base):
+    __tablename__ = "batch_checkpoint"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    table_name = Column(String(100), nullable=False)
+    run_key = Column(String(32), nullable=False)  # 실행 단위 (예: 기준일자)
+    item_key = Column(String(32), nullable=False)  # 처리 항목 (예: 종목코드)
+    status = Column(String(20), nullable=False)  # RUNNING, DONE, FAILED
+    page_key = Column(String(255))  # 이어서 조회할 next-key
+    record_count = Column(Integer, default=0)
+    error_message = Column(Text)
+    updated_at = Column(DateTime)
+
+    __table_args__ = (
+        Index("idx_batch_checkpoint_item", "table_name", "run_key", "item_key", unique=True),
+        Index("idx_batch_checkpoint_status", "table_name", "run_key", "status"),
+    )
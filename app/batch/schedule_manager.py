@@ -1,150 +1,163 @@
+import asyncio
 import logging
-from datetime import datetime
+import time
 from typing import Optional
 
-from sqlalchemy import select, update, insert
+from sqlalchemy import func, insert, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.batch.models.data_sync_schedule import DataSyncSchedule
 from app.batch.models.batch_execution_history import BatchExecutionHistory
-from app.db import get_session
+from app.config import settings
+from app.db import AsyncSessionLocal
 
 logger = logging.getLogger(__name__)
 
 
-class ScheduleManager:
-    """데이터 동기화 스케줄 관리"""
-
-    @staticmethod
-    async def get_schedule(table_name: str) -> Optional[DataSyncSchedule]:
-        """스케줄 정보 조회"""
-        async for session in get_session():
-            stmt = select(DataSyncSchedule).where(DataSyncSchedule.table_name == table_name)
-            result = await session.execute(stmt)
-            return result.scalar_one_or_none()
-
-    @staticmethod
-    async def create_history(table_name: str) -> int:
-        """배치 실행 히스토리 생성 (시작 기록)"""
-        async for session in get_session():
-            stmt = insert(BatchExecutionHistory).values(
-                table_name=table_name,
-                started_at=datetime.now(),
+def _duration_seconds():
+    """시작 시각부터 지금까지 경과 초 (DB에서 계산)"""
+    return func.timestampdiff(text("SECOND"), BatchExecutionHistory.started_at, func.now())
+
+
+class JobRunContext:
+    """배치 1회 실행의 상태 기록 (세션 하나로 처리)
+
+    시작 시 활성화 확인 → 히스토리 생성 → 스케줄 RUNNING 표시를 한 트랜잭션으로,
+    종료 시 히스토리/스케줄 갱신을 한 트랜잭션으로 기록합니다.
+    소요 시간은 TIMESTAMPDIFF로 DB에서 계산하므로 종료 전에 시작 시각을 다시 읽지 않습니다.
+    세션은 커밋마다 커넥션을 풀에 돌려주므로 작업이 길어도 커넥션을 붙잡지 않습니다.
+
+    사용 예:
+        async with JobRunContext(table_name) as run:
+            if not run.enabled:
+                return
+            ...
+            await run.heartbeat(count)
+            await run.succeed(count)
+    """
+
+    def __init__(self, table_name: str, heartbeat_interval: Optional[float] = None):
+        self.table_name = table_name
+        self.heartbeat_interval = (
+            settings.BATCH_HEARTBEAT_INTERVAL_SECONDS if heartbeat_interval is None else heartbeat_interval
+        )
+        self.history_id: Optional[int] = None
+        self.enabled = False
+        self._session: Optional[AsyncSession] = None
+        self._lock = asyncio.Lock()
+        self._last_heartbeat = 0.0
+
+    async def __aenter__(self) -> "JobRunContext":
+        self._session = AsyncSessionLocal()
+        try:
+            await self._start()
+        except BaseException:
+            await self._session.close()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self._session.close()
+
+    async def _start(self) -> None:
+        session = self._session
+        self.enabled = bool(
+            await session.scalar(
+                select(DataSyncSchedule.is_enabled).where(DataSyncSchedule.table_name == self.table_name)
+            )
+        )
+        if not self.enabled:
+            await session.rollback()
+            return
+
+        result = await session.execute(
+            insert(BatchExecutionHistory).values(
+                table_name=self.table_name,
+                started_at=func.now(),
                 status="RUNNING",
-                created_at=datetime.now(),
+                created_at=func.now(),
             )
-            result = await session.execute(stmt)
-            await session.commit()
-            history_id = result.lastrowid
-            logger.info(f"[{table_name}] 히스토리 생성: ID={history_id}")
-            return history_id
-
-    @staticmethod
-    async def update_history_success(history_id: int, count: int) -> None:
-        """배치 실행 히스토리 업데이트 (성공)"""
-        async for session in get_session():
-            stmt = select(BatchExecutionHistory).where(BatchExecutionHistory.id == history_id)
-            result = await session.execute(stmt)
-            history = result.scalar_one_or_none()
-
-            if history:
-                completed_at = datetime.now()
-                duration = int((completed_at - history.started_at).total_seconds())
-
-                update_stmt = (
-                    update(BatchExecutionHistory)
-                    .where(BatchExecutionHistory.id == history_id)
-                    .values(
-                        completed_at=completed_at,
-                        duration_seconds=duration,
-                        status="SUCCESS",
-                        record_count=count,
-                    )
-                )
-                await session.execute(update_stmt)
-                await session.commit()
-                logger.info(f"[히스토리 ID={history_id}] 성공 기록: {count}건, {duration}초 소요")
-
-    @staticmethod
-    async def update_history_failed(history_id: int, error_message: str) -> None:
-        """배치 실행 히스토리 업데이트 (실패)"""
-        async for session in get_session():
-            stmt = select(BatchExecutionHistory).where(BatchExecutionHistory.id == history_id)
-            result = await session.execute(stmt)
-            history = result.scalar_one_or_none()
-
-            if history:
-                completed_at = datetime.now()
-                duration = int((completed_at - history.started_at).total_seconds())
-
-                update_stmt = (
+        )
+        self.history_id = result.lastrowid
+        await session.execute(
+            update(DataSyncSchedule)
+            .where(DataSyncSchedule.table_name == self.table_name)
+            .values(last_sync_status="RUNNING", last_sync_at=func.now(), updated_at=func.now())
+        )
+        await session.commit()
+        self._last_heartbeat = time.monotonic()
+        logger.info(f"[{self.table_name}] 동기화 시작: 히스토리 ID={self.history_id}")
+
+    async def heartbeat(self, count: int) -> None:
+        """진행 건수 기록 (heartbeat_interval 이내의 호출과 기록 중 들어온 호출은 건너뜀)"""
+        if self.history_id is None or self._lock.locked():
+            return
+        if time.monotonic() - self._last_heartbeat < self.heartbeat_interval:
+            return
+        async with self._lock:
+            self._last_heartbeat = time.monotonic()
+            try:
+                await self._session.execute(
                     update(BatchExecutionHistory)
-                    .where(BatchExecutionHistory.id == history_id)
-                    .values(
-                        completed_at=completed_at,
-                        duration_seconds=duration,
-                        status="FAILED",
-                        error_message=error_message,
-                    )
+                    .where(BatchExecutionHistory.id == self.history_id)
+                    .values(record_count=count, duration_seconds=_duration_seconds())
                 )
-                await session.execute(update_stmt)
-                await session.commit()
-                logger.error(f"[히스토리 ID={history_id}] 실패 기록: {error_message}, {duration}초 소요")
-
-    @staticmethod
-    async def update_sync_start(table_name: str) -> None:
-        """동기화 시작 상태 업데이트"""
-        async for session in get_session():
-            stmt = (
-                update(DataSyncSchedule)
-                .where(DataSyncSchedule.table_name == table_name)
+                await self._session.commit()
+            except Exception as e:
+                # 진행 기록 실패로 작업을 중단하지 않는다
+                await self._session.rollback()
+                logger.warning(f"[{self.table_name}] 진행 기록 실패: {e}")
+
+    async def succeed(self, count: int) -> None:
+        async with self._lock:
+            session = self._session
+            await session.execute(
+                update(BatchExecutionHistory)
+                .where(BatchExecutionHistory.id == self.history_id)
                 .values(
-                    last_sync_status="RUNNING",
-                    last_sync_at=datetime.now(),
-                    updated_at=datetime.now(),
+                    completed_at=func.now(),
+                    duration_seconds=_duration_seconds(),
+                    status="SUCCESS",
+                    record_count=count,
                 )
             )
-            await session.execute(stmt)
-            await session.commit()
-            logger.info(f"[{table_name}] 동기화 시작")
-
-    @staticmethod
-    async def update_sync_success(table_name: str, count: int) -> None:
-        """동기화 성공 상태 업데이트"""
-        async for session in get_session():
-            stmt = (
+            await session.execute(
                 update(DataSyncSchedule)
-                .where(DataSyncSchedule.table_name == table_name)
+                .where(DataSyncSchedule.table_name == self.table_name)
                 .values(
                     last_sync_status="SUCCESS",
                     last_sync_count=count,
                     last_error_message=None,
-                    updated_at=datetime.now(),
+                    updated_at=func.now(),
                 )
             )
-            await session.execute(stmt)
             await session.commit()
-            logger.info(f"[{table_name}] 동기화 성공: {count}건")
-
-    @staticmethod
-    async def update_sync_failed(table_name: str, error_message: str) -> None:
-        """동기화 실패 상태 업데이트"""
-        async for session in get_session():
-            stmt = (
+        logger.info(f"[{self.table_name}] 동기화 성공: {count}건 (히스토리 ID={self.history_id})")
+
+    async def fail(self, error_message: str) -> None:
+        async with self._lock:
+            session = self._session
+            await session.rollback()
+            if self.history_id is not None:
+                await session.execute(
+                    update(BatchExecutionHistory)
+                    .where(BatchExecutionHistory.id == self.history_id)
+                    .values(
+                        completed_at=func.now(),
+                        duration_seconds=_duration_seconds(),
+                        status="FAILED",
+                        error_message=error_message,
+                    )
+                )
+            await session.execute(
                 update(DataSyncSchedule)
-                .where(DataSyncSchedule.table_name == table_name)
+                .where(DataSyncSchedule.table_name == self.table_name)
                 .values(
                     last_sync_status="FAILED",
                     last_error_message=error_message,
-                    updated_at=datetime.now(),
+                    updated_at=func.now(),
                 )
             )
-            await session.execute(stmt)
             await session.commit()
-            logger.error(f"[{table_name}] 동기화 실패: {error_message}")
+        logger.error(f"[{self.table_name}] 동기화 실패: {error_message} (히스토리 ID={self.history_id})")
 
-    @staticmethod
-    async def is_enabled(table_name: str) -> bool:
-        """스케줄 활성화 여부 확인"""
-        schedule = await ScheduleManager.get_schedule(table_name)
-        return schedule.is_enabled if schedule else False
@@ -1,6 +1,9 @@
 import logging
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+
+from app.config import settings
 
 from app.batch.sync_jobs import (
     run_sync_daily_chart_job,
@@ -8,13 +11,22 @@ from app.batch.sync_jobs import (
     run_sync_weekly_chart_job,
     run_sync_monthly_chart_job,
     run_sync_trading_ranking_job,
+    run_sync_trading_ranking_intraday_job,
     run_sync_investor_daily_trade_job,
 )
 
 logger = logging.getLogger(__name__)
 
 # AsyncIOScheduler 생성
-scheduler = AsyncIOScheduler()
+# - max_instances=1: 같은 작업이 이전 실행과 겹치지 않음
+# - coalesce=True: 밀린 실행은 한 번으로 합침
+scheduler = AsyncIOScheduler(
+    job_defaults={
+        "max_instances": 1,
+        "coalesce": True,
+        "misfire_grace_time": settings.BATCH_MISFIRE_GRACE_SECONDS,
+    }
+)
 
 
 def init_scheduler():
@@ -70,6 +82,23 @@ def init_scheduler():
     )
     logger.info("거래대금 순위 동기화 스케줄 등록: 매일 16:10")
 
+    # 장중 거래대금 순위 갱신: 일정 간격 (장 운영 시간 여부는 작업에서 확인)
+    if settings.TRADING_INTRADAY_ENABLED:
+        interval = settings.TRADING_INTRADAY_INTERVAL_SECONDS
+        scheduler.add_job(
+            run_sync_trading_ranking_intraday_job,
+            trigger=IntervalTrigger(seconds=interval),
+            id="sync_trading_ranking_intraday",
+            name="장중 거래대금 순위 갱신",
+            replace_existing=True,
+            # 밀린 틱은 다음 틱으로 대신함
+            misfire_grace_time=interval,
+        )
+        logger.info(
+            f"장중 거래대금 순위 갱신 스케줄 등록: {interval}초 간격 "
+            f"(평일 {settings.TRADING_INTRADAY_START}~{settings.TRADING_INTRADAY_END})"
+        )
+
     # 투자자별 일별 매매 동기화: 매일 오후 5시 (장 마감 후, 데이터 집계 완료 시점)
     scheduler.add_job(
         run_sync_investor_daily_trade_job,
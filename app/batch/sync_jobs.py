@@ -1,10 +1,13 @@
 """
 배치 작업 Wrapper 함수
 
-APScheduler는 동기 함수만 지원하므로,
-각 Job 클래스를 asyncio.run()으로 실행하는 wrapper 함수를 제공합니다.
+AsyncIOScheduler는 코루틴 함수를 앱의 이벤트 루프에서 그대로 실행하므로,
+각 Job은 새 이벤트 루프를 만들지 않고 전역 DB 엔진 풀과 HTTP 커넥션 풀을 공유합니다.
+동시에 실행되는 배치 수는 BATCH_MAX_CONCURRENT_JOBS로 제한합니다.
 """
 import asyncio
+import logging
+from typing import Dict, Optional, Type
 
 from app.batch.jobs import (
     DailyChartSyncJob,
@@ -12,41 +15,94 @@ from app.batch.jobs import (
     WeeklyChartSyncJob,
     MonthlyChartSyncJob,
     TradingRankingSyncJob,
+    TradingRankingIntradayJob,
     InvestorDailyTradeSyncJob,
 )
+from app.batch.jobs.base_sync_job import BaseSyncJob
+from app.config import settings
 
+logger = logging.getLogger(__name__)
 
-def run_sync_daily_chart_job():
+_job_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def _get_job_semaphore() -> asyncio.Semaphore:
+    global _job_semaphore
+    if _job_semaphore is None:
+        _job_semaphore = asyncio.Semaphore(settings.BATCH_MAX_CONCURRENT_JOBS)
+    return _job_semaphore
+
+
+async def _run_job(job: BaseSyncJob, resume: bool = True, retry_failed: bool = False) -> None:
+    """동시 실행 한도 안에서 배치 작업 실행"""
+    semaphore = _get_job_semaphore()
+    if semaphore.locked():
+        logger.info(f"[{job.table_name}] 다른 배치 작업 종료 대기 중")
+    async with semaphore:
+        await job.run(resume=resume, retry_failed=retry_failed)
+
+
+# 대상 테이블명 → 작업 클래스 (수동 실행 / 재시도용)
+JOB_CLASSES: Dict[str, Type[BaseSyncJob]] = {
+    "chart_daily": DailyChartSyncJob,
+    "chart_minute": MinuteChartSyncJob,
+    "chart_weekly": WeeklyChartSyncJob,
+    "chart_monthly": MonthlyChartSyncJob,
+    "trading_ranking": TradingRankingSyncJob,
+    "investor_daily_trade": InvestorDailyTradeSyncJob,
+}
+
+
+async def run_job_by_name(
+    table_name: str,
+    resume: bool = True,
+    retry_failed: bool = False,
+    run_key: Optional[str] = None,
+) -> None:
+    """테이블명으로 배치 작업 실행
+
+    - retry_failed: 이전 실행의 실패 항목만
+    - run_key: 체크포인트 작업의 실행 단위(기준일자), 미입력 시 작업 기본값(오늘 기준)
+    """
+    job_class = JOB_CLASSES[table_name]
+    job = job_class(run_key) if run_key and job_class.checkpointed else job_class()
+    await _run_job(job, resume=resume, retry_failed=retry_failed)
+
+
+async def run_sync_daily_chart_job():
     """일봉 차트 동기화 작업 실행"""
-    job = DailyChartSyncJob()
-    asyncio.run(job.run())
+    await _run_job(DailyChartSyncJob())
 
 
-def run_sync_minute_chart_job():
+async def run_sync_minute_chart_job():
     """분봉 차트 동기화 작업 실행"""
-    job = MinuteChartSyncJob()
-    asyncio.run(job.run())
+    await _run_job(MinuteChartSyncJob())
 
 
-def run_sync_weekly_chart_job():
+async def run_sync_weekly_chart_job():
     """주봉 차트 동기화 작업 실행"""
-    job = WeeklyChartSyncJob()
-    asyncio.run(job.run())
+    await _run_job(WeeklyChartSyncJob())
 
 
-def run_sync_monthly_chart_job():
+async def run_sync_monthly_chart_job():
     """월봉 차트 동기화 작업 실행"""
-    job = MonthlyChartSyncJob()
-    asyncio.run(job.run())
+    await _run_job(MonthlyChartSyncJob())
 
 
-def run_sync_trading_ranking_job():
+async def run_sync_trading_ranking_job():
     """거래대금 순위 동기화 작업 실행"""
-    job = TradingRankingSyncJob()
-    asyncio.run(job.run())
+    await _run_job(TradingRankingSyncJob())
+
+
+async def run_sync_trading_ranking_intraday_job():
+    """장중 거래대금 순위 갱신 작업 실행
+
+    API 호출 1회짜리 짧은 작업이라 긴 차트 배치 뒤에서 기다리지 않도록
+    배치 동시 실행 한도(_run_job)를 거치지 않습니다.
+    """
+    await TradingRankingIntradayJob().run()
 
 
-def run_sync_investor_daily_trade_job():
+async def run_sync_investor_daily_trade_job():
     """투자자별 일별 매매 동기화 작업 실행"""
-    job = InvestorDailyTradeSyncJob()
-    asyncio.run(job.run())
+    await _run_job(InvestorDailyTradeSyncJob())
@@ -1,3 +1,8 @@
+from typing import Optional
+
+import httpx
+
+from app.common.http_transport import KiwoomHttpTransport, http_transport
 from app.config import settings
 from app.core.exceptions import KiwoomAPIException
 from app.schemas.stock import (
@@ -9,14 +14,13 @@ from app.core.logger import logger
 
 class KiwoomApiClient:
 
-    def __init__(self):
+    def __init__(self, transport: Optional[KiwoomHttpTransport] = None):
         self.base_url = settings.KIWOOM_BASE_URL
+        self.transport = transport or http_transport
 
 
     # 종목 정보 리스트
     async def get_stock_llist(self, auth_headers: dict, mrkt_tp: str) -> list[StockItem]:
-        import httpx
-
         headers = {
             "Content-Type": "application/json;charset=UTF-8",
             "authorization": f"Bearer {auth_headers.get('token')}",
@@ -26,20 +30,18 @@ class KiwoomApiClient:
         url = f"{self.base_url}/api/dostk/stkinfo"
         body = {"mrkt_tp": mrkt_tp}
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(url, headers=headers, json=body)
-            response.raise_for_status()
-            result = response.json()
+        response = await self.transport.post(url, headers=headers, json=body)
+        response.raise_for_status()
+        result = response.json()
 
-            raw_list = result.get("list") or []
-            stocks: list[StockItem] = []
-            for item in raw_list:
-                stocks.append(StockItem(**item))
-            return stocks
+        raw_list = result.get("list") or []
+        stocks: list[StockItem] = []
+        for item in raw_list:
+            stocks.append(StockItem(**item))
+        return stocks
 
 
     async def get_stock_trading(self, auth_headers: dict, stock_code: str):
-        import httpx
         url = f"{self.base_url}/api/dostk/frgnistt"
 
         headers = {
@@ -53,27 +55,26 @@ class KiwoomApiClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, headers=headers, json=body)
-                response.raise_for_status()
+            response = await self.transport.post(url, headers=headers, json=body)
+            response.raise_for_status()
 
-                result = response.json()
+            result = response.json()
 
-                if result.get("return_code") == 0:
-                    items = [
-                        ForeignTradingItem(**item)
-                        for item in result.get('stk_frgnr', [])
-                    ]
+            if result.get("return_code") == 0:
+                items = [
+                    ForeignTradingItem(**item)
+                    for item in result.get('stk_frgnr', [])
+                ]
 
-                    trade_response = ForeignTradingResponse(
-                        items=items,
-                        total_count=len(items)
-                    )
+                trade_response = ForeignTradingResponse(
+                    items=items,
+                    total_count=len(items)
+                )
 
-                    logger.info(f"외국인 매매동향 조회 성공: {stock_code}")
-                    return trade_response
-                else:
-                    raise KiwoomAPIException(result.get("return_msg"))
+                logger.info(f"외국인 매매동향 조회 성공: {stock_code}")
+                return trade_response
+            else:
+                raise KiwoomAPIException(result.get("return_msg"))
 
         except httpx.HTTPError as e:
             logger.error(f"API 호출 실패: {str(e)}")
@@ -82,8 +83,6 @@ class KiwoomApiClient:
 
     async def get_execution_info(self, auth_headers: dict, stock_code: str) -> ExecutionInfoResponse:
         '''체결정보요청 (ka10003)'''
-        import httpx
-
         url = f"{self.base_url}/api/dostk/stkinfo"
 
         headers = {
@@ -95,27 +94,26 @@ class KiwoomApiClient:
         body = {"stk_cd": stock_code}
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, headers=headers, json=body)
-                response.raise_for_status()
-                result = response.json()
-
-                if result.get("return_code") == 0:
-                    items = [
-                        ExecutionInfoItem(**item)
-                        for item in result.get('cntr_infr', [])
-                    ]
-
-                    execution_response = ExecutionInfoResponse(
-                        items=items,
-                        return_code=result.get("return_code"),
-                        return_msg=result.get("return_msg")
-                    )
-
-                    logger.info(f"체결정보 조회 성공: {stock_code}")
-                    return execution_response
-                else:
-                    raise KiwoomAPIException(result.get("return_msg"))
+            response = await self.transport.post(url, headers=headers, json=body)
+            response.raise_for_status()
+            result = response.json()
+
+            if result.get("return_code") == 0:
+                items = [
+                    ExecutionInfoItem(**item)
+                    for item in result.get('cntr_infr', [])
+                ]
+
+                execution_response = ExecutionInfoResponse(
+                    items=items,
+                    return_code=result.get("return_code"),
+                    return_msg=result.get("return_msg")
+                )
+
+                logger.info(f"체결정보 조회 성공: {stock_code}")
+                return execution_response
+            else:
+                raise KiwoomAPIException(result.get("return_msg"))
 
         except httpx.HTTPError as e:
             logger.error(f"체결정보 API 호출 실패: {str(e)}")
@@ -124,8 +122,6 @@ class KiwoomApiClient:
 
     async def get_bid_ask(self, auth_headers: dict, stock_code: str) -> BidAskResponse:
         '''주식호가요청 (ka10004)'''
-        import httpx
-
         url = f"{self.base_url}/api/dostk/mrkcond"
 
         headers = {
@@ -137,25 +133,24 @@ class KiwoomApiClient:
         body = {"stk_cd": stock_code}
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, headers=headers, json=body)
-                response.raise_for_status()
-                result = response.json()
-
-                if result.get("return_code") == 0:
-                    bid_ask_data = result.get('bid_req', {}) if result.get('bid_req') else None
-                    data = BidAskItem(**bid_ask_data) if bid_ask_data else None
-
-                    bid_ask_response = BidAskResponse(
-                        data=data,
-                        return_code=result.get("return_code"),
-                        return_msg=result.get("return_msg")
-                    )
-
-                    logger.info(f"호가정보 조회 성공: {stock_code}")
-                    return bid_ask_response
-                else:
-                    raise KiwoomAPIException(result.get("return_msg"))
+            response = await self.transport.post(url, headers=headers, json=body)
+            response.raise_for_status()
+            result = response.json()
+
+            if result.get("return_code") == 0:
+                bid_ask_data = result.get('bid_req', {}) if result.get('bid_req') else None
+                data = BidAskItem(**bid_ask_data) if bid_ask_data else None
+
+                bid_ask_response = BidAskResponse(
+                    data=data,
+                    return_code=result.get("return_code"),
+                    return_msg=result.get("return_msg")
+                )
+
+                logger.info(f"호가정보 조회 성공: {stock_code}")
+                return bid_ask_response
+            else:
+                raise KiwoomAPIException(result.get("return_msg"))
 
         except httpx.HTTPError as e:
             logger.error(f"호가정보 API 호출 실패: {str(e)}")
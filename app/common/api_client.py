@@ -3,22 +3,34 @@ from typing import Dict, Any, Optional
 from typing import Type, TypeVar
 from pydantic import BaseModel
 
+from app.common.http_transport import KiwoomHttpTransport, http_transport
+
 T = TypeVar("T", bound=BaseModel)
 
+
+class ApiHttpError(RuntimeError):
+    '''HTTP 오류 응답 (상태 코드 보존)'''
+    def __init__(self, status_code: int, text: str):
+        self.status_code = status_code
+        super().__init__(f"HTTP {status_code}: {text}")
+
+
 class ApiClient:
     def __init__(
         self,
         base_url: str,
         default_headers: Optional[Dict[str, str]] = None,
         timeout: float = 5.0,
+        transport: Optional[KiwoomHttpTransport] = None,
     ):
         self.base_url = base_url.rstrip("/")
         self.default_headers = default_headers or {}
-        self.client = httpx.AsyncClient(
-            base_url=self.base_url,
-            headers=self.default_headers,
-            timeout=timeout,
-        )
+        self.timeout = timeout
+        # 커넥션 풀은 앱 전역에서 공유하므로 ApiClient가 직접 닫지 않는다
+        self.transport = transport or http_transport
+
+    def _build_headers(self, headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+        return {**self.default_headers, **(headers or {})}
 
     async def _request(
         self,
@@ -30,36 +42,38 @@ class ApiClient:
         headers: Optional[Dict[str, str]] = None,
     ) -> T:
         try:
-            response = await self.client.request(
-                method=method,
-                url=path,
+            response = await self.transport.request(
+                method,
+                f"{self.base_url}{path}",
                 params=params,
                 json=json,
-                headers=headers,
+                headers=self._build_headers(headers),
+                timeout=self.timeout,
             )
             response.raise_for_status()
             return response_model.model_validate(response.json())
 
         except httpx.HTTPStatusError as e:
-            raise RuntimeError(
-                f"HTTP {e.response.status_code}: {e.response.text}"
-            ) from e
+            raise ApiHttpError(e.response.status_code, e.response.text) from e
 
         except httpx.RequestError as e:
             raise RuntimeError(f"Request failed: {str(e)}") from e
 
-    def request_list(
+    async def request_list(
         self,
         method: str,
         path: str,
         response_model: Type[T],
         params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
     ) -> list[T]:
         try:
-            response = self.client.request(
-                method=method,
-                url=path,
+            response = await self.transport.request(
+                method,
+                f"{self.base_url}{path}",
                 params=params,
+                headers=self._build_headers(headers),
+                timeout=self.timeout,
             )
             response.raise_for_status()
             return [
@@ -68,9 +82,4 @@ class ApiClient:
             ]
 
         except httpx.HTTPStatusError as e:
-            raise RuntimeError(
-                f"HTTP {e.response.status_code}: {e.response.text}"
-            ) from e
-
-    def close(self):
-        self.client.close()
\ No newline at end of file
+            raise ApiHttpError(e.response.status_code, e.response.text) from e
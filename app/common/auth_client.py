@@ -1,18 +1,60 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Optional, TypeVar
+
 import httpx
 
+from app.common.http_transport import KiwoomHttpTransport, http_transport
+from app.common.token_store import StoredToken, TokenStore, create_token_store
 from app.config import settings
 from app.core.exceptions import AuthenticationException
 from app.core.logger import logger
 
+T = TypeVar("T")
+
+
+def parse_expires_dt(expires_dt: Optional[str]) -> Optional[datetime]:
+    '''키움 토큰 만료일시(YYYYMMDDHHMMSS) 파싱'''
+    if not expires_dt:
+        return None
+    try:
+        return datetime.strptime(expires_dt, "%Y%m%d%H%M%S")
+    except ValueError:
+        logger.warning(f"토큰 만료일시 형식 오류: {expires_dt}")
+        return None
+
+
+def is_unauthorized(error: Exception) -> bool:
+    '''키움 API 401 응답 여부'''
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code == 401
+    return getattr(error, "status_code", None) == 401
+
 
 class AuthClient:
-    def __init__(self):
+    '''키움 접근 토큰 제공자
+
+    프로세스 안에서는 auth_client 싱글톤 하나를 공유하고,
+    프로세스 간에는 TokenStore(TOKEN_STORE 설정)를 통해 같은 토큰을 재사용합니다.
+    '''
+
+    def __init__(
+        self,
+        transport: Optional[KiwoomHttpTransport] = None,
+        token_store: Optional[TokenStore] = None,
+    ):
         self.base_url = settings.KIWOOM_BASE_URL
+        self.transport = transport or http_transport
         self.appkey = settings.KIWOOM_APPKEY
         self.secretkey = settings.KIWOOM_SECRETKEY
         self._token = None
         self._expires_dt = None
-
+        self._expires_at: Optional[datetime] = None
+        # 진행 중인 토큰 발급 (동시 호출자는 이 작업 하나를 함께 기다린다)
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.token_store = token_store or create_token_store()
+        # 서버가 401로 거부한 토큰 (저장소에 남아 있어도 다시 쓰지 않는다)
+        self._rejected_token: Optional[str] = None
 
     @property
     def token(self) -> str:
@@ -34,25 +76,24 @@ class AuthClient:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, headers=headers, json=data)
-                response.raise_for_status()
+            response = await self.transport.post(url, headers=headers, json=data)
+            response.raise_for_status()
 
-                result = response.json()
+            result = response.json()
 
-                if result.get("return_code") == 0:
-                    self._token = result.get("token")
-                    self._expires_dt = result.get("expires_dt")
+            if result.get("return_code") == 0:
+                self._set_token(result.get("token"), result.get("expires_dt"))
+                await self.token_store.save(StoredToken(self._token, self._expires_dt))
 
-                    logger.info(f"토큰 발급 성공: {self._expires_dt}까지 유효")
+                logger.info(f"토큰 발급 성공: {self._expires_dt}까지 유효")
 
-                    return {
-                        "token": self._token,
-                        "expires_dt": self._expires_dt,
-                        "token_type": result.get("token_type")
-                    }
-                else:
-                    raise AuthenticationException(result.get("return_msg"))
+                return {
+                    "token": self._token,
+                    "expires_dt": self._expires_dt,
+                    "token_type": result.get("token_type")
+                }
+            else:
+                raise AuthenticationException(result.get("return_msg"))
 
         except httpx.HTTPError as e:
             logger.error(f"토큰 발급 실패: {str(e)}")
@@ -77,25 +118,107 @@ class AuthClient:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, headers=headers, json=data)
-                response.raise_for_status()
+            response = await self.transport.post(url, headers=headers, json=data)
+            response.raise_for_status()
 
-                result = response.json()
+            result = response.json()
 
-                self._token = None
-                self._expires_dt = None
+            await self.token_store.clear(self._token)
+            self._set_token(None, None)
 
-                logger.info("토큰 폐기 성공")
+            logger.info("토큰 폐기 성공")
 
-                return {"message": result.get("return_msg", "토큰이 폐기되었습니다")}
+            return {"message": result.get("return_msg", "토큰이 폐기되었습니다")}
 
         except httpx.HTTPError as e:
             logger.error(f"토큰 폐기 실패: {str(e)}")
             raise AuthenticationException(f"토큰 폐기 실패: {str(e)}")
 
-    async def ensure_token(self):
-        '''토큰이 없으면 자동 발급'''
-        if not self._token:
+    def _set_token(self, token: Optional[str], expires_dt: Optional[str]) -> None:
+        self._token = token
+        self._expires_dt = expires_dt
+        self._expires_at = parse_expires_dt(expires_dt)
+
+    @staticmethod
+    def _remaining_of(token: Optional[str], expires_at: Optional[datetime]) -> Optional[timedelta]:
+        if not token:
+            return None
+        if expires_at is None:
+            # 만료일시를 알 수 없으면 401을 받을 때까지 유효한 것으로 본다
+            return timedelta.max
+        return expires_at - datetime.now()
+
+    def _remaining(self) -> Optional[timedelta]:
+        return self._remaining_of(self._token, self._expires_at)
+
+    async def _refresh_token(self) -> None:
+        '''공유 저장소를 먼저 확인하고, 쓸 만한 토큰이 없을 때만 새로 발급
+
+        프로세스 간 잠금 안에서 수행하므로 여러 워커가 동시에 만료를 감지해도 한 곳에서만 발급한다.
+        '''
+        async with self.token_store.lock():
+            stored = await self.token_store.load()
+            # 빈 토큰이 저장돼 있으면 쓸 수 없는 토큰으로 보고 바로 발급
+            if stored and stored.token and stored.token != self._rejected_token:
+                remaining = self._remaining_of(stored.token, parse_expires_dt(stored.expires_dt))
+                # 다른 프로세스가 이미 갱신한 토큰이면 그대로 사용
+                if stored.token != self._token and remaining > timedelta(seconds=settings.TOKEN_REFRESH_MARGIN_SECONDS):
+                    self._set_token(stored.token, stored.expires_dt)
+                    return
+                # 이 프로세스에 토큰이 없으면 만료 직전만 아니면 우선 사용 (곧 백그라운드 갱신)
+                if self._token is None and remaining > timedelta(seconds=settings.TOKEN_EXPIRY_SAFETY_SECONDS):
+                    self._set_token(stored.token, stored.expires_dt)
+                    return
             await self.get_token()
+
+    def _start_refresh(self) -> asyncio.Task:
+        '''토큰 발급 작업 시작 (이미 진행 중이면 그 작업을 반환)'''
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_token())
+            self._refresh_task.add_done_callback(self._log_refresh_failure)
+        return self._refresh_task
+
+    @staticmethod
+    def _log_refresh_failure(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"토큰 갱신 실패: {task.exception()}")
+
+    async def ensure_token(self):
+        '''유효한 토큰 반환
+
+        - 토큰이 없거나 만료 임박(TOKEN_EXPIRY_SAFETY_SECONDS 이내)이면 발급을 기다린다.
+        - 만료까지 TOKEN_REFRESH_MARGIN_SECONDS 이내면 현재 토큰을 반환하고 백그라운드에서 미리 갱신한다.
+        - 동시에 들어온 호출자는 진행 중인 발급 하나를 함께 기다린다 (single-flight).
+        '''
+        remaining = self._remaining()
+
+        if remaining is None or remaining <= timedelta(seconds=settings.TOKEN_EXPIRY_SAFETY_SECONDS):
+            await asyncio.shield(self._start_refresh())
+            return self._token
+
+        if remaining <= timedelta(seconds=settings.TOKEN_REFRESH_MARGIN_SECONDS):
+            self._start_refresh()
+
         return self._token
+
+    async def invalidate_token(self, token: str) -> None:
+        '''서버가 거부한 토큰을 버린다 (그 사이 이미 교체됐다면 유지)'''
+        self._rejected_token = token
+        if self._token == token:
+            self._set_token(None, None)
+
+    async def call_with_token(self, call: Callable[[str], Awaitable[T]]) -> T:
+        '''토큰으로 API 호출, 401이면 한 번 재발급 후 재시도'''
+        token = await self.ensure_token()
+        try:
+            return await call(token)
+        except Exception as e:
+            if not is_unauthorized(e):
+                raise
+            logger.info("401 응답으로 토큰 재발급 후 재시도")
+            await self.invalidate_token(token)
+            return await call(await self.ensure_token())
+
+
+# 싱글톤 인스턴스 (Container, 레거시 서비스, 배치가 모두 공유)
+auth_client = AuthClient()
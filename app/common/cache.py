@@ -0,0 +1,135 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+
+from app.config import settings
+
+_MISSING = object()
+
+
+class TTLCache:
+    """프로세스 내 TTL + LRU 캐시
+
+    - 최대 maxsize개를 보관하며, 넘치면 가장 오래 사용하지 않은 항목부터 제거합니다.
+    - 항목은 ttl초가 지나면 만료됩니다.
+    - 키는 튜플이며, 앞 group_size개 요소(예: (타임프레임, 종목코드))를 그룹으로 묶어
+      invalidate_group()으로 한 번에 무효화할 수 있습니다.
+    조회 중에 무효화가 일어난 경우 오래된 값이 다시 저장되지 않도록,
+    조회 전에 generation()을 읽어 set()에 넘기면 그 사이 무효화된 그룹은 저장을 건너뜁니다.
+    단일 이벤트 루프에서만 사용하므로 별도 락은 두지 않습니다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, group_size: int = 2):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.group_size = group_size
+        self._data: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._groups: Dict[Tuple, Set[Tuple]] = {}
+        self._generations: Dict[Tuple, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _group_of(self, key: Tuple) -> Tuple:
+        return key[:self.group_size]
+
+    def _remove(self, key: Tuple) -> None:
+        self._data.pop(key, None)
+        group = self._group_of(key)
+        members = self._groups.get(group)
+        if members is not None:
+            members.discard(key)
+            if not members:
+                del self._groups[group]
+
+    def get(self, key: Tuple, default: Any = None) -> Any:
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def generation(self, key: Tuple) -> int:
+        """키가 속한 그룹의 무효화 세대 번호"""
+        return self._generations.get(self._group_of(key), 0)
+
+    def set(
+        self,
+        key: Tuple,
+        value: Any,
+        ttl: Optional[float] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        if self.maxsize <= 0:
+            return
+        if generation is not None and generation != self.generation(key):
+            return
+        if key in self._data:
+            self._data.move_to_end(key)
+        self._data[key] = (time.monotonic() + (ttl if ttl is not None else self.ttl), value)
+        self._groups.setdefault(self._group_of(key), set()).add(key)
+
+        while len(self._data) > self.maxsize:
+            oldest = next(iter(self._data))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def invalidate_group(self, *group: Hashable) -> int:
+        """그룹(키의 앞부분)에 속한 항목 전체 삭제"""
+        group = tuple(group)
+        self._generations[group] = self._generations.get(group, 0) + 1
+        keys = self._groups.pop(group, set())
+        for key in keys:
+            self._data.pop(key, None)
+        self.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        for group in self._groups:
+            self._generations[group] = self._generations.get(group, 0) + 1
+        self._data.clear()
+        self._groups.clear()
+
+    def stats(self) -> dict:
+        requests = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / requests, 4) if requests else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+# DB 차트 조회 캐시 (키: (타임프레임, 종목코드, 조회 범위...))
+chart_cache = TTLCache(
+    maxsize=settings.CHART_CACHE_MAXSIZE,
+    ttl=settings.CHART_CACHE_TTL_SECONDS,
+)
+
+# 종목 리스트 전체 건수 캐시 (키: ("stocks", 시장구분, 시작일, 종료일), 동기화 시 그룹 무효화)
+stock_count_cache = TTLCache(
+    maxsize=256,
+    ttl=settings.STOCK_COUNT_CACHE_TTL_SECONDS,
+    group_size=1,
+)
+
+# 거래 정보 건수 캐시
+# 키: ("ranking", 거래일자) / ("history", 종목코드, 시작일, 종료일), 동기화 시 해당 그룹만 무효화
+trading_count_cache = TTLCache(
+    maxsize=4096,
+    ttl=settings.TRADING_COUNT_CACHE_TTL_SECONDS,
+)
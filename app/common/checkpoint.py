@@ -0,0 +1,23 @@
+from typing import Dict, List, Optional, Protocol
+
+
+class BatchCheckpoint(Protocol):
+    """배치 항목(종목 등)별 진행 체크포인트
+
+    도메인 서비스는 이 인터페이스만 알고, 저장 방식은 배치 계층(app.batch.checkpoint)이 구현합니다.
+    """
+
+    async def plan(self, item_keys: List[str]) -> Dict[str, Optional[str]]:
+        """이번 실행에서 처리할 항목 → 이어서 조회할 next-key (처음부터면 None)
+
+        이미 완료된 항목은 제외하며, 실패 항목 재시도 모드면 실패 항목만 반환한다.
+        """
+
+    async def save_page(self, item_key: str, page_key: Optional[str]) -> None:
+        """항목의 저장 완료된 마지막 페이지 기록 (page_key: 다음 페이지 next-key)"""
+
+    async def mark_done(self, item_key: str, record_count: int) -> None:
+        """항목 완료 기록"""
+
+    async def mark_failed(self, item_key: str, error_message: str) -> None:
+        """항목 실패 기록"""
@@ -0,0 +1,21 @@
+import base64
+import json
+from typing import Any, Dict
+
+
+def encode_cursor(payload: Dict[str, Any]) -> str:
+    """키셋 페이지네이션 커서 인코딩 (클라이언트에는 불투명한 문자열)"""
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False, default=str)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """커서 디코딩, 형식이 잘못되면 ValueError"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+    if not isinstance(payload, dict):
+        raise ValueError(f"잘못된 커서입니다: {cursor}")
+    return payload
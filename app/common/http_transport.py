@@ -0,0 +1,175 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Set
+
+import httpx
+
+from app.common.metrics import observe_kiwoom_call
+from app.common.progress import current_progress
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class KiwoomHttpTransport:
+    """키움 API 공용 HTTP 커넥션 풀
+
+    모든 키움 클라이언트가 하나의 httpx.AsyncClient를 공유하여
+    요청마다 TCP/TLS 핸드셰이크가 발생하지 않도록 keep-alive 커넥션을 재사용합니다.
+    클라이언트는 첫 요청 시점의 이벤트 루프에서 생성되며, 앱 종료 시 aclose()로 정리합니다.
+    """
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        timeout: Optional[float] = None,
+        http2: Optional[bool] = None,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS if max_connections is None else max_connections,
+            max_keepalive_connections=(
+                settings.HTTP_MAX_KEEPALIVE_CONNECTIONS
+                if max_keepalive_connections is None else max_keepalive_connections
+            ),
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY if keepalive_expiry is None else keepalive_expiry,
+        )
+        self.timeout = settings.HTTP_TIMEOUT if timeout is None else timeout
+        self.http2 = settings.HTTP2_ENABLED if http2 is None else http2
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._request_count = 0
+        self._in_flight = 0
+        # 루프 변경으로 교체된 클라이언트를 닫는 태스크 (GC로 사라지지 않도록 보관)
+        self._closing: Set[asyncio.Task] = set()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """현재 이벤트 루프에 바인딩된 공용 클라이언트 반환 (지연 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            # 커넥션은 생성된 이벤트 루프에 묶이므로 루프가 바뀌면 이전 풀을 닫고 새 풀을 만든다
+            if self._client is not None and not self._client.is_closed:
+                self._discard(self._client, self._loop)
+            self._client = self._create_client()
+            self._loop = loop
+        return self._client
+
+    def _discard(self, client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """이전 이벤트 루프의 클라이언트 종료
+
+        이전 루프가 (다른 스레드에서) 아직 돌고 있으면 그 루프에서 닫고,
+        이미 멈춘 루프면 현재 루프에서 닫기를 시도한다.
+        """
+        if loop is not None and loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(self._close_quietly(client), loop)
+            return
+        task = asyncio.get_running_loop().create_task(self._close_quietly(client))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close_quietly(client: httpx.AsyncClient) -> None:
+        try:
+            await client.aclose()
+        except Exception as e:
+            # 닫힌 루프에 묶인 소켓은 정리 중 오류가 날 수 있으나 풀은 더 이상 쓰지 않는다
+            logger.debug(f"이전 HTTP 커넥션 풀 종료 중 오류: {e}")
+
+    def _create_client(self) -> httpx.AsyncClient:
+        http2 = self.http2
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning("h2 패키지가 없어 HTTP/1.1로 동작합니다 (pip install httpx[http2])")
+                http2 = False
+
+        logger.info(
+            f"HTTP 커넥션 풀 생성: max_connections={self.limits.max_connections}, "
+            f"max_keepalive={self.limits.max_keepalive_connections}, http2={http2}"
+        )
+        return httpx.AsyncClient(
+            limits=self.limits,
+            timeout=self.timeout,
+            http2=http2,
+        )
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """공용 풀을 통해 요청 전송"""
+        client = self.client
+        self._request_count += 1
+        self._in_flight += 1
+        started = time.perf_counter()
+        ok = False
+        try:
+            response = await client.request(method, url, **kwargs)
+            ok = response.status_code < 400
+            return response
+        finally:
+            self._in_flight -= 1
+            elapsed = time.perf_counter() - started
+            # api-id 헤더가 없는 호출(토큰 발급/폐기)은 경로 마지막 부분으로 구분
+            api_id = (kwargs.get("headers") or {}).get("api-id") or url.rsplit("/", 1)[-1]
+            observe_kiwoom_call(api_id, elapsed, ok)
+            # 배치 작업 안에서 호출된 경우 작업 진행 지표에 지연 시간 기록
+            progress = current_progress.get()
+            if progress is not None:
+                progress.observe_api(elapsed, ok)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def aclose(self) -> None:
+        """커넥션 풀 종료 (앱 shutdown 시 호출)"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+            logger.info("HTTP 커넥션 풀 종료됨")
+        self._client = None
+        self._loop = None
+
+    def _pool_connections(self) -> Optional[List[Any]]:
+        """풀의 커넥션 목록
+
+        httpx 공개 API에는 풀 상태 조회가 없어 내부 속성(_transport._pool)을 읽는다.
+        httpx 버전에 따라 구조가 다르면 None을 반환한다 (커넥션 지표만 생략).
+        """
+        client = self._client
+        if client is None or client.is_closed:
+            return []
+        try:
+            pool = getattr(getattr(client, "_transport", None), "_pool", None)
+            return None if pool is None else list(pool.connections)
+        except Exception:
+            return None
+
+    def stats(self) -> Dict[str, Any]:
+        """커넥션 풀 상태 반환 (커넥션 수를 읽을 수 없으면 해당 항목은 None)"""
+        connections = self._pool_connections()
+        open_count = idle = active = None
+        if connections is not None:
+            try:
+                idle = sum(1 for conn in connections if conn.is_idle())
+                open_count = len(connections)
+                active = open_count - idle
+            except Exception:
+                idle = None
+
+        return {
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "keepalive_expiry": self.limits.keepalive_expiry,
+            "open_connections": open_count,
+            "idle_connections": idle,
+            "active_connections": active,
+            "in_flight_requests": self._in_flight,
+            "total_requests": self._request_count,
+        }
+
+
+# 싱글톤 인스턴스
+http_transport = KiwoomHttpTransport()
@@ -0,0 +1,176 @@
+import functools
+import inspect
+import time
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Histogram, generate_latest
+from prometheus_client.core import GaugeMetricFamily
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# 수 ms ~ 수십 초 구간 (키움 API, 배치성 DB 쓰기 포함)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "FastAPI 라우트 응답 시간",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+
+KIWOOM_CALL_SECONDS = Histogram(
+    "kiwoom_api_call_duration_seconds",
+    "키움 API 호출 시간 (api-id별)",
+    ["api_id", "outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+
+DB_STATEMENT_SECONDS = Histogram(
+    "db_statement_duration_seconds",
+    "SQL 문 실행 시간 (문 종류별)",
+    ["statement"],
+    buckets=LATENCY_BUCKETS,
+)
+
+DB_REPOSITORY_SECONDS = Histogram(
+    "db_repository_call_duration_seconds",
+    "DB 리포지토리 메서드 실행 시간",
+    ["repository", "method", "outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+
+
+def render_latest() -> tuple:
+    """(본문, Content-Type) 반환 (/metrics 응답용)"""
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+# ── Kiwoom API ────────────────────────────────────────────────────────────────
+
+def observe_kiwoom_call(api_id: Optional[str], seconds: float, ok: bool) -> None:
+    KIWOOM_CALL_SECONDS.labels(api_id or "unknown", "ok" if ok else "error").observe(seconds)
+
+
+# ── FastAPI (ASGI 미들웨어) ──────────────────────────────────────────────────
+
+class PrometheusMiddleware:
+    """라우트 템플릿(/chart/day/{stk_cd} 등) 단위로 응답 시간을 기록하는 ASGI 미들웨어
+
+    경로 값 대신 라우트 템플릿을 레이블로 써서 시계열 수가 종목 수만큼 늘어나지 않게 합니다.
+    SSE 등 스트리밍 응답은 본문 전송이 끝날 때까지의 시간이 기록됩니다.
+    """
+
+    def __init__(self, app, excluded_paths: tuple = ("/metrics",)):
+        self.app = app
+        self.excluded_paths = excluded_paths
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            HTTP_REQUEST_SECONDS.labels(
+                scope["method"],
+                getattr(route, "path", "unmatched"),
+                str(status),
+            ).observe(time.perf_counter() - started)
+
+
+# ── SQLAlchemy ────────────────────────────────────────────────────────────────
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """커서 실행 이벤트로 SQL 문 실행 시간 기록"""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("metrics_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["metrics_started"].pop()
+        verb = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "UNKNOWN"
+        DB_STATEMENT_SECONDS.labels(verb).observe(time.perf_counter() - started)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("metrics_started"):
+            conn.info["metrics_started"].pop()
+
+
+def instrument_repository(cls):
+    """리포지토리 클래스의 공개 async 메서드 실행 시간 기록 (클래스 데코레이터)"""
+    for name, method in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.iscoroutinefunction(method):
+            continue
+        setattr(cls, name, _timed(cls.__name__, name, method))
+    return cls
+
+
+def _timed(repository: str, name: str, method: Callable) -> Callable:
+    ok_metric = DB_REPOSITORY_SECONDS.labels(repository, name, "ok")
+    error_metric = DB_REPOSITORY_SECONDS.labels(repository, name, "error")
+
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            result = await method(*args, **kwargs)
+        except Exception:
+            error_metric.observe(time.perf_counter() - started)
+            raise
+        ok_metric.observe(time.perf_counter() - started)
+        return result
+
+    return wrapper
+
+
+# ── 커넥션 풀 게이지 ──────────────────────────────────────────────────────────
+
+class PoolCollector:
+    """스크레이프 시점의 DB/HTTP 커넥션 풀 사용량"""
+
+    def __init__(self, engine: AsyncEngine, http_stats: Callable[[], Dict[str, Any]]):
+        self.pool = engine.sync_engine.pool
+        self.http_stats = http_stats
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        pool = self.pool
+        db = GaugeMetricFamily("db_pool_connections", "SQLAlchemy 커넥션 풀 상태", labels=["state"])
+        for state in ("size", "checkedin", "checkedout", "overflow"):
+            reader = getattr(pool, state, None)
+            if reader is not None:
+                db.add_metric([state], reader())
+        yield db
+
+        stats = self.http_stats()
+        http = GaugeMetricFamily("kiwoom_http_pool_connections", "키움 API HTTP 커넥션 풀 상태", labels=["state"])
+        for state, key in (
+            ("max", "max_connections"),
+            ("open", "open_connections"),
+            ("idle", "idle_connections"),
+            ("active", "active_connections"),
+            ("in_flight_requests", "in_flight_requests"),
+        ):
+            # httpx 내부 구조를 읽지 못한 항목(None)은 생략
+            if stats[key] is not None:
+                http.add_metric([state], stats[key])
+        yield http
+
+
+def register_pool_collector(engine: AsyncEngine, http_stats: Callable[[], Dict[str, Any]]) -> None:
+    REGISTRY.register(PoolCollector(engine, http_stats))
@@ -0,0 +1,73 @@
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, Optional, Protocol, TypeVar
+
+
+class ContinuationPage(Protocol):
+    """키움 연속조회 응답 (cont-yn / next-key 헤더를 담은 응답 DTO)"""
+    cont_yn: Optional[str]
+    next_key: Optional[str]
+
+
+P = TypeVar("P", bound=ContinuationPage)
+
+FetchPage = Callable[[Optional[str], Optional[str]], Awaitable[P]]
+
+
+def has_next_page(page: ContinuationPage) -> bool:
+    return page.cont_yn == "Y" and bool(page.next_key)
+
+
+async def paginate(
+    fetch_page: FetchPage,
+    max_pages: Optional[int] = None,
+    stop_when: Optional[Callable[[P], bool]] = None,
+    prefetch: bool = True,
+    start_key: Optional[str] = None,
+) -> AsyncIterator[P]:
+    """키움 연속조회를 페이지 단위로 지연 순회하는 비동기 제너레이터
+
+    fetch_page(cont_yn, next_key)로 첫 페이지부터 cont-yn이 Y가 아닐 때까지 조회합니다.
+    - start_key: 이전 실행이 저장해 둔 next-key부터 이어서 조회 (중단된 배치 재개용)
+    - max_pages: 최대 조회 페이지 수
+    - stop_when: 페이지를 받은 뒤 True를 반환하면 해당 페이지까지만 넘기고 중단 (날짜 컷오프 등)
+    - prefetch: 현재 페이지를 호출자에게 넘기기 전에 다음 페이지 조회를 먼저 시작하여
+      호출자의 처리(DB 저장 등)와 다음 API 호출을 겹치게 합니다.
+
+    호출자가 순회를 중간에 멈추면 미리 시작한 조회 태스크는 취소됩니다.
+    """
+    pending: Optional[asyncio.Task] = None
+    fetched = 0
+
+    try:
+        page = await fetch_page("Y", start_key) if start_key else await fetch_page(None, None)
+        fetched += 1
+
+        while True:
+            more = (
+                has_next_page(page)
+                and (max_pages is None or fetched < max_pages)
+                and not (stop_when and stop_when(page))
+            )
+
+            if more and prefetch:
+                pending = asyncio.create_task(fetch_page("Y", page.next_key))
+
+            yield page
+
+            if not more:
+                return
+
+            if pending is not None:
+                page = await pending
+                pending = None
+            else:
+                page = await fetch_page("Y", page.next_key)
+            fetched += 1
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+            try:
+                await pending
+            except (asyncio.CancelledError, Exception):
+                pass
+
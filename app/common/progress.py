@@ -0,0 +1,138 @@
+import time
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+def _percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class JobProgress:
+    """실행 중인 배치 작업의 진행 지표 (프로세스 메모리)
+
+    - 항목(종목 등) 처리 수/전체 수, 저장 건수, 실패 수
+    - 키움 API 호출 지연 시간(최근 latency_window개)과 오류 수
+    스냅샷에서 처리량(초당)과 남은 시간(ETA)을 계산합니다.
+    단일 이벤트 루프에서만 갱신하므로 별도 락은 두지 않습니다.
+    """
+
+    def __init__(self, name: str, run_key: Optional[str] = None, latency_window: int = 1024):
+        self.name = name
+        self.run_key = run_key
+        self.status = "RUNNING"
+        self.started_at = datetime.now()
+        self.finished_at: Optional[datetime] = None
+        self._started = time.monotonic()
+        self._finished: Optional[float] = None
+
+        self.total: Optional[int] = None
+        self.done = 0
+        self.failed = 0
+        self.skipped = 0
+        self.record_count = 0
+
+        self.api_calls = 0
+        self.api_errors = 0
+        self._latencies: deque = deque(maxlen=latency_window)
+
+    # ── 갱신 ─────────────────────────────────────────────────────────────────
+
+    def set_total(self, total: int, skipped: int = 0) -> None:
+        self.total = total
+        self.skipped = skipped
+
+    def item_done(self, record_count: int = 0) -> None:
+        self.done += 1
+        self.record_count += record_count
+
+    def item_failed(self) -> None:
+        self.failed += 1
+
+    def observe_api(self, seconds: float, ok: bool) -> None:
+        """키움 API 호출 1건의 지연 시간 기록"""
+        self.api_calls += 1
+        self._latencies.append(seconds)
+        if not ok:
+            self.api_errors += 1
+
+    def finish(self, status: str) -> None:
+        self.status = status
+        self.finished_at = datetime.now()
+        self._finished = time.monotonic()
+
+    # ── 조회 ─────────────────────────────────────────────────────────────────
+
+    def snapshot(self) -> Dict[str, Any]:
+        elapsed = (self._finished or time.monotonic()) - self._started
+        processed = self.done + self.failed
+        items_per_sec = processed / elapsed if elapsed > 0 else 0.0
+
+        eta_seconds = None
+        if self.status == "RUNNING" and self.total is not None and items_per_sec > 0:
+            eta_seconds = round(max(self.total - processed, 0) / items_per_sec, 1)
+
+        latencies = sorted(self._latencies)
+
+        def ms(value: Optional[float]) -> Optional[float]:
+            return None if value is None else round(value * 1000, 1)
+
+        return {
+            "name": self.name,
+            "run_key": self.run_key,
+            "status": self.status,
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "finished_at": self.finished_at.isoformat(timespec="seconds") if self.finished_at else None,
+            "elapsed_seconds": round(elapsed, 1),
+            "total": self.total,
+            "done": self.done,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "record_count": self.record_count,
+            "items_per_sec": round(items_per_sec, 3),
+            "records_per_sec": round(self.record_count / elapsed, 1) if elapsed > 0 else 0.0,
+            "eta_seconds": eta_seconds,
+            "api": {
+                "calls": self.api_calls,
+                "errors": self.api_errors,
+                "latency_ms": {
+                    "p50": ms(_percentile(latencies, 0.50)),
+                    "p90": ms(_percentile(latencies, 0.90)),
+                    "p99": ms(_percentile(latencies, 0.99)),
+                    "max": ms(latencies[-1] if latencies else None),
+                },
+            },
+        }
+
+
+class ProgressRegistry:
+    """작업 이름별 최근 진행 상황 보관소 (실행 중 + 마지막 완료 실행)"""
+
+    def __init__(self):
+        self._jobs: Dict[str, JobProgress] = {}
+
+    def start(self, name: str, run_key: Optional[str] = None) -> JobProgress:
+        progress = JobProgress(name, run_key)
+        self._jobs[name] = progress
+        return progress
+
+    def get(self, name: str) -> Optional[JobProgress]:
+        return self._jobs.get(name)
+
+    def snapshots(self, running_only: bool = False) -> List[Dict[str, Any]]:
+        return [
+            progress.snapshot()
+            for progress in self._jobs.values()
+            if not running_only or progress.status == "RUNNING"
+        ]
+
+
+# 현재 실행 컨텍스트의 작업 진행 상황 (작업 안에서 만든 태스크에 그대로 전달됨)
+current_progress: ContextVar[Optional[JobProgress]] = ContextVar("current_progress", default=None)
+
+# 싱글톤 인스턴스
+progress_registry = ProgressRegistry()
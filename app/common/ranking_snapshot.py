@@ -0,0 +1,121 @@
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi.encoders import jsonable_encoder
+
+from app.common.cursor import encode_cursor
+
+LATEST_RANKING_MESSAGE = "최신 거래대금 순위 조회 성공"
+
+
+def _serialize(
+    rankings: List[Dict[str, Any]], trade_date: date, next_cursor: Optional[str], total_count: int
+) -> bytes:
+    """APIResponse 형태의 JSON 바이트 (FastAPI JSONResponse와 같은 인코딩, total_count는 거래일 전체 건수)"""
+    content = {
+        "success": True,
+        "message": LATEST_RANKING_MESSAGE,
+        "data": {
+            "trade_date": trade_date,
+            "rankings": rankings,
+            "total_count": total_count,
+            "next_cursor": next_cursor,
+        },
+        "error": None,
+    }
+    return json.dumps(
+        jsonable_encoder(content),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+@dataclass(frozen=True)
+class RankingSnapshot:
+    """최신 거래대금 순위 스냅샷 (불변)
+
+    동기화 직후 한 번 직렬화해 두고, 조회 요청은 body를 그대로 반환합니다.
+    etag는 본문 해시라 내용이 같으면 재동기화 후에도 바뀌지 않습니다.
+    version은 만들 때 읽은 DB 상태 (거래일자, 최종 수정일시, 건수)로,
+    다른 프로세스가 동기화했는지 확인할 때 비교합니다.
+    """
+    trade_date: date
+    rankings: Tuple[Dict[str, Any], ...]
+    body: bytes
+    etag: str
+    published_at: datetime
+    version: Optional[Tuple[Any, ...]] = None
+
+    @classmethod
+    def build(
+        cls, trade_date: date, rankings: List[Dict[str, Any]], version: Optional[Tuple[Any, ...]] = None
+    ) -> "RankingSnapshot":
+        body = _serialize(rankings, trade_date, None, len(rankings))
+        return cls(
+            trade_date=trade_date,
+            rankings=tuple(rankings),
+            body=body,
+            etag=f'"{hashlib.sha1(body).hexdigest()}"',
+            published_at=datetime.now(),
+            version=version,
+        )
+
+    def page(self, skip: int, limit: int) -> Tuple[bytes, str]:
+        """(본문, ETag) - 전체 범위면 미리 직렬화한 본문, 아니면 메모리에서 잘라 직렬화"""
+        if skip == 0 and limit >= len(self.rankings):
+            return self.body, self.etag
+
+        rows = list(self.rankings[skip:skip + limit])
+        next_cursor = None
+        if rows and skip + limit < len(self.rankings):
+            last = rows[-1]
+            next_cursor = encode_cursor({
+                "d": self.trade_date.isoformat(), "r": last["current_rank"], "id": last["id"]
+            })
+        return _serialize(rows, self.trade_date, next_cursor, len(self.rankings)), f'{self.etag[:-1]}-{skip}-{limit}"'
+
+
+class RankingSnapshotStore:
+    """최신 순위 스냅샷 보관소
+
+    스냅샷 객체 자체를 통째로 교체하므로 조회 중인 요청은 항상 일관된 스냅샷을 봅니다.
+    더 이전 거래일의 동기화(과거 날짜 재수집 등)는 최신 스냅샷을 덮어쓰지 않습니다.
+    프로세스마다 따로 보관하므로, 마지막으로 DB와 비교한 시각을 두고
+    오래되면(is_fresh가 False) 호출자가 DB 버전을 다시 확인합니다.
+    """
+
+    def __init__(self):
+        self._snapshot: Optional[RankingSnapshot] = None
+        self._checked_at = 0.0
+
+    def get(self) -> Optional[RankingSnapshot]:
+        return self._snapshot
+
+    def publish(self, snapshot: RankingSnapshot) -> bool:
+        current = self._snapshot
+        if current is not None and snapshot.trade_date < current.trade_date:
+            return False
+        self._snapshot = snapshot
+        self.mark_checked()
+        return True
+
+    def is_fresh(self, ttl: float) -> bool:
+        """마지막 DB 확인 후 ttl초가 지나지 않았는지"""
+        return time.monotonic() - self._checked_at < ttl
+
+    def mark_checked(self) -> None:
+        self._checked_at = time.monotonic()
+
+    def clear(self) -> None:
+        self._snapshot = None
+        self._checked_at = 0.0
+
+
+# 싱글톤 인스턴스
+ranking_snapshot_store = RankingSnapshotStore()
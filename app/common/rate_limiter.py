@@ -0,0 +1,60 @@
+import asyncio
+import time
+from typing import Optional
+
+from app.config import settings
+
+
+class TokenBucketRateLimiter:
+    """토큰 버킷 방식의 비동기 호출 제한기
+
+    초당 rate개의 토큰이 채워지고 최대 capacity개까지 누적됩니다.
+    acquire()는 토큰이 생길 때까지 대기하며, 대기 순서대로(FIFO) 토큰을 배분합니다.
+    고정 sleep 대신 사용하여 키움 API 초당 호출 한도까지 처리량을 끌어올립니다.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다")
+        self.rate = rate
+        self.capacity = capacity or max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+        return self._lock
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """토큰을 획득할 때까지 대기"""
+        async with self._get_lock():
+            while True:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+# 키움 API 공용 호출 제한기 (앱키 단위 한도이므로 전역에서 하나만 사용)
+kiwoom_rate_limiter = TokenBucketRateLimiter(
+    rate=settings.KIWOOM_RATE_LIMIT_PER_SEC,
+    capacity=settings.KIWOOM_RATE_LIMIT_BURST,
+)
@@ -0,0 +1,208 @@
+import asyncio
+import fcntl
+import json
+import os
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, NamedTuple, Optional
+
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.dialects.mysql import insert
+
+from app.config import settings
+from app.core.logger import logger
+from app.db import AsyncSessionLocal, engine
+from app.models.kiwoom_token import KiwoomToken
+
+
+class StoredToken(NamedTuple):
+    token: str
+    expires_dt: Optional[str]  # YYYYMMDDHHMMSS
+
+
+class TokenStore(ABC):
+    """키움 접근 토큰 저장소
+
+    여러 프로세스(uvicorn 워커, 배치)가 같은 토큰을 재사용하도록 공유합니다.
+    lock()은 프로세스 간 배타 잠금으로, 잠금 안에서 load → (필요 시 발급) → save를 수행하면
+    동시에 여러 프로세스가 토큰을 발급하지 않습니다.
+    """
+
+    @abstractmethod
+    async def load(self) -> Optional[StoredToken]:
+        """저장된 토큰 조회"""
+
+    @abstractmethod
+    async def save(self, token: StoredToken) -> None:
+        """토큰 저장"""
+
+    @abstractmethod
+    async def clear(self, token: str) -> None:
+        """저장된 토큰이 token과 같으면 삭제"""
+
+    @abstractmethod
+    def lock(self):
+        """프로세스 간 발급 잠금 (async context manager)"""
+
+
+class MemoryTokenStore(TokenStore):
+    """프로세스 내 저장소 (단일 프로세스용)"""
+
+    def __init__(self):
+        self._token: Optional[StoredToken] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def load(self) -> Optional[StoredToken]:
+        return self._token
+
+    async def save(self, token: StoredToken) -> None:
+        self._token = token
+
+    async def clear(self, token: str) -> None:
+        if self._token and self._token.token == token:
+            self._token = None
+
+    @asynccontextmanager
+    async def lock(self) -> AsyncIterator[None]:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            yield
+
+
+class FileTokenStore(TokenStore):
+    """로컬 파일 저장소 (같은 호스트의 여러 워커가 공유, flock으로 잠금)
+
+    토큰 파일과 잠금 파일은 소유자만 읽을 수 있게(0600, 디렉터리 0700) 만듭니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+        self.lock_path = f"{self.path}.lock"
+
+    def _ensure_dir(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    def _read(self) -> Optional[StoredToken]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            return StoredToken(token=data["token"], expires_dt=data.get("expires_dt"))
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError) as e:
+            logger.warning(f"토큰 파일을 읽을 수 없습니다: {e}")
+            return None
+
+    def _write(self, token: Optional[StoredToken]) -> None:
+        if token is None:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            return
+        self._ensure_dir()
+        tmp_path = f"{self.path}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        # 이미 있던 임시 파일은 O_CREAT 모드가 적용되지 않으므로 권한을 다시 맞춘다
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(token._asdict(), f)
+        os.replace(tmp_path, self.path)
+
+    async def load(self) -> Optional[StoredToken]:
+        return await asyncio.to_thread(self._read)
+
+    async def save(self, token: StoredToken) -> None:
+        await asyncio.to_thread(self._write, token)
+
+    async def clear(self, token: str) -> None:
+        stored = await self.load()
+        if stored and stored.token == token:
+            await asyncio.to_thread(self._write, None)
+
+    def _acquire(self) -> int:
+        self._ensure_dir()
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        return fd
+
+    @staticmethod
+    def _release(fd: int) -> None:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    @asynccontextmanager
+    async def lock(self) -> AsyncIterator[None]:
+        fd = await asyncio.to_thread(self._acquire)
+        try:
+            yield
+        finally:
+            await asyncio.to_thread(self._release, fd)
+
+
+class MySqlTokenStore(TokenStore):
+    """MySQL 저장소 (여러 호스트 공유, GET_LOCK으로 잠금)"""
+
+    LOCK_NAME = "kiwoom_token_refresh"
+
+    def __init__(self, lock_timeout: int = 30):
+        self.lock_timeout = lock_timeout
+
+    async def load(self) -> Optional[StoredToken]:
+        async with AsyncSessionLocal() as session:
+            row = (
+                await session.execute(
+                    select(KiwoomToken.token, KiwoomToken.expires_dt).where(KiwoomToken.id == 1)
+                )
+            ).first()
+        return StoredToken(token=row.token, expires_dt=row.expires_dt) if row else None
+
+    async def save(self, token: StoredToken) -> None:
+        stmt = insert(KiwoomToken).values(id=1, token=token.token, expires_dt=token.expires_dt)
+        stmt = stmt.on_duplicate_key_update(
+            token=stmt.inserted.token,
+            expires_dt=stmt.inserted.expires_dt,
+            updated_at=func.now(),
+        )
+        async with AsyncSessionLocal() as session:
+            await session.execute(stmt)
+            await session.commit()
+
+    async def clear(self, token: str) -> None:
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                delete(KiwoomToken).where(KiwoomToken.id == 1, KiwoomToken.token == token)
+            )
+            await session.commit()
+
+    @asynccontextmanager
+    async def lock(self) -> AsyncIterator[None]:
+        # GET_LOCK은 커넥션 단위이므로 잠금 ~ 해제까지 같은 커넥션을 유지한다
+        async with engine.connect() as conn:
+            acquired = await conn.scalar(
+                text("SELECT GET_LOCK(:name, :timeout)"),
+                {"name": self.LOCK_NAME, "timeout": self.lock_timeout},
+            )
+            if acquired != 1:
+                raise TimeoutError("토큰 발급 잠금을 얻지 못했습니다")
+            try:
+                yield
+            finally:
+                await conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": self.LOCK_NAME})
+
+
+def create_token_store(kind: Optional[str] = None) -> TokenStore:
+    """설정(TOKEN_STORE)에 따른 저장소 생성: memory | file | mysql"""
+    kind = (kind or settings.TOKEN_STORE).lower()
+    if kind == "file":
+        return FileTokenStore(settings.TOKEN_STORE_PATH)
+    if kind == "mysql":
+        return MySqlTokenStore()
+    if kind == "memory":
+        return MemoryTokenStore()
+    raise ValueError(f"지원하지 않는 TOKEN_STORE: {kind}")
@@ -12,15 +12,69 @@ class Settings(BaseSettings):
     KIWOOM_SECRETKEY: str
     KIWOOM_BASE_URL: str
 
+    # 키움 토큰 갱신
+    TOKEN_REFRESH_MARGIN_SECONDS: int = 600   # 만료 전 이 시간 안에 들어오면 백그라운드 갱신
+    TOKEN_EXPIRY_SAFETY_SECONDS: int = 30     # 만료까지 이보다 적게 남으면 갱신 완료까지 대기
+    TOKEN_STORE: str = "memory"               # 워커 간 토큰 공유: memory | file | mysql (여러 워커면 file/mysql)
+    TOKEN_STORE_PATH: str = "~/.cache/stock-service/kiwoom_token.json"  # file 저장소 경로 (소유자만 읽기, 0600)
+
+    # HTTP 커넥션 풀 (키움 API 공용)
+    HTTP_MAX_CONNECTIONS: int = 50
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP_TIMEOUT: float = 30.0
+    HTTP2_ENABLED: bool = False
+
+    # 키움 API 호출 한도 (토큰 버킷)
+    KIWOOM_RATE_LIMIT_PER_SEC: float = 5.0
+    KIWOOM_RATE_LIMIT_BURST: int = 5
+
+    # 차트 배치 동기화
+    CHART_SYNC_MAX_WORKERS: int = 4
+    CHART_SYNC_QUEUE_SIZE: int = 4          # 조회 → 저장 사이 대기 페이지 수
+    CHART_SYNC_COMMIT_SIZE: int = 2000      # 커밋 단위 봉 개수
+    CHART_UPSERT_CHUNK_SIZE: int = 500      # upsert 한 문장당 봉 개수
+    CHART_UPSERT_EXECUTEMANY: bool = True   # 캐시된 문장 + executemany 사용 여부
+    CHART_BATCH_MAX_PAGES: int = 1          # 워터마크가 없는 종목의 배치 조회 페이지 수 (0이면 전체 이력)
+
+    # 투자자별 일별 매매 동기화 (조합별 동시 조회)
+    INVESTOR_SYNC_CONCURRENCY: int = 8
+    INVESTOR_SYNC_MAX_RETRIES: int = 2
+    INVESTOR_SYNC_RETRY_BACKOFF: float = 1.0
+    INVESTOR_UPSERT_CHUNK_SIZE: int = 1000
+    STOCK_UPSERT_CHUNK_SIZE: int = 1000     # 종목 리스트 upsert 한 문장당 행 수
+
+    # DB 차트 조회 캐시 (TTL + LRU)
+    CHART_CACHE_MAXSIZE: int = 1024
+    CHART_CACHE_TTL_SECONDS: float = 300.0
+    STOCK_COUNT_CACHE_TTL_SECONDS: float = 60.0  # 종목 리스트 전체 건수 캐시 유지 시간
+    TRADING_COUNT_CACHE_TTL_SECONDS: float = 60.0  # 당일 거래대금 순위/히스토리 건수 캐시 (지난 날짜는 만료 없음)
+    TRADING_SNAPSHOT_TTL_SECONDS: float = 5.0  # 최신 순위 스냅샷을 DB 버전과 다시 비교하는 간격 (다중 프로세스)
+
     # 데이터베이스 설정 추가
     DATABASE_URL: str
     DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 10            # 상시 유지 커넥션 수 (배치 쓰기 + API 조회 동시 사용)
+    DB_MAX_OVERFLOW: int = 10         # 풀이 가득 찼을 때 추가로 여는 커넥션 수
+    DB_POOL_TIMEOUT: float = 30.0     # 커넥션 대기 최대 시간(초)
+    DB_POOL_RECYCLE: int = 1800       # 이 시간(초)이 지난 커넥션은 재연결 (MySQL wait_timeout보다 짧게)
+    DB_POOL_PRE_PING: bool = False    # 체크아웃마다 ping (recycle로 충분하면 끔)
 
     # CORS
     CORS_ORIGINS: List[str] = ["http://localhost:3000"]
 
     # Batch Scheduler
     ENABLE_BATCH_SCHEDULER: bool = True
+    BATCH_MAX_CONCURRENT_JOBS: int = 1        # 동시에 실행할 배치 작업 수
+    BATCH_MISFIRE_GRACE_SECONDS: int = 3600   # 대기로 밀린 실행을 허용할 시간
+    BATCH_HEARTBEAT_INTERVAL_SECONDS: float = 30.0  # 진행 건수 기록 최소 간격
+    BATCH_CHECKPOINT_RETENTION_DAYS: int = 7  # 이보다 오래된 체크포인트(미재시도 실패 항목 등) 삭제 (0이면 보존)
+
+    # 장중 거래대금 순위 갱신 (평일 장 운영 시간에만 실행, 바뀐 행만 저장)
+    TRADING_INTRADAY_ENABLED: bool = True
+    TRADING_INTRADAY_INTERVAL_SECONDS: int = 60
+    TRADING_INTRADAY_START: str = "09:00"
+    TRADING_INTRADAY_END: str = "15:30"
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
@@ -4,7 +4,9 @@ from dependency_injector import containers, providers
 from app.domain.rank.rank_client import RankClient
 from app.domain.rank.repositories.rank_repository import RankRepository
 from app.domain.rank.services.rank_service import RankService
-from app.common.auth_client import AuthClient
+from app.common.auth_client import auth_client as shared_auth_client
+from app.common.http_transport import http_transport as shared_http_transport
+from app.common.rate_limiter import kiwoom_rate_limiter
 from app.domain.stock.repositories.stock_client import StockClient
 from app.domain.stock.repositories.stock_api_repository import StockApiRepository
 from app.domain.stock.services.stock_service import StockService
@@ -24,11 +26,18 @@ class Container(containers.DeclarativeContainer):
         ],
     )
 
+    # HTTP 커넥션 풀 (앱 전역 공유 - Container 인스턴스가 여러 개여도 동일 풀 사용)
+    http_transport = providers.Object(shared_http_transport)
+
+    # 키움 API 호출 제한기 (앱키 단위 한도 공유)
+    rate_limiter = providers.Object(kiwoom_rate_limiter)
+
     # Clients (Singleton - 토큰 상태 유지)
-    auth_client = providers.Singleton(AuthClient)
-    rank_client = providers.Singleton(RankClient)
-    stock_client = providers.Singleton(StockClient)
-    chart_client = providers.Singleton(ChartClient)
+    # 키움 토큰 제공자 (앱 전역 공유 - 레거시 AuthService와 같은 인스턴스)
+    auth_client = providers.Object(shared_auth_client)
+    rank_client = providers.Singleton(RankClient, transport=http_transport)
+    stock_client = providers.Singleton(StockClient, transport=http_transport)
+    chart_client = providers.Singleton(ChartClient, transport=http_transport)
 
     # Repositories
     rank_repository = providers.Factory(
@@ -40,13 +49,15 @@ class Container(containers.DeclarativeContainer):
     stock_repository = providers.Factory(
         StockApiRepository,
         auth_client=auth_client,
-        stock_client=stock_client
+        stock_client=stock_client,
+        rate_limiter=rate_limiter,
     )
 
     chart_repository = providers.Factory(
         ChartRepository,
         auth_client=auth_client,
         chart_client=chart_client,
+        rate_limiter=rate_limiter,
     )
 
     # Services
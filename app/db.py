@@ -3,13 +3,38 @@ from sqlalchemy.orm import declarative_base
 from app.config import settings
 
 # 비동기 엔진 생성
+# - pool_recycle로 서버 wait_timeout 전에 커넥션을 교체하므로 기본은 체크아웃마다 ping하지 않는다
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DB_ECHO,
     future=True,
-    pool_pre_ping=True
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
 )
 
+
+def pool_stats() -> dict:
+    """DB 커넥션 풀 상태"""
+    pool = engine.sync_engine.pool
+    checked_out = pool.checkedout()
+    capacity = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    return {
+        "pool_size": pool.size(),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "checked_in": pool.checkedin(),
+        "checked_out": checked_out,
+        "overflow": pool.overflow(),
+        "capacity": capacity,
+        "utilization": round(checked_out / capacity, 4) if capacity else 0.0,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pre_ping": settings.DB_POOL_PRE_PING,
+        "status": pool.status(),
+    }
+
 # 세션 팩토리
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
@@ -7,6 +7,9 @@ class PriceLevel(BaseModel):
     price: float
     touches: int  # 터치 횟수
     strength: str  # 강도: weak, medium, strong
+    min_price: Optional[float] = None  # 클러스터 최저 가격
+    max_price: Optional[float] = None  # 클러스터 최고 가격
+    last_touch_dt: Optional[str] = None  # 마지막 터치 일자
 
 
 class ResistanceSupportResponse(BaseModel):
@@ -1,6 +1,9 @@
-from typing import List, Dict, Union
-from collections import defaultdict
+from typing import List, Dict, NamedTuple, Union
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from app.domain.chart.bars import ChartBars
 from app.domain.chart.dto.response.chart_item import (
     DayChartItem,
     WeekChartItem,
@@ -15,6 +18,53 @@ from app.domain.analysis.dto.response.resistance_support import (
 
 
 ChartItem = Union[DayChartItem, WeekChartItem, MonthChartItem]
+ChartData = Union[ChartBars, List[ChartItem]]
+
+
+class OhlcvArrays(NamedTuple):
+    """분석용 OHLCV 배열 (차트 데이터를 한 번만 변환해 재사용)"""
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+
+class PriceCluster(NamedTuple):
+    """비슷한 가격대로 묶인 고점/저점 클러스터"""
+    price: float        # 평균 가격
+    touches: int        # 터치 횟수
+    min_price: float
+    max_price: float
+    last_index: int     # 마지막으로 터치한 봉의 인덱스
+
+
+def _date_at(chart_data: ChartData, index: int) -> str:
+    if isinstance(chart_data, ChartBars):
+        return chart_data.date_at(index)
+    return chart_data[index].dt
+
+
+def to_ohlcv_arrays(chart_data: ChartData) -> OhlcvArrays:
+    """차트 데이터를 NumPy 배열로 변환
+
+    ChartBars는 이미 컬럼형이므로 형 변환만 하고,
+    문자열 필드의 DTO 목록은 봉마다 파싱합니다.
+    """
+    if isinstance(chart_data, ChartBars):
+        return OhlcvArrays(
+            high=chart_data.high.astype(np.float64),
+            low=chart_data.low.astype(np.float64),
+            close=chart_data.close.astype(np.float64),
+            volume=chart_data.volume,
+        )
+
+    n = len(chart_data)
+    return OhlcvArrays(
+        high=np.fromiter((float(d.high_pric) for d in chart_data), dtype=np.float64, count=n),
+        low=np.fromiter((float(d.low_pric) for d in chart_data), dtype=np.float64, count=n),
+        close=np.fromiter((float(d.cur_prc) for d in chart_data), dtype=np.float64, count=n),
+        volume=np.fromiter((int(d.trde_qty) for d in chart_data), dtype=np.int64, count=n),
+    )
 
 
 class TechnicalAnalysisService:
@@ -27,7 +77,7 @@ class TechnicalAnalysisService:
         self,
         stock_code: str,
         timeframe: str,
-        chart_data: List[ChartItem],
+        chart_data: ChartData,
         start_dt: str,
         end_dt: str,
         window: int = 5,
@@ -58,29 +108,31 @@ class TechnicalAnalysisService:
                 analysis_summary="분석할 데이터가 부족합니다."
             )
 
+        bars = to_ohlcv_arrays(chart_data)
+
         # 1. 현재가 추출
-        current_price = float(chart_data[-1].cur_prc)
+        current_price = float(bars.close[-1])
 
         # 2. 로컬 고점 찾기 (저항선 후보)
-        resistance_candidates = self._find_local_highs(chart_data, window)
+        resistance_candidates = self._find_local_highs(bars.high, window)
 
         # 3. 로컬 저점 찾기 (지지선 후보)
-        support_candidates = self._find_local_lows(chart_data, window)
+        support_candidates = self._find_local_lows(bars.low, window)
 
         # 4. 비슷한 가격대 클러스터링
         resistance_clusters = self._cluster_price_levels(
-            resistance_candidates, tolerance
+            bars.high, resistance_candidates, tolerance
         )
         support_clusters = self._cluster_price_levels(
-            support_candidates, tolerance
+            bars.low, support_candidates, tolerance
         )
 
         # 5. 터치 횟수 계산 및 강도 판정
         resistance_levels = self._calculate_strength(
-            resistance_clusters, min_touches
+            resistance_clusters, min_touches, chart_data
         )
         support_levels = self._calculate_strength(
-            support_clusters, min_touches
+            support_clusters, min_touches, chart_data
         )
 
         # 6. 현재가 기준으로 정렬
@@ -123,7 +175,7 @@ class TechnicalAnalysisService:
         self,
         stock_code: str,
         timeframe: str,
-        chart_data: List[ChartItem],
+        chart_data: ChartData,
         start_dt: str,
         end_dt: str,
         price_bins: int = 50,
@@ -150,9 +202,11 @@ class TechnicalAnalysisService:
                 period=f"{start_dt}-{end_dt}",
             )
 
+        bars = to_ohlcv_arrays(chart_data)
+
         # 가격 범위 계산
-        min_price = min(float(d.low_pric) for d in chart_data)
-        max_price = max(float(d.high_pric) for d in chart_data)
+        min_price = float(bars.low.min())
+        max_price = float(bars.high.max())
         price_step = (max_price - min_price) / price_bins
 
         if price_step == 0:
@@ -163,25 +217,27 @@ class TechnicalAnalysisService:
             )
 
         # 각 가격 구간별 거래량 집계
-        volume_by_bin: Dict[int, int] = defaultdict(int)
-        total_volume = 0
-
-        for data in chart_data:
-            avg_price = (float(data.high_pric) + float(data.low_pric)) / 2
-            volume = int(data.trde_qty)
-
-            bin_index = int((avg_price - min_price) / price_step)
-            bin_index = min(bin_index, price_bins - 1)  # 최대값 보정
+        avg_price = (bars.high + bars.low) / 2
+        bin_index = np.minimum(
+            np.trunc((avg_price - min_price) / price_step).astype(np.int64),
+            price_bins - 1,  # 최대값 보정
+        )
+        total_volume = int(bars.volume.sum())
 
-            volume_by_bin[bin_index] += volume
-            total_volume += volume
+        # 등장한 구간만 집계 (첫 등장 위치는 동률 정렬 순서를 유지하는 데 사용)
+        bins, first_seen, inverse = np.unique(
+            bin_index, return_index=True, return_inverse=True
+        )
+        bin_volumes = np.bincount(
+            inverse, weights=bars.volume, minlength=len(bins)
+        ).round().astype(np.int64)
 
         # 거래량 상위 구간 추출 (상위 20%)
-        sorted_bins = sorted(
-            volume_by_bin.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
+        # 거래량 내림차순, 동률이면 먼저 등장한 구간 우선
+        order = np.lexsort((first_seen, -bin_volumes))
+        sorted_bins = [
+            (int(bins[i]), int(bin_volumes[i])) for i in order
+        ]
 
         threshold_count = max(int(len(sorted_bins) * 0.2), 5)
         high_volume_bins = sorted_bins[:threshold_count]
@@ -239,96 +295,101 @@ class TechnicalAnalysisService:
     # ─────────────────────────────────────────────────────────────────────
 
     def _find_local_highs(
-        self, chart_data: List[ChartItem], window: int
-    ) -> List[float]:
-        """로컬 고점 찾기"""
-        highs = []
-        data_len = len(chart_data)
-
-        for i in range(window, data_len - window):
-            current_high = float(chart_data[i].high_pric)
-
-            # 전후 window개 봉과 비교
-            is_local_high = True
-            for j in range(i - window, i + window + 1):
-                if j == i:
-                    continue
-                if current_high < float(chart_data[j].high_pric):
-                    is_local_high = False
-                    break
+        self, highs: np.ndarray, window: int
+    ) -> np.ndarray:
+        """로컬 고점 찾기 (전후 window개 봉 중 최고가인 봉의 인덱스)"""
+        size = window * 2 + 1
+        if len(highs) < size:
+            return np.empty(0, dtype=np.int64)
 
-            if is_local_high:
-                highs.append(current_high)
-
-        return highs
+        center = highs[window:len(highs) - window]
+        rolling_max = sliding_window_view(highs, size).max(axis=1)
+        return np.flatnonzero(center >= rolling_max) + window
 
     def _find_local_lows(
-        self, chart_data: List[ChartItem], window: int
-    ) -> List[float]:
-        """로컬 저점 찾기"""
-        lows = []
-        data_len = len(chart_data)
-
-        for i in range(window, data_len - window):
-            current_low = float(chart_data[i].low_pric)
-
-            # 전후 window개 봉과 비교
-            is_local_low = True
-            for j in range(i - window, i + window + 1):
-                if j == i:
-                    continue
-                if current_low > float(chart_data[j].low_pric):
-                    is_local_low = False
-                    break
-
-            if is_local_low:
-                lows.append(current_low)
+        self, lows: np.ndarray, window: int
+    ) -> np.ndarray:
+        """로컬 저점 찾기 (전후 window개 봉 중 최저가인 봉의 인덱스)"""
+        size = window * 2 + 1
+        if len(lows) < size:
+            return np.empty(0, dtype=np.int64)
 
-        return lows
+        center = lows[window:len(lows) - window]
+        rolling_min = sliding_window_view(lows, size).min(axis=1)
+        return np.flatnonzero(center <= rolling_min) + window
 
     def _cluster_price_levels(
-        self, prices: List[float], tolerance: float
-    ) -> Dict[float, int]:
+        self, prices: np.ndarray, indices: np.ndarray, tolerance: float
+    ) -> List[PriceCluster]:
         """비슷한 가격대를 클러스터링하여 터치 횟수 계산
 
+        가격을 오름차순으로 정렬한 뒤 한 번만 순회합니다.
+        클러스터 기준가는 첫(최저) 가격이고, 새 클러스터는 직전 기준가보다
+        tolerance 이상 높을 때만 생기므로 현재 가격이 속할 수 있는 클러스터는
+        마지막 클러스터뿐입니다. (정렬 O(n log n) + 순회 O(n))
+
+        Args:
+            prices: 전체 봉의 고가 또는 저가 배열
+            indices: 고점/저점 봉의 인덱스
+
         Returns:
-            {대표 가격: 터치 횟수}
+            가격 오름차순의 클러스터 목록
         """
-        if not prices:
-            return {}
-
-        sorted_prices = sorted(prices)
-        clusters: Dict[float, List[float]] = {}
-
-        for price in sorted_prices:
-            # 기존 클러스터에 속하는지 확인
-            matched = False
-            for cluster_key in list(clusters.keys()):
-                if abs(price - cluster_key) / cluster_key <= tolerance:
-                    clusters[cluster_key].append(price)
-                    matched = True
-                    break
-
-            # 새 클러스터 생성
-            if not matched:
-                clusters[price] = [price]
-
-        # 각 클러스터의 평균값과 터치 횟수 반환
-        result = {}
-        for prices_in_cluster in clusters.values():
-            avg_price = sum(prices_in_cluster) / len(prices_in_cluster)
-            touch_count = len(prices_in_cluster)
-            result[avg_price] = touch_count
-
-        return result
+        if len(indices) == 0:
+            return []
+
+        candidate_prices = prices[indices]
+        order = np.argsort(candidate_prices, kind="stable")
+        sorted_prices = candidate_prices[order].tolist()
+        sorted_indices = indices[order].tolist()
+
+        clusters: List[PriceCluster] = []
+        cluster_key = None
+        total = 0.0
+        count = 0
+        last_index = -1
+
+        def close_cluster(max_price: float) -> None:
+            clusters.append(
+                PriceCluster(
+                    price=total / count,
+                    touches=count,
+                    min_price=cluster_key,
+                    max_price=max_price,
+                    last_index=last_index,
+                )
+            )
+
+        previous = None
+        for price, index in zip(sorted_prices, sorted_indices):
+            if cluster_key is not None and abs(price - cluster_key) / cluster_key <= tolerance:
+                total += price
+                count += 1
+                last_index = max(last_index, index)
+            else:
+                # 새 클러스터 생성
+                if cluster_key is not None:
+                    close_cluster(previous)
+                cluster_key = price
+                total = price
+                count = 1
+                last_index = index
+            previous = price
+
+        close_cluster(previous)
+        return clusters
 
     def _calculate_strength(
-        self, clusters: Dict[float, int], min_touches: int
+        self,
+        clusters: List[PriceCluster],
+        min_touches: int,
+        chart_data: ChartData,
     ) -> List[PriceLevel]:
         """가격 레벨의 강도 계산"""
         levels = []
 
-        for price, touches in clusters.items():
+        for cluster in clusters:
+            touches = cluster.touches
             if touches < min_touches:
                 continue
 
@@ -342,9 +403,12 @@ class TechnicalAnalysisService:
 
             levels.append(
                 PriceLevel(
-                    price=round(price, 2),
+                    price=round(cluster.price, 2),
                     touches=touches,
                     strength=strength,
+                    min_price=round(cluster.min_price, 2),
+                    max_price=round(cluster.max_price, 2),
+                    last_touch_dt=_date_at(chart_data, cluster.last_index),
                 )
             )
 
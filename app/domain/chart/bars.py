@@ -0,0 +1,148 @@
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Type, TypeVar
+
+import numpy as np
+
+from app.domain.chart.dto.response.chart_item import MinuteChartItem
+
+T = TypeVar("T")
+
+
+def _int_column(values: Sequence) -> np.ndarray:
+    """NULL은 0으로 채운 int64 배열"""
+    return np.fromiter((v or 0 for v in values), dtype=np.int64, count=len(values))
+
+
+def _float_column(values: Sequence) -> np.ndarray:
+    """NULL은 NaN으로 채운 float64 배열"""
+    return np.fromiter(
+        (np.nan if v is None else float(v) for v in values),
+        dtype=np.float64,
+        count=len(values),
+    )
+
+
+@dataclass(frozen=True)
+class ChartBars:
+    """컬럼형 OHLCV 봉 데이터
+
+    봉마다 Pydantic 객체를 만들지 않고 필드별 배열로 보관합니다.
+    ts는 정수 시각(일/주/월봉: YYYYMMDD, 분봉: YYYYMMDDHHMMSS)이며,
+    API 응답 DTO로의 변환은 응답 직전(to_*_items)에만 수행합니다.
+    """
+    ts: np.ndarray                      # int64 일자/체결시간
+    open: np.ndarray                    # int64 시가
+    high: np.ndarray                    # int64 고가
+    low: np.ndarray                     # int64 저가
+    close: np.ndarray                   # int64 종가(현재가)
+    volume: np.ndarray                  # int64 거래량
+    pred_pre: np.ndarray                # int64 전일대비
+    pred_pre_sig: np.ndarray            # object 전일대비부호
+    trade_value: Optional[np.ndarray] = None    # int64 거래대금 (일/주/월봉)
+    turnover_rate: Optional[np.ndarray] = None  # float64 거래회전율, NULL은 NaN (일/주/월봉)
+    acc_volume: Optional[np.ndarray] = None     # int64 누적거래량 (분봉)
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    @classmethod
+    def from_minute_rows(cls, rows: Sequence[tuple]) -> "ChartBars":
+        """(cntr_tm, open, high, low, close, volume, acc_volume, pred_pre, pred_pre_sig) 행 목록에서 생성"""
+        columns = list(zip(*rows)) if rows else [()] * 9
+        ts, open_, high, low, close, volume, acc_volume, pred_pre, pred_pre_sig = columns
+        return cls(
+            ts=np.fromiter((int(v) for v in ts), dtype=np.int64, count=len(ts)),
+            open=_int_column(open_),
+            high=_int_column(high),
+            low=_int_column(low),
+            close=_int_column(close),
+            volume=_int_column(volume),
+            pred_pre=_int_column(pred_pre),
+            pred_pre_sig=np.array([v or "" for v in pred_pre_sig], dtype=object),
+            acc_volume=_int_column(acc_volume),
+        )
+
+    @classmethod
+    def from_period_rows(cls, rows: Sequence[tuple]) -> "ChartBars":
+        """(dt, open, high, low, close, volume, trade_value, pred_pre, pred_pre_sig, turnover_rate) 행 목록에서 생성"""
+        columns = list(zip(*rows)) if rows else [()] * 10
+        ts, open_, high, low, close, volume, trade_value, pred_pre, pred_pre_sig, turnover_rate = columns
+        return cls(
+            ts=np.fromiter((int(v) for v in ts), dtype=np.int64, count=len(ts)),
+            open=_int_column(open_),
+            high=_int_column(high),
+            low=_int_column(low),
+            close=_int_column(close),
+            volume=_int_column(volume),
+            pred_pre=_int_column(pred_pre),
+            pred_pre_sig=np.array([v or "" for v in pred_pre_sig], dtype=object),
+            trade_value=_int_column(trade_value),
+            turnover_rate=_float_column(turnover_rate),
+        )
+
+    def slice(self, start: int, stop: Optional[int] = None) -> "ChartBars":
+        """[start:stop] 구간의 봉 (배열 뷰이므로 복사하지 않음)"""
+        def part(column: Optional[np.ndarray]) -> Optional[np.ndarray]:
+            return None if column is None else column[start:stop]
+
+        return ChartBars(
+            ts=part(self.ts),
+            open=part(self.open),
+            high=part(self.high),
+            low=part(self.low),
+            close=part(self.close),
+            volume=part(self.volume),
+            pred_pre=part(self.pred_pre),
+            pred_pre_sig=part(self.pred_pre_sig),
+            trade_value=part(self.trade_value),
+            turnover_rate=part(self.turnover_rate),
+            acc_volume=part(self.acc_volume),
+        )
+
+    def date_at(self, index: int) -> str:
+        return str(self.ts[index])
+
+    # ── 응답 DTO 변환 ────────────────────────────────────────────────────────
+
+    def to_minute_items(self) -> List[MinuteChartItem]:
+        return [
+            MinuteChartItem(
+                cur_prc=str(close),
+                trde_qty=str(volume),
+                cntr_tm=str(ts),
+                open_pric=str(open_),
+                high_pric=str(high),
+                low_pric=str(low),
+                acc_trde_qty=str(acc_volume),
+                pred_pre=str(pred_pre),
+                pred_pre_sig=sig,
+            )
+            for ts, open_, high, low, close, volume, acc_volume, pred_pre, sig in zip(
+                self.ts.tolist(), self.open.tolist(), self.high.tolist(), self.low.tolist(),
+                self.close.tolist(), self.volume.tolist(), self.acc_volume.tolist(),
+                self.pred_pre.tolist(), self.pred_pre_sig.tolist(),
+            )
+        ]
+
+    def to_period_items(self, item_cls: Type[T]) -> List[T]:
+        """일/주/월봉 DTO 목록으로 변환 (item_cls: DayChartItem, WeekChartItem, MonthChartItem)"""
+        return [
+            item_cls(
+                cur_prc=str(close),
+                trde_qty=str(volume),
+                trde_prica=str(trade_value),
+                dt=str(ts),
+                open_pric=str(open_),
+                high_pric=str(high),
+                low_pric=str(low),
+                pred_pre=str(pred_pre),
+                pred_pre_sig=sig,
+                # DB 컬럼이 Numeric(10, 2)이므로 소수 둘째 자리까지 표기
+                trde_tern_rt=None if np.isnan(rate) else f"{rate:.2f}",
+            )
+            for ts, open_, high, low, close, volume, trade_value, pred_pre, sig, rate in zip(
+                self.ts.tolist(), self.open.tolist(), self.high.tolist(), self.low.tolist(),
+                self.close.tolist(), self.volume.tolist(), self.trade_value.tolist(),
+                self.pred_pre.tolist(), self.pred_pre_sig.tolist(), self.turnover_rate.tolist(),
+            )
+        ]
@@ -1,7 +1,6 @@
 from typing import Optional
 
-import httpx
-
+from app.common.http_transport import KiwoomHttpTransport, http_transport
 from app.config import settings
 from app.domain.chart.dto.response.chart_item import (
     MinuteChartItem, MinuteChartResponse,
@@ -13,9 +12,10 @@ from app.domain.chart.dto.response.chart_item import (
 
 class ChartClient:
 
-    def __init__(self):
+    def __init__(self, transport: Optional[KiwoomHttpTransport] = None):
         self.base_url = settings.KIWOOM_BASE_URL
         self.url = f"{self.base_url}/api/dostk/chart"
+        self.transport = transport or http_transport
 
     def _build_headers(self, access_token: str, api_id: str, cont_yn: Optional[str], next_key: Optional[str]) -> dict:
         headers = {
@@ -49,10 +49,9 @@ class ChartClient:
         if base_dt:
             body["base_dt"] = base_dt
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(self.url, headers=headers, json=body)
-            response.raise_for_status()
-            data = response.json()
+        response = await self.transport.post(self.url, headers=headers, json=body)
+        response.raise_for_status()
+        data = response.json()
 
         return MinuteChartResponse(
             cont_yn=response.headers.get("cont-yn"),
@@ -80,10 +79,9 @@ class ChartClient:
             "upd_stkpc_tp": upd_stkpc_tp,
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(self.url, headers=headers, json=body)
-            response.raise_for_status()
-            data = response.json()
+        response = await self.transport.post(self.url, headers=headers, json=body)
+        response.raise_for_status()
+        data = response.json()
 
         return DayChartResponse(
             cont_yn=response.headers.get("cont-yn"),
@@ -111,10 +109,9 @@ class ChartClient:
             "upd_stkpc_tp": upd_stkpc_tp,
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(self.url, headers=headers, json=body)
-            response.raise_for_status()
-            data = response.json()
+        response = await self.transport.post(self.url, headers=headers, json=body)
+        response.raise_for_status()
+        data = response.json()
 
         return WeekChartResponse(
             cont_yn=response.headers.get("cont-yn"),
@@ -142,10 +139,9 @@ class ChartClient:
             "upd_stkpc_tp": upd_stkpc_tp,
         }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(self.url, headers=headers, json=body)
-            response.raise_for_status()
-            data = response.json()
+        response = await self.transport.post(self.url, headers=headers, json=body)
+        response.raise_for_status()
+        data = response.json()
 
         return MonthChartResponse(
             cont_yn=response.headers.get("cont-yn"),
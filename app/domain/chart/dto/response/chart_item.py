@@ -57,6 +57,23 @@ class MonthChartItem(BaseModel):
     trde_tern_rt: Optional[str] = None  # 거래회전율
 
 
+class DayChartWithMAItem(DayChartItem):
+    """일봉 차트 항목 + 기술적 지표 (선행 데이터 부족 시 null)"""
+    ma5: Optional[float] = None
+    ma10: Optional[float] = None
+    ma20: Optional[float] = None
+    ma60: Optional[float] = None
+    ema12: Optional[float] = None
+    ema26: Optional[float] = None
+    rsi14: Optional[float] = None
+    macd: Optional[float] = None
+    macd_signal: Optional[float] = None
+    macd_hist: Optional[float] = None
+    bb_upper: Optional[float] = None
+    bb_middle: Optional[float] = None
+    bb_lower: Optional[float] = None
+
+
 class MinuteChartResponse(BaseModel):
     """분봉 차트 응답"""
     cont_yn: Optional[str] = None
@@ -83,3 +100,19 @@ class MonthChartResponse(BaseModel):
     cont_yn: Optional[str] = None
     next_key: Optional[str] = None
     items: List[MonthChartItem] = []
+
+
+class DayChartWithMAResponse(BaseModel):
+    """일봉 차트 + 이동평균/지표 응답"""
+    items: List[DayChartWithMAItem] = []
+
+
+class BatchSyncResponse(BaseModel):
+    """배치 동기화 결과"""
+    total: int = 0                      # 대상 종목 수
+    success: int = 0                    # 성공 종목 수
+    failed: int = 0                     # 실패 종목 수
+    skipped: int = 0                    # 체크포인트로 건너뛴 종목 수 (이전 실행에서 완료)
+    record_count: int = 0               # 저장된 봉 개수
+    failed_stocks: List[str] = []       # 실패 종목코드
+    elapsed_seconds: float = 0.0        # 소요 시간(초)
@@ -0,0 +1,81 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+# 지표 계산에 필요한 선행 봉 개수 (MA60 + EMA/MACD 수렴 여유분)
+WARMUP_BARS = 120
+
+
+def sma(values: np.ndarray, period: int) -> np.ndarray:
+    """단순이동평균 (누적합 기반 O(n)), 앞쪽 period-1개는 NaN"""
+    result = np.full(len(values), np.nan)
+    if len(values) < period:
+        return result
+    cumsum = np.cumsum(np.insert(values.astype(np.float64), 0, 0.0))
+    result[period - 1:] = (cumsum[period:] - cumsum[:-period]) / period
+    return result
+
+
+def ema(values: np.ndarray, period: int) -> np.ndarray:
+    """지수이동평균
+
+    앞쪽 NaN은 건너뛰고, 첫 유효 구간 period개의 단순평균을 시드로 사용합니다.
+    """
+    result = np.full(len(values), np.nan)
+    valid = np.flatnonzero(~np.isnan(values))
+    if len(valid) == 0:
+        return result
+    start = valid[0]
+    seed_end = start + period
+    if seed_end > len(values):
+        return result
+
+    alpha = 2.0 / (period + 1)
+    prev = float(np.mean(values[start:seed_end]))
+    result[seed_end - 1] = prev
+    for i, value in enumerate(values[seed_end:].tolist(), start=seed_end):
+        prev = prev + alpha * (value - prev)
+        result[i] = prev
+    return result
+
+
+def rsi(values: np.ndarray, period: int = 14) -> np.ndarray:
+    """RSI (Wilder 평활)"""
+    result = np.full(len(values), np.nan)
+    if len(values) <= period:
+        return result
+
+    delta = np.diff(values.astype(np.float64))
+    gains = np.clip(delta, 0, None).tolist()
+    losses = np.clip(-delta, 0, None).tolist()
+
+    avg_gain = sum(gains[:period]) / period
+    avg_loss = sum(losses[:period]) / period
+
+    def to_rsi(gain: float, loss: float) -> float:
+        if loss == 0:
+            return 100.0 if gain > 0 else 50.0
+        return 100.0 - 100.0 / (1.0 + gain / loss)
+
+    result[period] = to_rsi(avg_gain, avg_loss)
+    for i in range(period, len(delta)):
+        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+        result[i + 1] = to_rsi(avg_gain, avg_loss)
+    return result
+
+
+def macd(values: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9):
+    """MACD → (macd, signal, histogram)"""
+    macd_line = ema(values, fast) - ema(values, slow)
+    signal_line = ema(macd_line, signal)
+    return macd_line, signal_line, macd_line - signal_line
+
+
+def bollinger(values: np.ndarray, period: int = 20, num_std: float = 2.0):
+    """볼린저 밴드 → (upper, middle, lower)"""
+    middle = sma(values, period)
+    std = np.full(len(values), np.nan)
+    if len(values) >= period:
+        std[period - 1:] = sliding_window_view(values.astype(np.float64), period).std(axis=1)
+    return middle + num_std * std, middle, middle - num_std * std
@@ -1,9 +1,13 @@
-from typing import List
+from typing import Dict, List, Set, Tuple
 
 from sqlalchemy import func, select
 from sqlalchemy.dialects.mysql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.common.metrics import instrument_repository
+from app.config import settings
+from app.domain.chart.bars import ChartBars
+
 from app.domain.chart.dto.response.chart_item import (
     MinuteChartItem,
     DayChartItem,
@@ -11,6 +15,7 @@ from app.domain.chart.dto.response.chart_item import (
     MonthChartItem,
 )
 from app.models.chart import (
+    ChartSyncWatermark,
     StockChartMinute,
     StockChartDaily,
     StockChartWeekly,
@@ -32,9 +37,127 @@ def _to_float(value: str):
         return None
 
 
+# upsert 시 갱신할 컬럼 (키 컬럼 제외)
+_MINUTE_UPDATE_COLUMNS = (
+    'open_pric', 'high_pric', 'low_pric', 'cur_prc', 'trde_qty',
+    'acc_trde_qty', 'pred_pre', 'pred_pre_sig',
+)
+_PERIOD_UPDATE_COLUMNS = (
+    'open_pric', 'high_pric', 'low_pric', 'cur_prc', 'trde_qty',
+    'trde_prica', 'pred_pre', 'pred_pre_sig', 'trde_tern_rt',
+)
+
+# 테이블별 upsert 문 캐시 (같은 객체를 재사용해 SQLAlchemy 컴파일 캐시를 항상 적중시킨다)
+_upsert_statements: Dict[type, object] = {}
+
+
+def _on_duplicate_update(stmt, update_columns):
+    return stmt.on_duplicate_key_update(
+        **{col: stmt.inserted[col] for col in update_columns},
+        updated_at=func.now(),
+    )
+
+
+def _cached_upsert_statement(model, update_columns):
+    stmt = _upsert_statements.get(model)
+    if stmt is None:
+        stmt = _on_duplicate_update(insert(model), update_columns)
+        _upsert_statements[model] = stmt
+    return stmt
+
+
+@instrument_repository
 class ChartDbRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
+        # 이번 트랜잭션에서 쓰기가 발생한 (타임프레임, 종목코드) — 커밋 시 캐시 무효화에 사용
+        self.touched: Set[Tuple[str, str]] = set()
+
+    async def _chunked_upsert(self, model, update_columns, data: List[dict]) -> int:
+        """CHART_UPSERT_CHUNK_SIZE 단위로 나누어 upsert
+
+        CHART_UPSERT_EXECUTEMANY=True면 캐시된 문장에 파라미터 목록을 넘겨 executemany로 실행하고
+        (드라이버가 다중 VALUES로 재작성), False면 청크마다 다중 VALUES 문을 만들어 실행한다.
+        한 문장의 크기가 청크 크기로 제한되므로 max_allowed_packet 초과를 피한다.
+        """
+        chunk_size = max(1, settings.CHART_UPSERT_CHUNK_SIZE)
+        for i in range(0, len(data), chunk_size):
+            chunk = data[i:i + chunk_size]
+            if settings.CHART_UPSERT_EXECUTEMANY:
+                await self.db.execute(_cached_upsert_statement(model, update_columns), chunk)
+            else:
+                await self.db.execute(_on_duplicate_update(insert(model).values(chunk), update_columns))
+        return len(data)
+
+    # ── Watermark ─────────────────────────────────────────────────────────────
+
+    async def get_watermarks(self, timeframe: str) -> Dict[str, str]:
+        """타임프레임의 종목별 워터마크 {종목코드: last_ts}
+
+        워터마크는 동기화가 끝까지 성공한 종목에만 기록되므로, 차트 테이블의 MAX(시점)으로
+        대신하지 않는다 (중단된 실행이 남긴 최신 페이지만으로는 그 사이 구간이 비어 있을 수 있음).
+        워터마크 도입 이전 데이터는 ddl.sql의 초기화 쿼리로 한 번 채운다.
+        """
+        rows = await self.db.execute(
+            select(ChartSyncWatermark.stock_code, ChartSyncWatermark.last_ts)
+            .where(ChartSyncWatermark.timeframe == timeframe)
+        )
+        return {row.stock_code: row.last_ts for row in rows}
+
+    async def advance_watermark(self, stock_code: str, timeframe: str, last_ts: str) -> None:
+        """워터마크를 last_ts까지 전진 (과거 구간 재적재로는 뒤로 가지 않음)"""
+        stmt = insert(ChartSyncWatermark).values(
+            stock_code=stock_code,
+            timeframe=timeframe,
+            last_ts=last_ts,
+        )
+        stmt = stmt.on_duplicate_key_update(
+            last_ts=func.greatest(ChartSyncWatermark.last_ts, stmt.inserted.last_ts),
+            updated_at=func.now(),
+        )
+        await self.db.execute(stmt)
+
+    async def _get_period_bars(
+        self, model, stock_code: str, start_dt: str, end_dt: str, lookback: int = 0
+    ) -> ChartBars:
+        """일/주/월봉 기간 조회 (ORM 객체 없이 컬럼만 읽어 컬럼형으로 반환)
+
+        lookback > 0이면 start_dt 이전 봉 lookback개를 함께 조회합니다.
+        (지표 선행 구간, 시작일을 스칼라 서브쿼리로 구해 한 번의 쿼리로 처리)
+        """
+        if lookback > 0:
+            warmup_start = (
+                select(model.dt)
+                .where(model.stock_code == stock_code, model.dt < start_dt)
+                .order_by(model.dt.desc())
+                .limit(1)
+                .offset(lookback - 1)
+                .scalar_subquery()
+            )
+            # 이전 봉이 lookback개보다 적으면 서브쿼리가 NULL → 처음부터 조회
+            start_dt = func.coalesce(warmup_start, "00000000")
+
+        stmt = (
+            select(
+                model.dt,
+                model.open_pric,
+                model.high_pric,
+                model.low_pric,
+                model.cur_prc,
+                model.trde_qty,
+                model.trde_prica,
+                model.pred_pre,
+                model.pred_pre_sig,
+                model.trde_tern_rt,
+            )
+            .where(
+                model.stock_code == stock_code,
+                model.dt.between(start_dt, end_dt),
+            )
+            .order_by(model.dt)
+        )
+        result = await self.db.execute(stmt)
+        return ChartBars.from_period_rows(result.all())
 
     # ── Minute ────────────────────────────────────────────────────────────────
 
@@ -42,6 +165,8 @@ class ChartDbRepository:
         if not items:
             return 0
 
+        self.touched.add(("minute", stock_code))
+
         data = [
             {
                 'stock_code': stock_code,
@@ -58,25 +183,22 @@ class ChartDbRepository:
             for item in items
         ]
 
-        stmt = insert(StockChartMinute).values(data)
-        stmt = stmt.on_duplicate_key_update(
-            open_pric=stmt.inserted.open_pric,
-            high_pric=stmt.inserted.high_pric,
-            low_pric=stmt.inserted.low_pric,
-            cur_prc=stmt.inserted.cur_prc,
-            trde_qty=stmt.inserted.trde_qty,
-            acc_trde_qty=stmt.inserted.acc_trde_qty,
-            pred_pre=stmt.inserted.pred_pre,
-            pred_pre_sig=stmt.inserted.pred_pre_sig,
-            updated_at=func.now(),
-        )
-        await self.db.execute(stmt)
-        return len(data)
+        return await self._chunked_upsert(StockChartMinute, _MINUTE_UPDATE_COLUMNS, data)
 
-    async def get_minute(self, stock_code: str, date: str) -> List[MinuteChartItem]:
-        """date: YYYYMMDD — 해당 날짜의 모든 분봉 반환"""
+    async def get_minute_bars(self, stock_code: str, date: str) -> ChartBars:
+        """date: YYYYMMDD — 해당 날짜의 모든 분봉을 컬럼형으로 반환"""
         stmt = (
-            select(StockChartMinute)
+            select(
+                StockChartMinute.cntr_tm,
+                StockChartMinute.open_pric,
+                StockChartMinute.high_pric,
+                StockChartMinute.low_pric,
+                StockChartMinute.cur_prc,
+                StockChartMinute.trde_qty,
+                StockChartMinute.acc_trde_qty,
+                StockChartMinute.pred_pre,
+                StockChartMinute.pred_pre_sig,
+            )
             .where(
                 StockChartMinute.stock_code == stock_code,
                 StockChartMinute.cntr_tm.like(f"{date}%"),
@@ -84,21 +206,11 @@ class ChartDbRepository:
             .order_by(StockChartMinute.cntr_tm)
         )
         result = await self.db.execute(stmt)
-        rows = result.scalars().all()
-        return [
-            MinuteChartItem(
-                cur_prc=str(row.cur_prc or 0),
-                trde_qty=str(row.trde_qty or 0),
-                cntr_tm=row.cntr_tm,
-                open_pric=str(row.open_pric or 0),
-                high_pric=str(row.high_pric or 0),
-                low_pric=str(row.low_pric or 0),
-                acc_trde_qty=str(row.acc_trde_qty or 0),
-                pred_pre=str(row.pred_pre or 0),
-                pred_pre_sig=row.pred_pre_sig or "",
-            )
-            for row in rows
-        ]
+        return ChartBars.from_minute_rows(result.all())
+
+    async def get_minute(self, stock_code: str, date: str) -> List[MinuteChartItem]:
+        """date: YYYYMMDD — 해당 날짜의 모든 분봉 반환"""
+        return (await self.get_minute_bars(stock_code, date)).to_minute_items()
 
     # ── Daily ─────────────────────────────────────────────────────────────────
 
@@ -106,6 +218,8 @@ class ChartDbRepository:
         if not items:
             return 0
 
+        self.touched.add(("day", stock_code))
+
         data = [
             {
                 'stock_code': stock_code,
@@ -123,48 +237,15 @@ class ChartDbRepository:
             for item in items
         ]
 
-        stmt = insert(StockChartDaily).values(data)
-        stmt = stmt.on_duplicate_key_update(
-            open_pric=stmt.inserted.open_pric,
-            high_pric=stmt.inserted.high_pric,
-            low_pric=stmt.inserted.low_pric,
-            cur_prc=stmt.inserted.cur_prc,
-            trde_qty=stmt.inserted.trde_qty,
-            trde_prica=stmt.inserted.trde_prica,
-            pred_pre=stmt.inserted.pred_pre,
-            pred_pre_sig=stmt.inserted.pred_pre_sig,
-            trde_tern_rt=stmt.inserted.trde_tern_rt,
-            updated_at=func.now(),
-        )
-        await self.db.execute(stmt)
-        return len(data)
+        return await self._chunked_upsert(StockChartDaily, _PERIOD_UPDATE_COLUMNS, data)
+
+    async def get_daily_bars(
+        self, stock_code: str, start_dt: str, end_dt: str, lookback: int = 0
+    ) -> ChartBars:
+        return await self._get_period_bars(StockChartDaily, stock_code, start_dt, end_dt, lookback)
 
     async def get_daily(self, stock_code: str, start_dt: str, end_dt: str) -> List[DayChartItem]:
-        stmt = (
-            select(StockChartDaily)
-            .where(
-                StockChartDaily.stock_code == stock_code,
-                StockChartDaily.dt.between(start_dt, end_dt),
-            )
-            .order_by(StockChartDaily.dt)
-        )
-        result = await self.db.execute(stmt)
-        rows = result.scalars().all()
-        return [
-            DayChartItem(
-                cur_prc=str(row.cur_prc or 0),
-                trde_qty=str(row.trde_qty or 0),
-                trde_prica=str(row.trde_prica or 0),
-                dt=row.dt,
-                open_pric=str(row.open_pric or 0),
-                high_pric=str(row.high_pric or 0),
-                low_pric=str(row.low_pric or 0),
-                pred_pre=str(row.pred_pre or 0),
-                pred_pre_sig=row.pred_pre_sig or "",
-                trde_tern_rt=str(row.trde_tern_rt) if row.trde_tern_rt is not None else None,
-            )
-            for row in rows
-        ]
+        return (await self.get_daily_bars(stock_code, start_dt, end_dt)).to_period_items(DayChartItem)
 
     # ── Weekly ────────────────────────────────────────────────────────────────
 
@@ -172,6 +253,8 @@ class ChartDbRepository:
         if not items:
             return 0
 
+        self.touched.add(("week", stock_code))
+
         data = [
             {
                 'stock_code': stock_code,
@@ -189,48 +272,13 @@ class ChartDbRepository:
             for item in items
         ]
 
-        stmt = insert(StockChartWeekly).values(data)
-        stmt = stmt.on_duplicate_key_update(
-            open_pric=stmt.inserted.open_pric,
-            high_pric=stmt.inserted.high_pric,
-            low_pric=stmt.inserted.low_pric,
-            cur_prc=stmt.inserted.cur_prc,
-            trde_qty=stmt.inserted.trde_qty,
-            trde_prica=stmt.inserted.trde_prica,
-            pred_pre=stmt.inserted.pred_pre,
-            pred_pre_sig=stmt.inserted.pred_pre_sig,
-            trde_tern_rt=stmt.inserted.trde_tern_rt,
-            updated_at=func.now(),
-        )
-        await self.db.execute(stmt)
-        return len(data)
+        return await self._chunked_upsert(StockChartWeekly, _PERIOD_UPDATE_COLUMNS, data)
+
+    async def get_weekly_bars(self, stock_code: str, start_dt: str, end_dt: str) -> ChartBars:
+        return await self._get_period_bars(StockChartWeekly, stock_code, start_dt, end_dt)
 
     async def get_weekly(self, stock_code: str, start_dt: str, end_dt: str) -> List[WeekChartItem]:
-        stmt = (
-            select(StockChartWeekly)
-            .where(
-                StockChartWeekly.stock_code == stock_code,
-                StockChartWeekly.dt.between(start_dt, end_dt),
-            )
-            .order_by(StockChartWeekly.dt)
-        )
-        result = await self.db.execute(stmt)
-        rows = result.scalars().all()
-        return [
-            WeekChartItem(
-                cur_prc=str(row.cur_prc or 0),
-                trde_qty=str(row.trde_qty or 0),
-                trde_prica=str(row.trde_prica or 0),
-                dt=row.dt,
-                open_pric=str(row.open_pric or 0),
-                high_pric=str(row.high_pric or 0),
-                low_pric=str(row.low_pric or 0),
-                pred_pre=str(row.pred_pre or 0),
-                pred_pre_sig=row.pred_pre_sig or "",
-                trde_tern_rt=str(row.trde_tern_rt) if row.trde_tern_rt is not None else None,
-            )
-            for row in rows
-        ]
+        return (await self.get_weekly_bars(stock_code, start_dt, end_dt)).to_period_items(WeekChartItem)
 
     # ── Monthly ───────────────────────────────────────────────────────────────
 
@@ -238,6 +286,8 @@ class ChartDbRepository:
         if not items:
             return 0
 
+        self.touched.add(("month", stock_code))
+
         data = [
             {
                 'stock_code': stock_code,
@@ -255,45 +305,10 @@ class ChartDbRepository:
             for item in items
         ]
 
-        stmt = insert(StockChartMonthly).values(data)
-        stmt = stmt.on_duplicate_key_update(
-            open_pric=stmt.inserted.open_pric,
-            high_pric=stmt.inserted.high_pric,
-            low_pric=stmt.inserted.low_pric,
-            cur_prc=stmt.inserted.cur_prc,
-            trde_qty=stmt.inserted.trde_qty,
-            trde_prica=stmt.inserted.trde_prica,
-            pred_pre=stmt.inserted.pred_pre,
-            pred_pre_sig=stmt.inserted.pred_pre_sig,
-            trde_tern_rt=stmt.inserted.trde_tern_rt,
-            updated_at=func.now(),
-        )
-        await self.db.execute(stmt)
-        return len(data)
+        return await self._chunked_upsert(StockChartMonthly, _PERIOD_UPDATE_COLUMNS, data)
+
+    async def get_monthly_bars(self, stock_code: str, start_dt: str, end_dt: str) -> ChartBars:
+        return await self._get_period_bars(StockChartMonthly, stock_code, start_dt, end_dt)
 
     async def get_monthly(self, stock_code: str, start_dt: str, end_dt: str) -> List[MonthChartItem]:
-        stmt = (
-            select(StockChartMonthly)
-            .where(
-                StockChartMonthly.stock_code == stock_code,
-                StockChartMonthly.dt.between(start_dt, end_dt),
-            )
-            .order_by(StockChartMonthly.dt)
-        )
-        result = await self.db.execute(stmt)
-        rows = result.scalars().all()
-        return [
-            MonthChartItem(
-                cur_prc=str(row.cur_prc or 0),
-                trde_qty=str(row.trde_qty or 0),
-                trde_prica=str(row.trde_prica or 0),
-                dt=row.dt,
-                open_pric=str(row.open_pric or 0),
-                high_pric=str(row.high_pric or 0),
-                low_pric=str(row.low_pric or 0),
-                pred_pre=str(row.pred_pre or 0),
-                pred_pre_sig=row.pred_pre_sig or "",
-                trde_tern_rt=str(row.trde_tern_rt) if row.trde_tern_rt is not None else None,
-            )
-            for row in rows
-        ]
+        return (await self.get_monthly_bars(stock_code, start_dt, end_dt)).to_period_items(MonthChartItem)
@@ -1,6 +1,8 @@
-from typing import Optional
+from typing import AsyncIterator, Callable, Optional
 
 from app.common.auth_client import AuthClient
+from app.common.pagination import paginate
+from app.common.rate_limiter import TokenBucketRateLimiter, kiwoom_rate_limiter
 from app.domain.chart.chart_client import ChartClient
 from app.domain.chart.dto.response.chart_item import (
     MinuteChartResponse,
@@ -11,9 +13,15 @@ from app.domain.chart.dto.response.chart_item import (
 
 
 class ChartRepository:
-    def __init__(self, auth_client: AuthClient, chart_client: ChartClient):
+    def __init__(
+        self,
+        auth_client: AuthClient,
+        chart_client: ChartClient,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+    ):
         self.auth_client = auth_client
         self.chart_client = chart_client
+        self.rate_limiter = rate_limiter or kiwoom_rate_limiter
 
     async def get_minute_chart(
         self,
@@ -24,16 +32,19 @@ class ChartRepository:
         cont_yn: Optional[str] = None,
         next_key: Optional[str] = None,
     ) -> MinuteChartResponse:
-        token = await self.auth_client.ensure_token()
-        return await self.chart_client.get_minute_chart(
-            access_token=token,
-            stk_cd=stk_cd,
-            tic_scope=tic_scope,
-            upd_stkpc_tp=upd_stkpc_tp,
-            base_dt=base_dt,
-            cont_yn=cont_yn,
-            next_key=next_key,
-        )
+        async def call(token: str) -> MinuteChartResponse:
+            await self.rate_limiter.acquire()
+            return await self.chart_client.get_minute_chart(
+                access_token=token,
+                stk_cd=stk_cd,
+                tic_scope=tic_scope,
+                upd_stkpc_tp=upd_stkpc_tp,
+                base_dt=base_dt,
+                cont_yn=cont_yn,
+                next_key=next_key,
+            )
+
+        return await self.auth_client.call_with_token(call)
 
     async def get_day_chart(
         self,
@@ -43,15 +54,18 @@ class ChartRepository:
         cont_yn: Optional[str] = None,
         next_key: Optional[str] = None,
     ) -> DayChartResponse:
-        token = await self.auth_client.ensure_token()
-        return await self.chart_client.get_day_chart(
-            access_token=token,
-            stk_cd=stk_cd,
-            base_dt=base_dt,
-            upd_stkpc_tp=upd_stkpc_tp,
-            cont_yn=cont_yn,
-            next_key=next_key,
-        )
+        async def call(token: str) -> DayChartResponse:
+            await self.rate_limiter.acquire()
+            return await self.chart_client.get_day_chart(
+                access_token=token,
+                stk_cd=stk_cd,
+                base_dt=base_dt,
+                upd_stkpc_tp=upd_stkpc_tp,
+                cont_yn=cont_yn,
+                next_key=next_key,
+            )
+
+        return await self.auth_client.call_with_token(call)
 
     async def get_week_chart(
         self,
@@ -61,15 +75,18 @@ class ChartRepository:
         cont_yn: Optional[str] = None,
         next_key: Optional[str] = None,
     ) -> WeekChartResponse:
-        token = await self.auth_client.ensure_token()
-        return await self.chart_client.get_week_chart(
-            access_token=token,
-            stk_cd=stk_cd,
-            base_dt=base_dt,
-            upd_stkpc_tp=upd_stkpc_tp,
-            cont_yn=cont_yn,
-            next_key=next_key,
-        )
+        async def call(token: str) -> WeekChartResponse:
+            await self.rate_limiter.acquire()
+            return await self.chart_client.get_week_chart(
+                access_token=token,
+                stk_cd=stk_cd,
+                base_dt=base_dt,
+                upd_stkpc_tp=upd_stkpc_tp,
+                cont_yn=cont_yn,
+                next_key=next_key,
+            )
+
+        return await self.auth_client.call_with_token(call)
 
     async def get_month_chart(
         self,
@@ -79,12 +96,97 @@ class ChartRepository:
         cont_yn: Optional[str] = None,
         next_key: Optional[str] = None,
     ) -> MonthChartResponse:
-        token = await self.auth_client.ensure_token()
-        return await self.chart_client.get_month_chart(
-            access_token=token,
-            stk_cd=stk_cd,
-            base_dt=base_dt,
-            upd_stkpc_tp=upd_stkpc_tp,
-            cont_yn=cont_yn,
-            next_key=next_key,
+        async def call(token: str) -> MonthChartResponse:
+            await self.rate_limiter.acquire()
+            return await self.chart_client.get_month_chart(
+                access_token=token,
+                stk_cd=stk_cd,
+                base_dt=base_dt,
+                upd_stkpc_tp=upd_stkpc_tp,
+                cont_yn=cont_yn,
+                next_key=next_key,
+            )
+
+        return await self.auth_client.call_with_token(call)
+
+    # ── 연속조회 페이지 순회 ─────────────────────────────────────────────────
+    # min_dt(YYYYMMDD)보다 오래된 봉이 포함된 페이지를 받으면 그 페이지까지만 조회합니다.
+
+    @staticmethod
+    def _older_than(min_dt: Optional[str], date_of: Callable) -> Optional[Callable]:
+        if not min_dt:
+            return None
+        return lambda page: bool(page.items) and min(date_of(i) for i in page.items) < min_dt
+
+    def iter_minute_chart_pages(
+        self,
+        stk_cd: str,
+        tic_scope: str,
+        upd_stkpc_tp: str,
+        base_dt: Optional[str] = None,
+        min_dt: Optional[str] = None,
+        max_pages: Optional[int] = None,
+        start_key: Optional[str] = None,
+    ) -> AsyncIterator[MinuteChartResponse]:
+        return paginate(
+            lambda cont_yn, next_key: self.get_minute_chart(
+                stk_cd, tic_scope, upd_stkpc_tp, base_dt, cont_yn, next_key
+            ),
+            max_pages=max_pages,
+            start_key=start_key,
+            stop_when=self._older_than(min_dt, lambda item: item.cntr_tm[:8]),
+        )
+
+    def iter_day_chart_pages(
+        self,
+        stk_cd: str,
+        base_dt: str,
+        upd_stkpc_tp: str,
+        min_dt: Optional[str] = None,
+        max_pages: Optional[int] = None,
+        start_key: Optional[str] = None,
+    ) -> AsyncIterator[DayChartResponse]:
+        return paginate(
+            lambda cont_yn, next_key: self.get_day_chart(
+                stk_cd, base_dt, upd_stkpc_tp, cont_yn, next_key
+            ),
+            max_pages=max_pages,
+            start_key=start_key,
+            stop_when=self._older_than(min_dt, lambda item: item.dt),
+        )
+
+    def iter_week_chart_pages(
+        self,
+        stk_cd: str,
+        base_dt: str,
+        upd_stkpc_tp: str,
+        min_dt: Optional[str] = None,
+        max_pages: Optional[int] = None,
+        start_key: Optional[str] = None,
+    ) -> AsyncIterator[WeekChartResponse]:
+        return paginate(
+            lambda cont_yn, next_key: self.get_week_chart(
+                stk_cd, base_dt, upd_stkpc_tp, cont_yn, next_key
+            ),
+            max_pages=max_pages,
+            start_key=start_key,
+            stop_when=self._older_than(min_dt, lambda item: item.dt),
+        )
+
+    def iter_month_chart_pages(
+        self,
+        stk_cd: str,
+        base_dt: str,
+        upd_stkpc_tp: str,
+        min_dt: Optional[str] = None,
+        max_pages: Optional[int] = None,
+        start_key: Optional[str] = None,
+    ) -> AsyncIterator[MonthChartResponse]:
+        return paginate(
+            lambda cont_yn, next_key: self.get_month_chart(
+                stk_cd, base_dt, upd_stkpc_tp, cont_yn, next_key
+            ),
+            max_pages=max_pages,
+            start_key=start_key,
+            stop_when=self._older_than(min_dt, lambda item: item.dt),
         )
@@ -1,14 +1,36 @@
-from typing import Optional
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
 
+import numpy as np
+
+from app.common.cache import chart_cache
+from app.common.checkpoint import BatchCheckpoint
+from app.common.pagination import has_next_page
+from app.common.progress import current_progress
+from app.config import settings
+from app.domain.chart import indicators
+from app.domain.chart.bars import ChartBars
 from app.domain.chart.repositories.chart_repository import ChartRepository
 from app.domain.chart.unit_of_work import ChartUnitOfWork
 from app.domain.chart.dto.response.chart_item import (
     MinuteChartResponse,
     DayChartResponse,
+    DayChartItem,
+    DayChartWithMAItem,
+    DayChartWithMAResponse,
+    WeekChartItem,
     WeekChartResponse,
+    MonthChartItem,
     MonthChartResponse,
+    BatchSyncResponse,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class ChartService:
     def __init__(self, chart_repository: ChartRepository):
@@ -110,28 +132,565 @@ class ChartService:
 
         return response
 
+    # ── 배치 동기화: 전체 종목 (Kiwoom API → DB) ─────────────────────────────
+
+    async def batch_sync_minute_chart(
+        self,
+        base_dt: Optional[str] = None,
+        tic_scope: str = "1",
+        upd_stkpc_tp: str = "1",
+        max_workers: Optional[int] = None,
+        incremental: bool = True,
+        checkpoint: Optional[BatchCheckpoint] = None,
+        max_pages: Optional[int] = None,
+    ) -> BatchSyncResponse:
+        """전체 활성 종목 분봉 동기화 (ka10080, 자동 페이징)
+
+        incremental이면 종목별 워터마크 일자부터만 받아오고, 그 이전 페이지는 요청하지 않는다.
+        워터마크가 없는 종목은 최근 max_pages 페이지만 받는다 (_batch_window).
+        """
+        base_dt = base_dt or datetime.now().strftime("%Y%m%d")
+        stock_codes = await self._get_active_stock_codes()
+        watermarks = await self._get_watermark_dates("minute") if incremental else {}
+        return await self._run_batch(
+            stock_codes,
+            lambda code, **resume: self._sync_minute_history(
+                code, tic_scope, upd_stkpc_tp, base_dt, **self._batch_window(watermarks.get(code), max_pages),
+                track_watermark=incremental, **resume
+            ),
+            max_workers,
+            checkpoint,
+        )
+
+    async def batch_sync_day_chart(
+        self,
+        base_dt: str,
+        upd_stkpc_tp: str = "1",
+        max_workers: Optional[int] = None,
+        incremental: bool = True,
+        checkpoint: Optional[BatchCheckpoint] = None,
+        max_pages: Optional[int] = None,
+    ) -> BatchSyncResponse:
+        """전체 활성 종목 일봉 동기화 (ka10081, 자동 페이징, incremental이면 워터마크 이후만)"""
+        stock_codes = await self._get_active_stock_codes()
+        watermarks = await self._get_watermark_dates("day") if incremental else {}
+        return await self._run_batch(
+            stock_codes,
+            lambda code, **resume: self._sync_day_history(
+                code, base_dt, upd_stkpc_tp, **self._batch_window(watermarks.get(code), max_pages),
+                track_watermark=incremental, **resume
+            ),
+            max_workers,
+            checkpoint,
+        )
+
+    async def batch_sync_week_chart(
+        self,
+        base_dt: str,
+        upd_stkpc_tp: str = "1",
+        max_workers: Optional[int] = None,
+        incremental: bool = True,
+        checkpoint: Optional[BatchCheckpoint] = None,
+        max_pages: Optional[int] = None,
+    ) -> BatchSyncResponse:
+        """전체 활성 종목 주봉 동기화 (ka10082, 자동 페이징, incremental이면 워터마크 이후만)"""
+        stock_codes = await self._get_active_stock_codes()
+        watermarks = await self._get_watermark_dates("week") if incremental else {}
+        return await self._run_batch(
+            stock_codes,
+            lambda code, **resume: self._sync_week_history(
+                code, base_dt, upd_stkpc_tp, **self._batch_window(watermarks.get(code), max_pages),
+                track_watermark=incremental, **resume
+            ),
+            max_workers,
+            checkpoint,
+        )
+
+    async def batch_sync_month_chart(
+        self,
+        base_dt: str,
+        upd_stkpc_tp: str = "1",
+        max_workers: Optional[int] = None,
+        incremental: bool = True,
+        checkpoint: Optional[BatchCheckpoint] = None,
+        max_pages: Optional[int] = None,
+    ) -> BatchSyncResponse:
+        """전체 활성 종목 월봉 동기화 (ka10083, 자동 페이징, incremental이면 워터마크 이후만)"""
+        stock_codes = await self._get_active_stock_codes()
+        watermarks = await self._get_watermark_dates("month") if incremental else {}
+        return await self._run_batch(
+            stock_codes,
+            lambda code, **resume: self._sync_month_history(
+                code, base_dt, upd_stkpc_tp, **self._batch_window(watermarks.get(code), max_pages),
+                track_watermark=incremental, **resume
+            ),
+            max_workers,
+            checkpoint,
+        )
+
+    # ── 날짜 범위 동기화: 단건 or 전체 종목 ────────────────────────────────────
+
+    async def sync_minute_chart_range(
+        self,
+        start_dt: str,
+        end_dt: str,
+        stock_code: Optional[str] = None,
+        tic_scope: str = "1",
+        upd_stkpc_tp: str = "1",
+        max_workers: Optional[int] = None,
+    ) -> BatchSyncResponse:
+        """분봉 날짜 범위 동기화 (stock_code 미입력 시 전체 활성 종목)"""
+        stock_codes = [stock_code] if stock_code else await self._get_active_stock_codes()
+        return await self._run_batch(
+            stock_codes,
+            lambda code: self._sync_minute_history(code, tic_scope, upd_stkpc_tp, end_dt, start_dt, end_dt),
+            max_workers,
+        )
+
+    async def sync_day_chart_range(
+        self,
+        start_dt: str,
+        end_dt: str,
+        stock_code: Optional[str] = None,
+        upd_stkpc_tp: str = "1",
+        max_workers: Optional[int] = None,
+    ) -> BatchSyncResponse:
+        """일봉 날짜 범위 동기화 (stock_code 미입력 시 전체 활성 종목)"""
+        stock_codes = [stock_code] if stock_code else await self._get_active_stock_codes()
+        return await self._run_batch(
+            stock_codes,
+            lambda code: self._sync_day_history(code, end_dt, upd_stkpc_tp, start_dt, end_dt),
+            max_workers,
+        )
+
+    async def sync_week_chart_range(
+        self,
+        start_dt: str,
+        end_dt: str,
+        stock_code: Optional[str] = None,
+        upd_stkpc_tp: str = "1",
+        max_workers: Optional[int] = None,
+    ) -> BatchSyncResponse:
+        """주봉 날짜 범위 동기화 (stock_code 미입력 시 전체 활성 종목)"""
+        stock_codes = [stock_code] if stock_code else await self._get_active_stock_codes()
+        return await self._run_batch(
+            stock_codes,
+            lambda code: self._sync_week_history(code, end_dt, upd_stkpc_tp, start_dt, end_dt),
+            max_workers,
+        )
+
+    async def sync_month_chart_range(
+        self,
+        start_dt: str,
+        end_dt: str,
+        stock_code: Optional[str] = None,
+        upd_stkpc_tp: str = "1",
+        max_workers: Optional[int] = None,
+    ) -> BatchSyncResponse:
+        """월봉 날짜 범위 동기화 (stock_code 미입력 시 전체 활성 종목)"""
+        stock_codes = [stock_code] if stock_code else await self._get_active_stock_codes()
+        return await self._run_batch(
+            stock_codes,
+            lambda code: self._sync_month_history(code, end_dt, upd_stkpc_tp, start_dt, end_dt),
+            max_workers,
+        )
+
     # ── GET: DB 조회 ──────────────────────────────────────────────────────────
 
     async def get_minute_chart(self, stk_cd: str, date: str) -> MinuteChartResponse:
         """DB에서 분봉 차트 조회 (date: YYYYMMDD)"""
-        async with ChartUnitOfWork() as uow:
-            items = await uow.chart_repo.get_minute(stk_cd, date)
-        return MinuteChartResponse(items=items)
+        bars = await self.get_minute_bars(stk_cd, date)
+        return MinuteChartResponse(items=bars.to_minute_items())
 
     async def get_day_chart(self, stk_cd: str, start_dt: str, end_dt: str) -> DayChartResponse:
         """DB에서 일봉 차트 조회"""
-        async with ChartUnitOfWork() as uow:
-            items = await uow.chart_repo.get_daily(stk_cd, start_dt, end_dt)
-        return DayChartResponse(items=items)
+        bars = await self.get_day_bars(stk_cd, start_dt, end_dt)
+        return DayChartResponse(items=bars.to_period_items(DayChartItem))
 
     async def get_week_chart(self, stk_cd: str, start_dt: str, end_dt: str) -> WeekChartResponse:
         """DB에서 주봉 차트 조회"""
-        async with ChartUnitOfWork() as uow:
-            items = await uow.chart_repo.get_weekly(stk_cd, start_dt, end_dt)
-        return WeekChartResponse(items=items)
+        bars = await self.get_week_bars(stk_cd, start_dt, end_dt)
+        return WeekChartResponse(items=bars.to_period_items(WeekChartItem))
 
     async def get_month_chart(self, stk_cd: str, start_dt: str, end_dt: str) -> MonthChartResponse:
         """DB에서 월봉 차트 조회"""
+        bars = await self.get_month_bars(stk_cd, start_dt, end_dt)
+        return MonthChartResponse(items=bars.to_period_items(MonthChartItem))
+
+    async def get_day_chart_with_ma(self, stk_cd: str, start_dt: str, end_dt: str) -> DayChartWithMAResponse:
+        """DB에서 일봉 차트 조회 + 이동평균/지표 계산
+
+        start_dt 이전 선행 봉(indicators.WARMUP_BARS개)을 같은 쿼리로 함께 읽어
+        조회 구간 첫 봉부터 지표 값이 채워지도록 한다.
+        """
+        bars = await self._load_bars(
+            ("day", stk_cd, start_dt, end_dt, indicators.WARMUP_BARS),
+            lambda repo: repo.get_daily_bars(stk_cd, start_dt, end_dt, lookback=indicators.WARMUP_BARS),
+        )
+
+        close = bars.close.astype(np.float64)
+        macd_line, macd_signal, macd_hist = indicators.macd(close)
+        bb_upper, bb_middle, bb_lower = indicators.bollinger(close)
+        series = {
+            "ma5": indicators.sma(close, 5),
+            "ma10": indicators.sma(close, 10),
+            "ma20": indicators.sma(close, 20),
+            "ma60": indicators.sma(close, 60),
+            "ema12": indicators.ema(close, 12),
+            "ema26": indicators.ema(close, 26),
+            "rsi14": indicators.rsi(close, 14),
+            "macd": macd_line,
+            "macd_signal": macd_signal,
+            "macd_hist": macd_hist,
+            "bb_upper": bb_upper,
+            "bb_middle": bb_middle,
+            "bb_lower": bb_lower,
+        }
+
+        # 선행 구간을 잘라내고 응답 경계에서만 DTO로 변환
+        first = int(np.searchsorted(bars.ts, int(start_dt)))
+        columns = {
+            name: [None if np.isnan(v) else round(v, 2) for v in values[first:].tolist()]
+            for name, values in series.items()
+        }
+        items = [
+            DayChartWithMAItem(
+                **item.model_dump(),
+                **{name: column[i] for name, column in columns.items()},
+            )
+            for i, item in enumerate(bars.slice(first).to_period_items(DayChartItem))
+        ]
+        return DayChartWithMAResponse(items=items)
+
+    # ── GET: DB 조회 (컬럼형, 분석용) ──────────────────────────────────────────
+
+    async def get_minute_bars(self, stk_cd: str, date: str) -> ChartBars:
+        """DB에서 분봉을 컬럼형으로 조회"""
+        return await self._load_bars(
+            ("minute", stk_cd, date),
+            lambda repo: repo.get_minute_bars(stk_cd, date),
+        )
+
+    async def get_day_bars(self, stk_cd: str, start_dt: str, end_dt: str) -> ChartBars:
+        """DB에서 일봉을 컬럼형으로 조회"""
+        return await self._load_bars(
+            ("day", stk_cd, start_dt, end_dt),
+            lambda repo: repo.get_daily_bars(stk_cd, start_dt, end_dt),
+        )
+
+    async def get_week_bars(self, stk_cd: str, start_dt: str, end_dt: str) -> ChartBars:
+        """DB에서 주봉을 컬럼형으로 조회"""
+        return await self._load_bars(
+            ("week", stk_cd, start_dt, end_dt),
+            lambda repo: repo.get_weekly_bars(stk_cd, start_dt, end_dt),
+        )
+
+    async def get_month_bars(self, stk_cd: str, start_dt: str, end_dt: str) -> ChartBars:
+        """DB에서 월봉을 컬럼형으로 조회"""
+        return await self._load_bars(
+            ("month", stk_cd, start_dt, end_dt),
+            lambda repo: repo.get_monthly_bars(stk_cd, start_dt, end_dt),
+        )
+
+    async def _load_bars(self, key: tuple, query: Callable) -> ChartBars:
+        """차트 조회 캐시 경유 DB 조회 (키: (타임프레임, 종목코드, 조회 범위...))
+
+        봉 데이터가 저장되면 ChartUnitOfWork.commit에서 해당 (타임프레임, 종목코드)가 무효화된다.
+        """
+        bars = chart_cache.get(key)
+        if bars is not None:
+            return bars
+
+        generation = chart_cache.generation(key)
         async with ChartUnitOfWork() as uow:
-            items = await uow.chart_repo.get_monthly(stk_cd, start_dt, end_dt)
-        return MonthChartResponse(items=items)
+            bars = await query(uow.chart_repo)
+        chart_cache.set(key, bars, generation=generation)
+        return bars
+
+    # ── 배치 엔진 ─────────────────────────────────────────────────────────────
+
+    async def _get_active_stock_codes(self) -> List[str]:
+        async with ChartUnitOfWork() as uow:
+            return await uow.stock_repo.find_active_codes()
+
+    @staticmethod
+    def _batch_window(start_dt: Optional[str], max_pages: Optional[int] = None) -> dict:
+        """배치 조회 범위
+
+        워터마크가 있으면 그 일자까지 (페이지 수 제한 없음, 밀린 구간 전체),
+        없으면 최근 max_pages(기본 CHART_BATCH_MAX_PAGES) 페이지만 조회한다. 0이면 전체 이력.
+        """
+        if start_dt:
+            return {"start_dt": start_dt}
+        pages = settings.CHART_BATCH_MAX_PAGES if max_pages is None else max_pages
+        return {"start_dt": None, "max_pages": pages or None}
+
+    async def _get_watermark_dates(self, timeframe: str) -> Dict[str, str]:
+        """종목별 증분 동기화 시작 일자 (YYYYMMDD)
+
+        마지막 저장 봉은 장중/기간 중 미완성일 수 있으므로 그 봉의 일자부터 다시 받아 덮어쓴다.
+        """
+        async with ChartUnitOfWork() as uow:
+            watermarks = await uow.chart_repo.get_watermarks(timeframe)
+        return {code: last_ts[:8] for code, last_ts in watermarks.items()}
+
+    async def _run_batch(
+        self,
+        stock_codes: List[str],
+        sync_one: Callable[..., Awaitable[int]],
+        max_workers: Optional[int] = None,
+        checkpoint: Optional[BatchCheckpoint] = None,
+    ) -> BatchSyncResponse:
+        """종목별 동기화를 제한된 워커 풀로 병렬 실행
+
+        호출 간격은 ChartRepository의 토큰 버킷 제한기가 조절하므로
+        워커는 대기 없이 큐에서 다음 종목을 가져간다.
+        한 종목의 실패는 기록만 하고 나머지 종목은 계속 처리한다.
+        checkpoint가 주어지면 완료된 종목은 건너뛰고, 진행 중이던 종목은
+        sync_one(code, start_key=..., on_commit=...)로 저장된 next-key부터 이어서 조회한다.
+        """
+        started = time.monotonic()
+        result = BatchSyncResponse(total=len(stock_codes))
+        plan = await checkpoint.plan(stock_codes) if checkpoint else dict.fromkeys(stock_codes)
+        result.skipped = len(stock_codes) - len(plan)
+        # 배치 작업에서 호출된 경우 진행 상황 공유 (app.common.progress)
+        progress = current_progress.get()
+        if progress is not None:
+            progress.set_total(len(plan), result.skipped)
+        queue: asyncio.Queue = asyncio.Queue()
+        for code in plan:
+            queue.put_nowait(code)
+
+        async def worker() -> None:
+            while True:
+                try:
+                    code = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                resume = {}
+                if checkpoint:
+                    resume = {
+                        "start_key": plan[code],
+                        "on_commit": lambda page_key, code=code: checkpoint.save_page(code, page_key),
+                    }
+                try:
+                    count = await sync_one(code, **resume)
+                except Exception as e:
+                    logger.warning(f"[{code}] 차트 동기화 실패: {e}")
+                    result.failed += 1
+                    result.failed_stocks.append(code)
+                    if progress is not None:
+                        progress.item_failed()
+                    if checkpoint:
+                        await checkpoint.mark_failed(code, str(e))
+                    continue
+                result.record_count += count
+                result.success += 1
+                if progress is not None:
+                    progress.item_done(count)
+                if checkpoint:
+                    await checkpoint.mark_done(code, count)
+
+        worker_count = min(max_workers or settings.CHART_SYNC_MAX_WORKERS, len(plan))
+        await asyncio.gather(*(worker() for _ in range(worker_count)))
+
+        result.elapsed_seconds = round(time.monotonic() - started, 2)
+        logger.info(
+            f"차트 배치 동기화 완료: 대상 {result.total}, 성공 {result.success}, "
+            f"실패 {result.failed}, 건너뜀 {result.skipped}, {result.record_count}건, {result.elapsed_seconds}초"
+        )
+        return result
+
+    async def _sync_pages(
+        self,
+        stk_cd: str,
+        pages: AsyncIterator,
+        upsert: Callable,
+        date_of: Callable[[object], str],
+        start_dt: Optional[str] = None,
+        end_dt: Optional[str] = None,
+        timeframe: Optional[str] = None,
+        ts_of: Optional[Callable[[object], str]] = None,
+        on_commit: Optional[Callable[[Optional[str]], Awaitable]] = None,
+    ) -> int:
+        """연속조회 페이지를 조회/저장 파이프라인으로 적재
+
+        조회 단계는 페이지를 크기 제한 큐(CHART_SYNC_QUEUE_SIZE)에 넣고,
+        저장 단계는 큐에서 꺼낸 봉을 CHART_SYNC_COMMIT_SIZE 단위로 묶어 upsert 후 커밋한다.
+        API 대기와 DB 쓰기가 겹치고, 메모리는 큐 크기 이상 늘어나지 않는다.
+        start_dt ~ end_dt 범위 밖의 봉은 저장하지 않으며,
+        한쪽 단계가 실패하면 다른 단계를 취소하고 예외를 그대로 올린다.
+        timeframe이 주어지면 페이지 순회가 오류 없이 끝난 뒤(start_dt를 넘었거나, 이력 끝이거나,
+        max_pages 범위를 다 받은 경우) 받은 봉의 최대 시점으로 워터마크를 한 번만 전진시킨다.
+        페이지는 최신순으로 오므로, 도중에 실패한 뒤 워터마크가 앞서 있으면
+        아직 받지 않은 과거 봉을 다음 증분 실행이 영영 요청하지 않게 된다.
+        on_commit은 커밋 후 전부 저장된 마지막 페이지의 next-key로 호출된다 (재개 지점 기록).
+        """
+        ts_of = ts_of or date_of
+        queue: asyncio.Queue = asyncio.Queue(maxsize=settings.CHART_SYNC_QUEUE_SIZE)
+        commit_size = settings.CHART_SYNC_COMMIT_SIZE
+        done = object()
+
+        async def produce() -> None:
+            try:
+                async for page in pages:
+                    items = [
+                        item for item in page.items
+                        if (not start_dt or date_of(item) >= start_dt)
+                        and (not end_dt or date_of(item) <= end_dt)
+                    ]
+                    next_key = page.next_key if has_next_page(page) else None
+                    if items or on_commit:
+                        await queue.put((items, next_key))
+            finally:
+                await pages.aclose()
+            await queue.put(done)
+
+        async def consume() -> int:
+            saved = 0
+            buffer: list = []
+            # 페이지 경계: (해당 페이지까지 받은 누적 봉 수, 다음 페이지 next-key)
+            boundaries: deque = deque()
+            received = committed = 0
+            newest_ts: Optional[str] = None
+            async with ChartUnitOfWork() as uow:
+                while True:
+                    entry = await queue.get()
+                    if entry is not done:
+                        items, next_key = entry
+                        buffer.extend(items)
+                        received += len(items)
+                        boundaries.append((received, next_key))
+                    while len(buffer) >= commit_size or (entry is done and buffer):
+                        chunk, buffer = buffer[:commit_size], buffer[commit_size:]
+                        saved += await upsert(uow.chart_repo, stk_cd, chunk)
+                        if timeframe:
+                            chunk_newest = max(ts_of(item) for item in chunk)
+                            newest_ts = max(newest_ts or chunk_newest, chunk_newest)
+                        await uow.commit()
+                        committed += len(chunk)
+                        if on_commit and boundaries and boundaries[0][0] <= committed:
+                            while boundaries and boundaries[0][0] <= committed:
+                                _, resume_key = boundaries.popleft()
+                            await on_commit(resume_key)
+                    if entry is done:
+                        # 조회가 끝까지 성공한 경우에만 워터마크 전진
+                        if timeframe and newest_ts:
+                            await uow.chart_repo.advance_watermark(stk_cd, timeframe, newest_ts)
+                            await uow.commit()
+                        return saved
+
+        producer = asyncio.create_task(produce())
+        consumer = asyncio.create_task(consume())
+        try:
+            await asyncio.wait({producer, consumer}, return_when=asyncio.FIRST_EXCEPTION)
+            if producer.done() and producer.exception():
+                raise producer.exception()
+            return await consumer
+        finally:
+            for task in (producer, consumer):
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(producer, consumer, return_exceptions=True)
+
+    async def _sync_minute_history(
+        self,
+        stk_cd: str,
+        tic_scope: str,
+        upd_stkpc_tp: str,
+        base_dt: Optional[str] = None,
+        start_dt: Optional[str] = None,
+        end_dt: Optional[str] = None,
+        start_key: Optional[str] = None,
+        on_commit: Optional[Callable[[Optional[str]], Awaitable]] = None,
+        max_pages: Optional[int] = None,
+        track_watermark: bool = False,
+    ) -> int:
+        return await self._sync_pages(
+            stk_cd,
+            self.chart_repository.iter_minute_chart_pages(
+                stk_cd, tic_scope, upd_stkpc_tp, base_dt, min_dt=start_dt, max_pages=max_pages, start_key=start_key
+            ),
+            lambda repo, code, items: repo.bulk_upsert_minute(code, items),
+            lambda item: item.cntr_tm[:8],
+            start_dt,
+            end_dt,
+            timeframe="minute" if track_watermark else None,
+            ts_of=lambda item: item.cntr_tm,
+            on_commit=on_commit,
+        )
+
+    async def _sync_day_history(
+        self,
+        stk_cd: str,
+        base_dt: str,
+        upd_stkpc_tp: str,
+        start_dt: Optional[str] = None,
+        end_dt: Optional[str] = None,
+        start_key: Optional[str] = None,
+        on_commit: Optional[Callable[[Optional[str]], Awaitable]] = None,
+        max_pages: Optional[int] = None,
+        track_watermark: bool = False,
+    ) -> int:
+        return await self._sync_pages(
+            stk_cd,
+            self.chart_repository.iter_day_chart_pages(
+                stk_cd, base_dt, upd_stkpc_tp, min_dt=start_dt, max_pages=max_pages, start_key=start_key
+            ),
+            lambda repo, code, items: repo.bulk_upsert_daily(code, items),
+            lambda item: item.dt,
+            start_dt,
+            end_dt,
+            timeframe="day" if track_watermark else None,
+            on_commit=on_commit,
+        )
+
+    async def _sync_week_history(
+        self,
+        stk_cd: str,
+        base_dt: str,
+        upd_stkpc_tp: str,
+        start_dt: Optional[str] = None,
+        end_dt: Optional[str] = None,
+        start_key: Optional[str] = None,
+        on_commit: Optional[Callable[[Optional[str]], Awaitable]] = None,
+        max_pages: Optional[int] = None,
+        track_watermark: bool = False,
+    ) -> int:
+        return await self._sync_pages(
+            stk_cd,
+            self.chart_repository.iter_week_chart_pages(
+                stk_cd, base_dt, upd_stkpc_tp, min_dt=start_dt, max_pages=max_pages, start_key=start_key
+            ),
+            lambda repo, code, items: repo.bulk_upsert_weekly(code, items),
+            lambda item: item.dt,
+            start_dt,
+            end_dt,
+            timeframe="week" if track_watermark else None,
+            on_commit=on_commit,
+        )
+
+    async def _sync_month_history(
+        self,
+        stk_cd: str,
+        base_dt: str,
+        upd_stkpc_tp: str,
+        start_dt: Optional[str] = None,
+        end_dt: Optional[str] = None,
+        start_key: Optional[str] = None,
+        on_commit: Optional[Callable[[Optional[str]], Awaitable]] = None,
+        max_pages: Optional[int] = None,
+        track_watermark: bool = False,
+    ) -> int:
+        return await self._sync_pages(
+            stk_cd,
+            self.chart_repository.iter_month_chart_pages(
+                stk_cd, base_dt, upd_stkpc_tp, min_dt=start_dt, max_pages=max_pages, start_key=start_key
+            ),
+            lambda repo, code, items: repo.bulk_upsert_monthly(code, items),
+            lambda item: item.dt,
+            start_dt,
+            end_dt,
+            timeframe="month" if track_watermark else None,
+            on_commit=on_commit,
+        )
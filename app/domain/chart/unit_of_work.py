@@ -1,18 +1,26 @@
+from app.common.cache import chart_cache
 from app.db import AsyncSessionLocal
 from app.domain.unit_of_work import AbstractUnitOfWork
 from app.domain.chart.repositories.chart_db_repository import ChartDbRepository
+from app.repositories.stock_repository import StockRepository
 
 
 class ChartUnitOfWork(AbstractUnitOfWork):
     async def _begin(self):
         self.session = AsyncSessionLocal()
         self.chart_repo = ChartDbRepository(self.session)
+        self.stock_repo = StockRepository(self.session)
 
     async def _close(self):
         await self.session.close()
 
     async def commit(self):
         await self.session.commit()
+        # 커밋된 쓰기에 해당하는 차트 조회 캐시 무효화
+        for timeframe, stock_code in self.chart_repo.touched:
+            chart_cache.invalidate_group(timeframe, stock_code)
+        self.chart_repo.touched.clear()
 
     async def rollback(self):
         await self.session.rollback()
+        self.chart_repo.touched.clear()
@@ -1,7 +1,6 @@
 from typing import Optional
 
-import httpx
-
+from app.common.http_transport import KiwoomHttpTransport, http_transport
 from app.domain.rank.dto.response.trade_rank_item import TradeRankResponse, TradeRankItem
 from app.domain.rank.enums.mang_stk_incls import MangStkIncls
 from app.domain.rank.enums.market_type import MarketType
@@ -11,8 +10,9 @@ from app.config import settings
 
 class RankClient:
 
-    def __init__(self):
+    def __init__(self, transport: Optional[KiwoomHttpTransport] = None):
         self.base_url = settings.KIWOOM_BASE_URL
+        self.transport = transport or http_transport
 
     # 거래대금 상위 요청
     async def get_trade_rank(
@@ -43,18 +43,17 @@ class RankClient:
             "stex_tp": stex_tp.value,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/dostk/rkinfo",  # 실제 엔드포인트 확인 필요
-                headers=headers,
-                json=body,
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await self.transport.post(
+            f"{self.base_url}/api/dostk/rkinfo",  # 실제 엔드포인트 확인 필요
+            headers=headers,
+            json=body,
+        )
+        response.raise_for_status()
+        data = response.json()
 
         return TradeRankResponse(
-            cont_yn=data.get("cont_yn"),
-            next_key=data.get("next_key"),
+            cont_yn=response.headers.get("cont-yn"),
+            next_key=response.headers.get("next-key"),
             trde_prica_upper=[
                 TradeRankItem(**item)
                 for item in data.get("trde_prica_upper", [])
@@ -1,3 +1,6 @@
+from typing import AsyncIterator, Optional
+
+from app.common.pagination import paginate
 from app.domain.rank.dto.response.trade_rank_item import TradeRankResponse
 from app.domain.rank.enums.mang_stk_incls import MangStkIncls
 from app.domain.rank.enums.market_type import MarketType
@@ -17,10 +20,31 @@ class RankRepository:
         mrkt_tp: MarketType = MarketType.ALL,
         mang_stk_incls: MangStkIncls = MangStkIncls.EXCLUDE,
         stex_tp: StexType = StexType.KRX,
+        cont_yn: Optional[str] = None,
+        next_key: Optional[str] = None,
     ) -> TradeRankResponse:
-        return await self.rank_client.get_trade_rank(
-            access_token= await self.auth_client.ensure_token(),
-            mrkt_tp= mrkt_tp,
-            mang_stk_incls=mang_stk_incls,
-            stex_tp=stex_tp
-        )
\ No newline at end of file
+        return await self.auth_client.call_with_token(
+            lambda token: self.rank_client.get_trade_rank(
+                access_token=token,
+                mrkt_tp=mrkt_tp,
+                mang_stk_incls=mang_stk_incls,
+                stex_tp=stex_tp,
+                cont_yn=cont_yn,
+                next_key=next_key,
+            )
+        )
+
+    def iter_rank_info_pages(
+        self,
+        mrkt_tp: MarketType = MarketType.ALL,
+        mang_stk_incls: MangStkIncls = MangStkIncls.EXCLUDE,
+        stex_tp: StexType = StexType.KRX,
+        max_pages: Optional[int] = None,
+    ) -> AsyncIterator[TradeRankResponse]:
+        """거래대금 상위 연속조회 페이지 순회"""
+        return paginate(
+            lambda cont_yn, next_key: self.get_rank_info(
+                mrkt_tp, mang_stk_incls, stex_tp, cont_yn, next_key
+            ),
+            max_pages=max_pages,
+        )
@@ -22,7 +22,9 @@ class RankService:
         response = await self.rank_repository.get_rank_info(
             mrkt_tp=mrkt_tp,
             mang_stk_incls=mang_stk_incls,
-            stex_tp=stex_tp
+            stex_tp=stex_tp,
+            cont_yn=cont_yn,
+            next_key=next_key,
         )
         return response
 
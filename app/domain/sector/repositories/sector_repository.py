@@ -2,11 +2,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete, func
 from sqlalchemy.orm import selectinload
 from typing import List, Optional
+from app.common.metrics import instrument_repository
 from app.models.sector import Sector, StockSector
 from app.schemas.sector import SectorCreate, SectorUpdate, StockSectorCreate
 from app.core.logger import logger
 
 
+@instrument_repository
 class SectorRepository:
     '''섹터 Repository'''
 
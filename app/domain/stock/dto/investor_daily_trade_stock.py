@@ -26,4 +26,8 @@ class InvestorDailyTradeStockRequest(BaseModel):
     trde_tp: Optional[str] = None  # 매매구분 (1: 순매도, 2: 순매수)
     mrkt_tp: Optional[str] = None  # 시장구분 (001: 코스피, 101: 코스닥)
     invsr_tp: Optional[str] = None  # 투자자구분 (8000: 개인, 9000: 외국인, ...)
-    stex_tp: Optional[str] = None  # 거래소구분 (1: KRX, 2: NXT, 3: 통합)
\ No newline at end of file
+    stex_tp: Optional[str] = None  # 거래소구분 (1: KRX, 2: NXT, 3: 통합)
+
+class InvestorDailyTradeSyncResult(BaseModel):
+    trades: List[InvestorDailyTradeStock]  # 저장한 매매 내역
+    failed_combinations: List[str] = []  # 재시도 후에도 실패한 조합 (매매구분:시장:투자자:거래소)
@@ -1,13 +1,38 @@
-from typing import List
+from typing import List, Tuple
 
 from sqlalchemy import func, select
 from sqlalchemy.dialects.mysql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.common.metrics import instrument_repository
+from app.config import settings
 from app.domain.stock.dto.investor_daily_trade_stock import InvestorDailyTradeStock, InvestorDailyTradeStockRequest
 from app.models.investor_daily_trade import InvestorDailyTrade
 
 
+def _to_row(request: InvestorDailyTradeStockRequest, t: InvestorDailyTradeStock) -> dict:
+    return {
+        'start_date': request.strt_dt,
+        'end_date': request.end_dt,
+        'trade_type': request.trde_tp or "",
+        'market_type': request.mrkt_tp or "",
+        'investor_type': request.invsr_tp or "",
+        'exchange_type': request.stex_tp or "",
+        'stock_code': t.stk_cd,
+        'stock_name': t.stk_nm,
+        'net_sell_qty': t.netslmt_qty,
+        'net_sell_amt': t.netslmt_amt,
+        'est_avg_price': t.prsm_avg_pric,
+        'current_price': t.cur_prc,
+        'change_sign': t.pre_sig,
+        'day_change': t.pred_pre,
+        'avg_price_change': t.avg_pric_pre,
+        'change_rate': t.pre_rt,
+        'period_trade_volume': t.dt_trde_qty,
+    }
+
+
+@instrument_repository
 class InvestorDailyTradeRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -17,48 +42,38 @@ class InvestorDailyTradeRepository:
         trades: List[InvestorDailyTradeStock],
         request: InvestorDailyTradeStockRequest
     ) -> int:
-        if not trades:
-            return 0
+        return await self.bulk_upsert_many([(request, trades)])
 
+    async def bulk_upsert_many(
+        self,
+        results: List[Tuple[InvestorDailyTradeStockRequest, List[InvestorDailyTradeStock]]],
+    ) -> int:
+        """여러 조회 조합의 결과를 모아 INVESTOR_UPSERT_CHUNK_SIZE 단위로 upsert"""
         data = [
-            {
-                'start_date': request.strt_dt,
-                'end_date': request.end_dt,
-                'trade_type': request.trde_tp or "",
-                'market_type': request.mrkt_tp or "",
-                'investor_type': request.invsr_tp or "",
-                'exchange_type': request.stex_tp or "",
-                'stock_code': t.stk_cd,
-                'stock_name': t.stk_nm,
-                'net_sell_qty': t.netslmt_qty,
-                'net_sell_amt': t.netslmt_amt,
-                'est_avg_price': t.prsm_avg_pric,
-                'current_price': t.cur_prc,
-                'change_sign': t.pre_sig,
-                'day_change': t.pred_pre,
-                'avg_price_change': t.avg_pric_pre,
-                'change_rate': t.pre_rt,
-                'period_trade_volume': t.dt_trde_qty,
-            }
+            _to_row(request, t)
+            for request, trades in results
             for t in trades
         ]
+        if not data:
+            return 0
 
-        stmt = insert(InvestorDailyTrade).values(data)
-        stmt = stmt.on_duplicate_key_update(
-            stock_name=stmt.inserted.stock_name,
-            net_sell_qty=stmt.inserted.net_sell_qty,
-            net_sell_amt=stmt.inserted.net_sell_amt,
-            est_avg_price=stmt.inserted.est_avg_price,
-            current_price=stmt.inserted.current_price,
-            change_sign=stmt.inserted.change_sign,
-            day_change=stmt.inserted.day_change,
-            avg_price_change=stmt.inserted.avg_price_change,
-            change_rate=stmt.inserted.change_rate,
-            period_trade_volume=stmt.inserted.period_trade_volume,
-            updated_at=func.now(),
-        )
-
-        await self.db.execute(stmt)
+        chunk_size = max(1, settings.INVESTOR_UPSERT_CHUNK_SIZE)
+        for i in range(0, len(data), chunk_size):
+            stmt = insert(InvestorDailyTrade).values(data[i:i + chunk_size])
+            stmt = stmt.on_duplicate_key_update(
+                stock_name=stmt.inserted.stock_name,
+                net_sell_qty=stmt.inserted.net_sell_qty,
+                net_sell_amt=stmt.inserted.net_sell_amt,
+                est_avg_price=stmt.inserted.est_avg_price,
+                current_price=stmt.inserted.current_price,
+                change_sign=stmt.inserted.change_sign,
+                day_change=stmt.inserted.day_change,
+                avg_price_change=stmt.inserted.avg_price_change,
+                change_rate=stmt.inserted.change_rate,
+                period_trade_volume=stmt.inserted.period_trade_volume,
+                updated_at=func.now(),
+            )
+            await self.db.execute(stmt)
 
         return len(data)
 
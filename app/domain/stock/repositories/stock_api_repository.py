@@ -1,30 +1,45 @@
-from typing import List
+from typing import List, Optional
 
 from app.common.auth_client import AuthClient
+from app.common.rate_limiter import TokenBucketRateLimiter, kiwoom_rate_limiter
 from app.domain.stock.dto.investor_daily_trade_stock import InvestorDailyTradeStock, InvestorDailyTradeStockRequest
 from app.domain.stock.dto.stock_basic_info import StockBasicInfo, StockBasicInfoRequest
 from app.domain.stock.repositories.stock_client import StockClient
 
 
 class StockApiRepository:
-    def __init__(self, auth_client: AuthClient, stock_client: StockClient):
+    def __init__(
+        self,
+        auth_client: AuthClient,
+        stock_client: StockClient,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+    ):
         self.auth_client = auth_client
         self.stock_client = stock_client
+        self.rate_limiter = rate_limiter or kiwoom_rate_limiter
 
     async def get_stock_basic_info(
         self,
         request: StockBasicInfoRequest,
     ) -> StockBasicInfo:
-        return await self.stock_client.get_stock_basic_info(
-            access_token=await self.auth_client.ensure_token(),
-            request=request,
-        )
+        async def call(token: str) -> StockBasicInfo:
+            await self.rate_limiter.acquire()
+            return await self.stock_client.get_stock_basic_info(
+                access_token=token,
+                request=request,
+            )
+
+        return await self.auth_client.call_with_token(call)
 
     async def get_investor_daily_trade_stock(
         self,
         investorDailyTradeStockRequest: InvestorDailyTradeStockRequest
     ) -> List[InvestorDailyTradeStock]:
-        return await self.stock_client.get_investor_daily_trade_stock(
-            access_token = await self.auth_client.ensure_token(),
-            investorDailyTradeStockRequest = investorDailyTradeStockRequest
-        )
\ No newline at end of file
+        async def call(token: str) -> List[InvestorDailyTradeStock]:
+            await self.rate_limiter.acquire()
+            return await self.stock_client.get_investor_daily_trade_stock(
+                access_token = token,
+                investorDailyTradeStockRequest = investorDailyTradeStockRequest
+            )
+
+        return await self.auth_client.call_with_token(call)
\ No newline at end of file
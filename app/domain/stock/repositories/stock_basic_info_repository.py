@@ -2,10 +2,12 @@ from sqlalchemy import func, select
 from sqlalchemy.dialects.mysql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.common.metrics import instrument_repository
 from app.domain.stock.dto.stock_basic_info import StockBasicInfo
 from app.models.stock_basic_info import StockBasicInfo as StockBasicInfoModel
 
 
+@instrument_repository
 class StockBasicInfoRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -1,7 +1,8 @@
 import logging
-from typing import List
+from typing import List, Optional
 
 from app.common.api_client import ApiClient
+from app.common.http_transport import KiwoomHttpTransport
 from app.common.kiwoom_api_path import INVESTOR_DAILY_TRADE_STOCK_PATH
 from app.config import settings
 from app.domain.stock.dto.investor_daily_trade_stock import InvestorDailyTradeStockRequest, InvestorDailyTradeResponse, \
@@ -11,8 +12,13 @@ from app.domain.stock.dto.stock_basic_info import StockBasicInfoRequest, StockBa
 
 class StockClient:
 
-    def __init__(self):
+    def __init__(self, transport: Optional[KiwoomHttpTransport] = None):
         self.base_url = settings.KIWOOM_BASE_URL
+        self.api = ApiClient(
+            base_url=self.base_url,
+            default_headers={"Content-Type": "application/json"},
+            transport=transport,
+        )
 
     # 주식 기본 정보 요청
     async def get_stock_basic_info(
@@ -23,19 +29,14 @@ class StockClient:
         headers = {
             "api-id": "ka10001",
             "authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
         }
 
-        api = ApiClient(
-            base_url=self.base_url,
-            default_headers=headers,
-        )
-
-        response = await api._request(
+        response = await self.api._request(
             method="POST",
             path=INVESTOR_DAILY_TRADE_STOCK_PATH,
             response_model=StockBasicInfoResponse,
             json=request.model_dump(),
+            headers=headers,
         )
 
         return response
@@ -50,20 +51,14 @@ class StockClient:
         headers = {
             "api-id": "ka10058",
             "authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
         }
 
-        api = ApiClient(
-            base_url=self.base_url,
-            default_headers=headers,
-        )
-
-        response = await api._request(
+        response = await self.api._request(
             method= "POST",
             path= INVESTOR_DAILY_TRADE_STOCK_PATH,
             response_model=InvestorDailyTradeResponse,
-            json=investorDailyTradeStockRequest.model_dump(exclude_none=True)
+            json=investorDailyTradeStockRequest.model_dump(exclude_none=True),
+            headers=headers,
         )
 
         return response.invsr_daly_trde_stk
-
@@ -1,7 +1,16 @@
+import asyncio
+import logging
 from itertools import product
-from typing import List
+from typing import List, Optional, Tuple, Union
 
-from app.domain.stock.dto.investor_daily_trade_stock import InvestorDailyTradeStock, InvestorDailyTradeStockRequest
+from app.common.checkpoint import BatchCheckpoint
+from app.config import settings
+
+from app.domain.stock.dto.investor_daily_trade_stock import (
+    InvestorDailyTradeStock,
+    InvestorDailyTradeStockRequest,
+    InvestorDailyTradeSyncResult,
+)
 from app.domain.stock.dto.stock_basic_info import StockBasicInfo, StockBasicInfoRequest
 from app.domain.stock.repositories.stock_api_repository import StockApiRepository
 from app.domain.stock.unit_of_work import StockUnitOfWork
@@ -11,6 +20,13 @@ MARKET_TYPES = ["001", "101"]  # 코스피, 코스닥
 INVESTOR_TYPES = ["8000", "9000", "1000", "3000", "3100", "5000", "4000", "2000", "6000", "7000", "7100", "9999"]
 EXCHANGE_TYPES = ["1", "2", "3"]  # KRX, NXT, 통합
 
+logger = logging.getLogger(__name__)
+
+
+def combination_key(req: InvestorDailyTradeStockRequest) -> str:
+    """조회 조합의 체크포인트 항목 키 (매매구분:시장:투자자:거래소)"""
+    return f"{req.trde_tp}:{req.mrkt_tp}:{req.invsr_tp}:{req.stex_tp}"
+
 
 class StockService:
     def __init__(self, stock_repository: StockApiRepository):
@@ -19,17 +35,23 @@ class StockService:
     async def sync_investor_daily_trade_stock(
         self,
         investorDailyTradeStockRequest: InvestorDailyTradeStockRequest,
-    ) -> List[InvestorDailyTradeStock]:
+        checkpoint: Optional[BatchCheckpoint] = None,
+    ) -> InvestorDailyTradeSyncResult:
+        """투자자별 일별 매매 동기화 (지정하지 않은 구분은 전체 조합)
+
+        조합별로 재시도한 뒤에도 실패한 조합은 결과의 failed_combinations로 돌려주고,
+        checkpoint가 주어지면 조합 단위로 완료/실패를 기록합니다 (완료 조합은 건너뛰고
+        실패 조합은 retry-failed로 다시 조회). 모든 조합이 실패하면 예외를 올립니다.
+        """
         trde_tps = [investorDailyTradeStockRequest.trde_tp] if investorDailyTradeStockRequest.trde_tp else TRADE_TYPES
         mrkt_tps = [investorDailyTradeStockRequest.mrkt_tp] if investorDailyTradeStockRequest.mrkt_tp else MARKET_TYPES
         invsr_tps = [investorDailyTradeStockRequest.invsr_tp] if investorDailyTradeStockRequest.invsr_tp else INVESTOR_TYPES
         stex_tps = [investorDailyTradeStockRequest.stex_tp] if investorDailyTradeStockRequest.stex_tp else EXCHANGE_TYPES
 
-        all_trades: List[InvestorDailyTradeStock] = []
-
-        async with StockUnitOfWork() as uow:
-            for trde_tp, mrkt_tp, invsr_tp, stex_tp in product(trde_tps, mrkt_tps, invsr_tps, stex_tps):
-                req = InvestorDailyTradeStockRequest(
+        requests = {
+            combination_key(req): req
+            for req in (
+                InvestorDailyTradeStockRequest(
                     strt_dt=investorDailyTradeStockRequest.strt_dt,
                     end_dt=investorDailyTradeStockRequest.end_dt,
                     trde_tp=trde_tp,
@@ -37,14 +59,66 @@ class StockService:
                     invsr_tp=invsr_tp,
                     stex_tp=stex_tp,
                 )
-                trades = await self.stock_repository.get_investor_daily_trade_stock(req)
-                if trades:
-                    await uow.investor_daily_trade_repo.bulk_upsert(trades, req)
-                    all_trades.extend(trades)
-
-            await uow.commit()
-
-        return all_trades
+                for trde_tp, mrkt_tp, invsr_tp, stex_tp in product(trde_tps, mrkt_tps, invsr_tps, stex_tps)
+            )
+        }
+        if checkpoint:
+            requests = {key: requests[key] for key in await checkpoint.plan(list(requests))}
+
+        # 1. 조합별 동시 조회 (호출 간격은 공용 호출 제한기가 조절)
+        semaphore = asyncio.Semaphore(settings.INVESTOR_SYNC_CONCURRENCY)
+
+        async def fetch(req: InvestorDailyTradeStockRequest):
+            async with semaphore:
+                return await self._fetch_investor_daily_trade_with_retry(req)
+
+        fetched = dict(zip(requests, await asyncio.gather(*(fetch(req) for req in requests.values()))))
+        failed = {key: error for key, error in fetched.items() if isinstance(error, Exception)}
+        succeeded = {key: trades for key, trades in fetched.items() if key not in failed}
+        results: List[Tuple[InvestorDailyTradeStockRequest, List[InvestorDailyTradeStock]]] = [
+            (requests[key], trades) for key, trades in succeeded.items() if trades
+        ]
+
+        if failed:
+            logger.warning(f"투자자별 일별 매매 조회 실패 조합: {len(failed)}/{len(requests)} {sorted(failed)}")
+
+        # 2. 조회가 끝난 뒤 짧은 트랜잭션으로 일괄 저장
+        if results:
+            async with StockUnitOfWork() as uow:
+                await uow.investor_daily_trade_repo.bulk_upsert_many(results)
+                await uow.commit()
+
+        # 3. 저장이 끝난 뒤 조합별 완료/실패 기록
+        if checkpoint:
+            for key, trades in succeeded.items():
+                await checkpoint.mark_done(key, len(trades))
+            for key, error in failed.items():
+                await checkpoint.mark_failed(key, str(error))
+
+        if failed and not succeeded:
+            raise RuntimeError(
+                f"투자자별 일별 매매 조회가 모든 조합에서 실패했습니다 ({len(failed)}개)"
+            )
+
+        return InvestorDailyTradeSyncResult(
+            trades=[trade for _, trades in results for trade in trades],
+            failed_combinations=sorted(failed),
+        )
+
+    async def _fetch_investor_daily_trade_with_retry(
+        self,
+        req: InvestorDailyTradeStockRequest,
+    ) -> Union[List[InvestorDailyTradeStock], Exception]:
+        """조합 하나를 재시도하며 조회, 끝내 실패하면 마지막 예외를 반환"""
+        attempts = settings.INVESTOR_SYNC_MAX_RETRIES + 1
+        for attempt in range(1, attempts + 1):
+            try:
+                return await self.stock_repository.get_investor_daily_trade_stock(req)
+            except Exception as e:
+                if attempt == attempts:
+                    logger.warning(f"투자자별 일별 매매 조회 실패 ({combination_key(req)}): {e}")
+                    return e
+                await asyncio.sleep(settings.INVESTOR_SYNC_RETRY_BACKOFF * attempt)
 
     async def get_stock_basic_info(
         self,
@@ -1,11 +1,21 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api import rank_controller, stock_controller
 from app.api.v1 import auth, foreign, stock, market, sector, trading, chart
+from app.api.admin import admin_router
+from app.api.batch import batch_router
+from app.common.http_transport import http_transport
+from app.common.metrics import (
+    PrometheusMiddleware,
+    instrument_engine,
+    register_pool_collector,
+    render_latest,
+)
 from app.config import settings
 from app.containers import Container
 from app.core.logger import logger
+from app.db import engine
 from app.batch.scheduler import start_scheduler, shutdown_scheduler
 
 
@@ -34,6 +44,11 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Prometheus 지표 (라우트 응답 시간, SQL 실행 시간, 커넥션 풀)
+    app.add_middleware(PrometheusMiddleware)
+    instrument_engine(engine)
+    register_pool_collector(engine, http_transport.stats)
+
     # 라우터 등록
     app.include_router(auth.router, prefix=settings.API_V1_PREFIX)
     app.include_router(foreign.router, prefix=settings.API_V1_PREFIX)
@@ -44,6 +59,8 @@ def create_app() -> FastAPI:
     app.include_router(chart.router, prefix=settings.API_V1_PREFIX)
     app.include_router(rank_controller.router, prefix=settings.API_V1_PREFIX)
     app.include_router(stock_controller.router, prefix=settings.API_V1_PREFIX)
+    app.include_router(batch_router, prefix=settings.API_V1_PREFIX)
+    app.include_router(admin_router, prefix=settings.API_V1_PREFIX)
 
     return app
 
@@ -69,6 +86,9 @@ async def shutdown_event():
     if settings.ENABLE_BATCH_SCHEDULER:
         shutdown_scheduler()
 
+    # 키움 API 커넥션 풀 종료
+    await http_transport.aclose()
+
     logger.info(f"{settings.APP_NAME} 종료됨")
 
 
@@ -88,6 +108,13 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    '''Prometheus 지표'''
+    body, content_type = render_latest()
+    return Response(content=body, media_type=content_type)
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
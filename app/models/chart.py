@@ -146,3 +146,25 @@ class StockChartMonthly(Base):
 
     def __repr__(self):
         return f"<StockChartMonthly(code={self.stock_code}, dt={self.dt}, close={self.cur_prc})>"
+
+
+class ChartSyncWatermark(Base):
+    """종목/타임프레임별 차트 적재 최고 시점 (증분 동기화 기준)"""
+    __tablename__ = "chart_sync_watermark"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+
+    stock_code = Column(String(32), nullable=False, comment="종목코드")
+    timeframe = Column(String(10), nullable=False, comment="타임프레임 (minute, day, week, month)")
+    last_ts = Column(String(14), nullable=False, comment="저장된 마지막 봉 시점 (YYYYMMDD 또는 YYYYMMDDHHMMSS)")
+
+    created_at = Column(DateTime, default=datetime.utcnow, comment="생성일시")
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, comment="수정일시")
+
+    __table_args__ = (
+        Index('idx_chart_watermark_unique', 'timeframe', 'stock_code', unique=True),
+        {'comment': '차트 증분 동기화 워터마크'},
+    )
+
+    def __repr__(self):
+        return f"<ChartSyncWatermark(code={self.stock_code}, tf={self.timeframe}, ts={self.last_ts})>"
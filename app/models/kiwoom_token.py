@@ -0,0 +1,21 @@
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, DateTime
+
+from app.db import Base
+
+
+class KiwoomToken(Base):
+    """키움 접근 토큰 공유 저장소 (단일 행, id=1)"""
+    __tablename__ = "kiwoom_token"
+
+    id = Column(Integer, primary_key=True)
+    token = Column(String(512), nullable=False, comment="접근 토큰")
+    expires_dt = Column(String(14), comment="만료일시 (YYYYMMDDHHMMSS)")
+
+    created_at = Column(DateTime, default=datetime.utcnow, comment="생성일시")
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, comment="수정일시")
+
+    __table_args__ = (
+        {'comment': '키움 접근 토큰 (워커/배치 공유)'},
+    )
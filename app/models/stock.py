@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Boolean, Index
 from datetime import datetime
 from app.db import Base
 
@@ -16,6 +16,7 @@ class Stock(Base):
     audit_info = Column(String(100), comment="감리구분")
     reg_day = Column(String(8), comment="상장일(YYYYMMDD)")
     last_price = Column(String(20), comment="최종가격")
+    market_cap = Column(BigInteger, nullable=False, default=0, comment="시가총액(상장주식수 x 최종가격)")
     state = Column(String(256), comment="종목상태")
 
     # 시장 정보
@@ -36,5 +37,16 @@ class Stock(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, comment="수정일시")
     is_active = Column(Boolean, default=True, comment="활성화여부")
 
+    # 종목 리스트 정렬별 키셋 페이지네이션 (정렬 컬럼, id)
+    __table_args__ = (
+        Index("idx_stocks_market_cap", "market_cap", "id"),
+        Index("idx_stocks_name", "name", "id"),
+        Index("idx_stocks_created_at", "created_at", "id"),
+        Index("idx_stocks_market", "market_code", "id"),
+        Index("idx_stocks_market_market_cap", "market_code", "market_cap", "id"),
+        Index("idx_stocks_market_name", "market_code", "name", "id"),
+        Index("idx_stocks_market_created_at", "market_code", "created_at", "id"),
+    )
+
     def __repr__(self):
         return f"<Stock(code={self.code}, name={self.name}, market={self.market_name})>"
@@ -40,6 +40,8 @@ class StockTradingDaily(Base):
     # 복합 유니크 인덱스
     __table_args__ = (
         Index('idx_stock_date', 'stock_code', 'trade_date', unique=True),
+        # 날짜별 순위 키셋 페이지네이션용
+        Index('idx_trade_date_rank', 'trade_date', 'current_rank', 'id'),
     )
 
     def __repr__(self):
@@ -1,10 +1,32 @@
 # 사용 예시 (repository/stock_repository.py)
-from sqlalchemy import select
+from datetime import datetime, timedelta
+from typing import Any, Optional, Tuple
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.dialects.mysql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.common.metrics import instrument_repository
+from app.config import settings
 from app.models.stock import Stock
 
+# upsert 시 갱신할 컬럼 (종목코드는 키, 생성일시는 유지)
+_UPSERT_COLUMNS = [
+    "name", "list_count", "audit_info", "reg_day", "last_price", "state",
+    "market_code", "market_name", "up_name", "up_size_name",
+    "company_class_name", "order_warning", "nxt_enable", "is_active",
+    "market_cap",
+]
+
+# 종목 리스트 정렬 컬럼 (각각 (컬럼, id) / (market_code, 컬럼, id) 인덱스가 있음)
+_ORDER_COLUMNS = {
+    "market_cap": Stock.market_cap,
+    "name": Stock.name,
+    "created_at": Stock.created_at,
+}
 
+
+@instrument_repository
 class StockRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -16,46 +38,115 @@ class StockRepository:
         )
         return result.scalar_one_or_none()
 
-    async def get_all(self, skip: int = 0, limit: int = 100, market_code: str = None):
-        """DB에서 종목 리스트 조회
+    async def find_active_codes(self, market_code: str = None) -> list[str]:
+        """활성 종목 코드 목록 조회
 
         Args:
-            skip: 건너뛸 개수 (페이지네이션)
-            limit: 조회할 개수
-            market_code: 시장구분 (0: KOSPI, 1: KOSDAQ)
+            market_code: 시장구분 필터
 
         Returns:
-            종목 리스트
+            종목코드 리스트 (코드순)
         """
-        query = select(Stock)
+        query = select(Stock.code).where(Stock.is_active.is_(True))
 
         if market_code is not None:
             query = query.where(Stock.market_code == market_code)
 
-        query = query.offset(skip).limit(limit)
+        result = await self.db.execute(query.order_by(Stock.code))
+        return list(result.scalars().all())
+
+    async def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        market_code: str = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        order_by: Optional[str] = None,
+        after: Optional[Tuple[Any, int]] = None,
+    ):
+        """DB에서 종목 리스트 조회
 
-        result = await self.db.execute(query)
+        Args:
+            skip: 건너뛸 개수 (after가 있으면 무시)
+            limit: 조회할 개수
+            market_code: 시장구분 (0: KOSPI, 10: KOSDAQ)
+            start_date: created_at 시작일 (YYYY-MM-DD)
+            end_date: created_at 종료일 (YYYY-MM-DD, 포함)
+            order_by: 정렬 기준 (market_cap_desc, name_asc 등), 미입력 시 id 순
+            after: 키셋 커서 - 이전 페이지 마지막 행의 (정렬값, id)
+                   (정렬 컬럼, id) 인덱스를 따라 읽으므로 깊은 페이지도 앞 행을 읽고 버리지 않는다
+
+        Returns:
+            종목 리스트
+        """
+        column, descending = self.parse_order(order_by)
+        query = select(Stock).where(*self._filters(market_code, start_date, end_date))
+
+        if after is not None:
+            value, last_id = after
+            if column is Stock.id:
+                query = query.where(Stock.id < last_id if descending else Stock.id > last_id)
+            elif descending:
+                query = query.where(or_(column < value, and_(column == value, Stock.id < last_id)))
+            else:
+                query = query.where(or_(column > value, and_(column == value, Stock.id > last_id)))
+        elif skip:
+            query = query.offset(skip)
+
+        if column is Stock.id:
+            query = query.order_by(Stock.id.desc() if descending else Stock.id)
+        elif descending:
+            query = query.order_by(column.desc(), Stock.id.desc())
+        else:
+            query = query.order_by(column, Stock.id)
+
+        result = await self.db.execute(query.limit(limit))
         return result.scalars().all()
 
-    async def count_all(self, market_code: str = None):
+    async def count_all(
+        self,
+        market_code: str = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ):
         """전체 종목 수 카운트
 
         Args:
             market_code: 시장구분 필터
+            start_date: created_at 시작일 (YYYY-MM-DD)
+            end_date: created_at 종료일 (YYYY-MM-DD, 포함)
 
         Returns:
             종목 수
         """
-        from sqlalchemy import func
-
-        query = select(func.count(Stock.code))
-
-        if market_code is not None:
-            query = query.where(Stock.market_code == market_code)
-
+        query = select(func.count()).select_from(Stock).where(
+            *self._filters(market_code, start_date, end_date)
+        )
         result = await self.db.execute(query)
         return result.scalar()
 
+    @staticmethod
+    def parse_order(order_by: Optional[str]) -> Tuple[Any, bool]:
+        """정렬 기준 문자열 → (정렬 컬럼, 내림차순 여부)"""
+        if not order_by:
+            return Stock.id, False
+        name, _, direction = order_by.rpartition("_")
+        if name not in _ORDER_COLUMNS or direction not in ("asc", "desc"):
+            raise ValueError(f"지원하지 않는 정렬 기준: {order_by}")
+        return _ORDER_COLUMNS[name], direction == "desc"
+
+    @staticmethod
+    def _filters(market_code: Optional[str], start_date: Optional[str], end_date: Optional[str]) -> list:
+        conditions = []
+        if market_code is not None:
+            conditions.append(Stock.market_code == market_code)
+        if start_date:
+            conditions.append(Stock.created_at >= datetime.strptime(start_date, "%Y-%m-%d"))
+        if end_date:
+            conditions.append(Stock.created_at < datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1))
+        return conditions
+
     # async def save(self, stock: Stock):
     #     # JPA의 save()와 유사
     #     self.db.add(stock)
@@ -63,12 +154,51 @@ class StockRepository:
     #     await self.db.refresh(stock)
     #     return stock
 
-    async def save_all(self, stocks: list[Stock]):
-        self.db.add_all(stocks)
-        await self.db.commit()
+    async def bulk_upsert(self, rows: list[dict]) -> dict:
+        """종목 리스트 일괄 upsert (code 기준 INSERT ... ON DUPLICATE KEY UPDATE)
 
-        # refresh는 선택사항 (ID가 필요한 경우)
-        for stock in stocks:
-            await self.db.refresh(stock)
+        STOCK_UPSERT_CHUNK_SIZE 행씩, 청크의 기존 값을 한 번 조회해 신규/변경/동일을 구분하고
+        신규·변경 행만 한 문장으로 upsert한다 (동일 행은 쓰지 않으므로 updated_at도 그대로).
+        MySQL 영향 행 수는 드라이버의 CLIENT.FOUND_ROWS 설정에 따라 달라지므로 쓰지 않는다.
+        ORM 객체 생성/refresh를 하지 않으며, 커밋은 호출자가 한다.
 
-        return stocks
+        Returns:
+            {"inserted": 신규, "updated": 변경, "unchanged": 동일}
+        """
+        inserted = updated = unchanged = 0
+        chunk_size = settings.STOCK_UPSERT_CHUNK_SIZE
+
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            current = await self._current_values([row["code"] for row in chunk])
+
+            new_rows = [row for row in chunk if row["code"] not in current]
+            changed_rows = [
+                row for row in chunk
+                if row["code"] in current
+                and any(current[row["code"]][c] != row.get(c) for c in _UPSERT_COLUMNS)
+            ]
+            inserted += len(new_rows)
+            updated += len(changed_rows)
+            unchanged += len(chunk) - len(new_rows) - len(changed_rows)
+
+            if new_rows or changed_rows:
+                # 신규/변경 행 모두 모델 기본값과 같은 시계(UTC)로 기록 (변경 행의 created_at은 유지)
+                now = datetime.utcnow()
+                stmt = insert(Stock).values(
+                    [{**row, "created_at": now, "updated_at": now} for row in new_rows + changed_rows]
+                )
+                stmt = stmt.on_duplicate_key_update(
+                    updated_at=stmt.inserted.updated_at,
+                    **{c: stmt.inserted[c] for c in _UPSERT_COLUMNS},
+                )
+                await self.db.execute(stmt)
+
+        return {"inserted": inserted, "updated": updated, "unchanged": unchanged}
+
+    async def _current_values(self, codes: list[str]) -> dict:
+        """종목코드 → 저장된 upsert 대상 컬럼 값"""
+        result = await self.db.execute(
+            select(Stock.code, *(getattr(Stock, c) for c in _UPSERT_COLUMNS)).where(Stock.code.in_(codes))
+        )
+        return {row["code"]: row for row in result.mappings()}
@@ -1,54 +1,70 @@
-from sqlalchemy import select, func, and_, delete
+from sqlalchemy import select, func, and_, or_, delete, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.dialects.mysql import insert
-from datetime import date
-from typing import List, Optional
+from datetime import date, datetime
+from typing import List, Optional, Tuple
 
+from app.common.metrics import instrument_repository
 from app.models.stock_trading_daily import StockTradingDaily
 
 
+@instrument_repository
 class TradingRepository:
     """거래 정보 Repository"""
 
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def bulk_upsert(self, trading_data: List[dict]) -> int:
-        """일별 거래 정보 일괄 저장/업데이트
+    async def save_ranking(self, trade_date: date, trading_data: List[dict], ranked_codes: List[str]) -> int:
+        """거래일 순위 저장 (한 트랜잭션)
+
+        trading_data를 일괄 저장/업데이트하고, 같은 거래일에서 ranked_codes(이번 상위 N)에
+        없는 종목은 순위를 비웁니다(current_rank = NULL). 시세 정보는 히스토리용으로 남고
+        순위 조회에서만 빠지므로, 순위권을 벗어난 종목이 이전 순위로 남지 않습니다.
 
         Args:
-            trading_data: 거래 정보 리스트
+            trade_date: 거래일자
+            trading_data: 저장할 거래 정보 리스트 (변경된 행만 넘겨도 됨)
+            ranked_codes: 이번 순위에 든 전체 종목코드
 
         Returns:
-            저장된 개수
+            순위에서 빠진 종목 수
         """
-        if not trading_data:
-            return 0
-
-        stmt = insert(StockTradingDaily).values(trading_data)
-
-        # ON DUPLICATE KEY UPDATE
-        update_dict = {
-            'stock_name': stmt.inserted.stock_name,
-            'current_price': stmt.inserted.current_price,
-            'change_amount': stmt.inserted.change_amount,
-            'change_rate': stmt.inserted.change_rate,
-            'trading_amount': stmt.inserted.trading_amount,
-            'trading_volume': stmt.inserted.trading_volume,
-            'previous_trading_volume': stmt.inserted.previous_trading_volume,
-            'sell_bid': stmt.inserted.sell_bid,
-            'buy_bid': stmt.inserted.buy_bid,
-            'current_rank': stmt.inserted.current_rank,
-            'previous_rank': stmt.inserted.previous_rank,
-            'updated_at': func.now()
-        }
-
-        stmt = stmt.on_duplicate_key_update(**update_dict)
-
-        result = await self.db.execute(stmt)
+        if trading_data:
+            stmt = insert(StockTradingDaily).values(trading_data)
+
+            # ON DUPLICATE KEY UPDATE
+            update_dict = {
+                'stock_name': stmt.inserted.stock_name,
+                'current_price': stmt.inserted.current_price,
+                'change_amount': stmt.inserted.change_amount,
+                'change_rate': stmt.inserted.change_rate,
+                'trading_amount': stmt.inserted.trading_amount,
+                'trading_volume': stmt.inserted.trading_volume,
+                'previous_trading_volume': stmt.inserted.previous_trading_volume,
+                'sell_bid': stmt.inserted.sell_bid,
+                'buy_bid': stmt.inserted.buy_bid,
+                'current_rank': stmt.inserted.current_rank,
+                'previous_rank': stmt.inserted.previous_rank,
+                'updated_at': func.now()
+            }
+
+            stmt = stmt.on_duplicate_key_update(**update_dict)
+            await self.db.execute(stmt)
+
+        # 순위권 밖으로 밀려난 종목 (이미 비워진 행은 건드리지 않음)
+        result = await self.db.execute(
+            update(StockTradingDaily)
+            .where(
+                StockTradingDaily.trade_date == trade_date,
+                StockTradingDaily.current_rank.is_not(None),
+                StockTradingDaily.stock_code.not_in(ranked_codes),
+            )
+            .values(current_rank=None, updated_at=func.now())
+        )
         await self.db.commit()
 
-        return len(trading_data)
+        return result.rowcount
 
     async def get_by_date_and_code(self, trade_date: date, stock_code: str) -> Optional[StockTradingDaily]:
         """특정 날짜의 특정 종목 거래 정보 조회
@@ -73,27 +89,65 @@ class TradingRepository:
         self,
         trade_date: date,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after: Optional[Tuple[int, int]] = None
     ) -> List[StockTradingDaily]:
         """특정 날짜의 거래대금 순위 조회
 
         Args:
             trade_date: 거래일자
-            skip: 건너뛸 개수
+            skip: 건너뛸 개수 (after가 있으면 무시)
             limit: 조회 개수
+            after: 키셋 커서 - 이전 페이지 마지막 행의 (현재순위, id)
 
         Returns:
-            거래 정보 리스트 (순위순)
+            거래 정보 리스트 (순위순, 순위권을 벗어난 종목 제외)
         """
         stmt = select(StockTradingDaily).where(
-            StockTradingDaily.trade_date == trade_date
-        ).order_by(
-            StockTradingDaily.current_rank.asc()
-        ).offset(skip).limit(limit)
+            StockTradingDaily.trade_date == trade_date,
+            StockTradingDaily.current_rank.is_not(None)
+        )
+
+        if after is not None:
+            last_rank, last_id = after
+            stmt = stmt.where(or_(
+                StockTradingDaily.current_rank > last_rank,
+                and_(StockTradingDaily.current_rank == last_rank, StockTradingDaily.id > last_id)
+            ))
+        elif skip:
+            stmt = stmt.offset(skip)
+
+        # (trade_date, current_rank, id) 인덱스 순서대로 읽음
+        stmt = stmt.order_by(
+            StockTradingDaily.current_rank.asc(),
+            StockTradingDaily.id.asc()
+        ).limit(limit)
 
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
+    async def get_latest_trade_date(self) -> Optional[date]:
+        """저장된 가장 최근 거래일자 조회
+
+        Returns:
+            거래일자 (데이터가 없으면 None)
+        """
+        stmt = select(func.max(StockTradingDaily.trade_date))
+        result = await self.db.execute(stmt)
+        return result.scalar()
+
+    async def get_ranking_version(self, trade_date: date) -> Tuple[Optional[datetime], int]:
+        """특정 날짜 순위의 변경 확인용 (최종 수정일시, 건수)
+
+        (trade_date, current_rank, id) 인덱스로 해당 날짜 행만 읽으므로 가볍습니다.
+        """
+        stmt = select(func.max(StockTradingDaily.updated_at), func.count()).where(
+            StockTradingDaily.trade_date == trade_date
+        )
+        result = await self.db.execute(stmt)
+        updated_at, count = result.one()
+        return updated_at, count
+
     async def count_by_date(self, trade_date: date) -> int:
         """특정 날짜의 전체 개수 조회
 
@@ -101,10 +155,11 @@ class TradingRepository:
             trade_date: 거래일자
 
         Returns:
-            전체 개수
+            전체 개수 (순위권을 벗어난 종목 제외)
         """
         stmt = select(func.count(StockTradingDaily.id)).where(
-            StockTradingDaily.trade_date == trade_date
+            StockTradingDaily.trade_date == trade_date,
+            StockTradingDaily.current_rank.is_not(None)
         )
         result = await self.db.execute(stmt)
         return result.scalar()
@@ -115,7 +170,8 @@ class TradingRepository:
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
         skip: int = 0,
-        limit: int = 30
+        limit: int = 30,
+        before: Optional[date] = None
     ) -> List[StockTradingDaily]:
         """특정 종목의 거래 히스토리 조회
 
@@ -123,8 +179,9 @@ class TradingRepository:
             stock_code: 종목코드
             start_date: 시작일자
             end_date: 종료일자
-            skip: 건너뛸 개수
+            skip: 건너뛸 개수 (before가 있으면 무시)
             limit: 조회 개수
+            before: 키셋 커서 - 이전 페이지 마지막 행의 거래일자 (종목당 날짜는 유일)
 
         Returns:
             거래 정보 리스트 (날짜 역순)
@@ -135,12 +192,18 @@ class TradingRepository:
             conditions.append(StockTradingDaily.trade_date >= start_date)
         if end_date:
             conditions.append(StockTradingDaily.trade_date <= end_date)
+        if before:
+            conditions.append(StockTradingDaily.trade_date < before)
 
+        # (stock_code, trade_date) 유니크 인덱스 역순으로 읽음
         stmt = select(StockTradingDaily).where(
             and_(*conditions)
         ).order_by(
             StockTradingDaily.trade_date.desc()
-        ).offset(skip).limit(limit)
+        )
+        if skip and not before:
+            stmt = stmt.offset(skip)
+        stmt = stmt.limit(limit)
 
         result = await self.db.execute(stmt)
         return result.scalars().all()
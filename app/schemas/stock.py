@@ -211,6 +211,7 @@ class StockResponse(BaseModel):
     audit_info: Optional[str] = Field(None, description="감리구분")
     reg_day: Optional[str] = Field(None, description="상장일(YYYYMMDD)")
     last_price: Optional[str] = Field(None, description="최종가격")
+    market_cap: int = Field(0, description="시가총액(상장주식수 x 최종가격)")
     state: Optional[str] = Field(None, description="종목상태")
     market_code: Optional[str] = Field(None, description="시장코드(0:코스피,10:코스닥)")
     market_name: Optional[str] = Field(None, description="시장명")
@@ -227,6 +228,7 @@ class StockResponse(BaseModel):
 class StockListResponse(BaseModel):
     '''종목 리스트 응답'''
     stocks: list[StockResponse]
-    total: int = Field(..., description="전체 종목 수")
+    total: Optional[int] = Field(None, description="전체 종목 수 (캐시된 값일 수 있음, with_total=false면 생략)")
     skip: int = Field(..., description="건너뛴 개수")
     limit: int = Field(..., description="조회한 개수")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 없음)")
@@ -52,7 +52,8 @@ class TradingRankingResponse(BaseModel):
     """거래대금 순위 응답"""
     trade_date: date = Field(..., description="거래일자")
     rankings: list[StockTradingDailyResponse]
-    total_count: int = Field(..., description="전체 개수")
+    total_count: Optional[int] = Field(None, description="전체 개수 (with_total=false면 생략)")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 없음)")
 
 
 class StockTradingHistoryResponse(BaseModel):
@@ -60,4 +61,5 @@ class StockTradingHistoryResponse(BaseModel):
     stock_code: str = Field(..., description="종목코드")
     stock_name: str = Field(..., description="종목명")
     history: list[StockTradingDailyResponse]
-    total_count: int = Field(..., description="전체 개수")
+    total_count: Optional[int] = Field(None, description="전체 개수 (with_total=false면 생략)")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 없음)")
@@ -1,29 +1,89 @@
+import asyncio
+from datetime import datetime
+from typing import Optional
+
 from app.clients.kiwoom_api_client import kiwoom_api_client
+from app.common.cache import stock_count_cache
+from app.common.cursor import decode_cursor, encode_cursor
+from app.common.rate_limiter import kiwoom_rate_limiter
 from app.config import settings
-from app.models.stock import Stock
+from app.core.logger import logger
 from app.repositories.stock_repository import StockRepository
 from app.services.auth_service import auth_service
+from app.schemas.enums import MarketCode
 from app.schemas.stock import StockResponse, StockListResponse
 
+# 종목 리스트 동기화 기본 대상 시장
+DEFAULT_SYNC_MARKETS = [MarketCode.KOSPI.value, MarketCode.KOSDAQ.value]
+
+
+def _to_int(value: Optional[str]) -> int:
+    """키움 숫자 문자열(0 패딩, +/- 부호 포함) → 절댓값 정수"""
+    digits = (value or "").strip().lstrip("+-")
+    return int(digits) if digits.isdigit() else 0
+
 
 class StockService:
     def __init__(self, repo: StockRepository) :
         self.base_url = settings.KIWOOM_BASE_URL
         self.repo = repo
 
-    async def get_stock_list(self, skip: int = 0, limit: int = 100, market_code: str = None):
+    async def get_stock_list(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        market_code: str = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        order_by: Optional[str] = None,
+        cursor: Optional[str] = None,
+        with_total: bool = True,
+    ):
         """DB에서 종목 리스트 조회
 
         Args:
-            skip: 건너뛸 개수
+            skip: 건너뛸 개수 (cursor가 있으면 무시)
             limit: 조회할 개수
             market_code: 시장구분 (0: KOSPI, 10: KOSDAQ, 등)
+            start_date: 조회 시작일 (YYYY-MM-DD, created_at 기준)
+            end_date: 조회 종료일 (YYYY-MM-DD, created_at 기준)
+            order_by: 정렬 기준
+            cursor: 이전 응답의 next_cursor (키셋 페이지네이션)
+            with_total: 전체 개수 포함 여부 (STOCK_COUNT_CACHE_TTL_SECONDS 동안 캐시)
 
         Returns:
-            종목 리스트와 전체 개수
+            종목 리스트, 전체 개수, 다음 페이지 커서
         """
-        stocks = await self.repo.get_all(skip=skip, limit=limit, market_code=market_code)
-        total = await self.repo.count_all(market_code=market_code)
+        after = None
+        if cursor:
+            payload = decode_cursor(cursor)
+            if payload.get("o") != (order_by or ""):
+                raise ValueError("커서와 정렬 기준이 다릅니다")
+            after = (self._cursor_value(order_by, payload.get("v")), int(payload["id"]))
+
+        # 한 건 더 읽어 다음 페이지 존재 여부 판단
+        stocks = list(await self.repo.get_all(
+            skip=skip,
+            limit=limit + 1,
+            market_code=market_code,
+            start_date=start_date,
+            end_date=end_date,
+            order_by=order_by,
+            after=after,
+        ))
+
+        next_cursor = None
+        if len(stocks) > limit:
+            stocks = stocks[:limit]
+            column, _ = self.repo.parse_order(order_by)
+            last = stocks[-1]
+            next_cursor = encode_cursor({
+                "o": order_by or "",
+                "v": getattr(last, column.key),
+                "id": last.id,
+            })
+
+        total = await self._count_stocks(market_code, start_date, end_date) if with_total else None
 
         # Stock 모델을 StockResponse 스키마로 변환
         stock_responses = [StockResponse.model_validate(stock) for stock in stocks]
@@ -31,61 +91,92 @@ class StockService:
         return StockListResponse(
             stocks=stock_responses,
             total=total,
-            skip=skip,
-            limit=limit
+            skip=0 if cursor else skip,
+            limit=limit,
+            next_cursor=next_cursor,
         )
 
-    async def sync_stock_list(self, market_code: str = "0"):
+    async def _count_stocks(self, market_code: Optional[str], start_date: Optional[str], end_date: Optional[str]) -> int:
+        """전체 개수 (짧은 TTL 캐시, 종목 동기화 시 무효화)"""
+        key = ("stocks", market_code, start_date, end_date)
+        total = stock_count_cache.get(key)
+        if total is None:
+            generation = stock_count_cache.generation(key)
+            total = await self.repo.count_all(market_code=market_code, start_date=start_date, end_date=end_date)
+            stock_count_cache.set(key, total, generation=generation)
+        return total
+
+    @staticmethod
+    def _cursor_value(order_by: Optional[str], value):
+        """커서의 정렬값을 컬럼 타입으로 복원"""
+        if order_by and order_by.startswith("created_at") and value is not None:
+            return datetime.fromisoformat(value)
+        return value
+
+    async def sync_stock_list(self, market_codes: Optional[list[str]] = None):
         """키움 API에서 종목 리스트를 가져와 DB에 동기화
 
+        시장별 조회(ka10099)는 동시에 수행하고(호출 간격은 공용 호출 제한기가 조절),
+        저장은 종목코드 기준 일괄 upsert로 청크당 한 문장만 실행합니다.
+
         Args:
-            market_code: 시장구분 (0: KOSPI, 10: KOSDAQ, 등)
+            market_codes: 시장구분 목록 (0: KOSPI, 10: KOSDAQ, 등), 미입력 시 KOSPI + KOSDAQ
 
         Returns:
-            동기화된 종목 수
+            시장별 조회 건수와 신규/변경/동일 건수
         """
+        market_codes = market_codes or DEFAULT_SYNC_MARKETS
         token = await auth_service.ensure_token()
 
-        print(f"token: {token}")
-        response = await kiwoom_api_client.get_stock_llist(
-            auth_headers={
-                "token": token,
-                "api_id": "ka10099"
-            },
-            mrkt_tp=market_code
-        )
-
-        print(f"response: {response}")
-
-        stock_list = response.get('output', []) if isinstance(response, dict) else response
-
-        # 3. DTO → Entity 변환
-        stocks = [
-            Stock(
-                code=item.code,
-                name=item.name,
-                list_count=item.listCount,
-                audit_info=item.auditInfo,
-                reg_day=item.regDay,
-                last_price=item.lastPrice,
-                state=item.state,
-                market_code=item.marketCode,
-                market_name=item.marketName,
-                up_name=item.upName,
-                up_size_name=item.upSizeName,
-                company_class_name=item.companyClassName,
-                order_warning=item.orderWarning,
-                nxt_enable=item.nxtEnable
+        async def fetch(market_code: str) -> list:
+            await kiwoom_rate_limiter.acquire()
+            response = await kiwoom_api_client.get_stock_llist(
+                auth_headers={
+                    "token": token,
+                    "api_id": "ka10099"
+                },
+                mrkt_tp=market_code
             )
-            for item in stock_list
-        ]
-
-        # 4. bulk insert (await 필수!)
-        saved_stocks = await self.repo.save_all(stocks)
-
+            return response.get('output', []) if isinstance(response, dict) else response
+
+        stock_lists = await asyncio.gather(*(fetch(code) for code in market_codes))
+
+        # DTO → upsert 행 변환 (여러 시장에 중복된 종목은 마지막 값 사용)
+        rows = {}
+        for stock_list in stock_lists:
+            for item in stock_list:
+                rows[item.code] = {
+                    "code": item.code,
+                    "name": item.name,
+                    "list_count": item.listCount,
+                    "audit_info": item.auditInfo,
+                    "reg_day": item.regDay,
+                    "last_price": item.lastPrice,
+                    "state": item.state,
+                    "market_code": item.marketCode,
+                    "market_name": item.marketName,
+                    "up_name": item.upName,
+                    "up_size_name": item.upSizeName,
+                    "company_class_name": item.companyClassName,
+                    "order_warning": item.orderWarning,
+                    "nxt_enable": item.nxtEnable,
+                    "is_active": True,
+                    "market_cap": _to_int(item.listCount) * _to_int(item.lastPrice),
+                }
+
+        counts = await self.repo.bulk_upsert(list(rows.values()))
+        await self.repo.db.commit()
+        stock_count_cache.invalidate_group("stocks")
+
+        logger.info(
+            f"종목 리스트 동기화 완료: {len(rows)}건 (신규 {counts['inserted']}, "
+            f"변경 {counts['updated']}, 동일 {counts['unchanged']})"
+        )
         return {
-            "synced_count": len(saved_stocks),
-            "market_code": market_code
+            "synced_count": len(rows),
+            "market_codes": market_codes,
+            "fetched": {code: len(stock_list) for code, stock_list in zip(market_codes, stock_lists)},
+            **counts,
         }
 
 
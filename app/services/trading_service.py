@@ -1,7 +1,11 @@
 from datetime import date, datetime
-from typing import Optional, List
+from typing import Awaitable, Callable, Optional, List, Tuple
 from decimal import Decimal
 
+from app.common.cache import trading_count_cache
+from app.common.cursor import decode_cursor, encode_cursor
+from app.common.ranking_snapshot import RankingSnapshot, ranking_snapshot_store
+from app.config import settings
 from app.repositories.trading_repository import TradingRepository
 from app.domain.rank.services.rank_service import RankService
 from app.domain.rank.enums.market_type import MarketType
@@ -14,6 +18,12 @@ from app.schemas.trading import (
     StockTradingDailyResponse
 )
 
+# 최신 순위 스냅샷에 담을 최대 행 수 (동기화 limit 상한과 같음)
+LATEST_SNAPSHOT_MAX_ROWS = 500
+
+# 장중 갱신 시 변경 여부를 비교하는 컬럼 (순위, 현재가, 거래대금)
+INTRADAY_DIFF_FIELDS = ('current_rank', 'current_price', 'trading_amount')
+
 
 class TradingService:
     """거래 정보 서비스"""
@@ -61,6 +71,104 @@ class TradingService:
             )
 
         # 3. DB 저장 형식으로 변환
+        trading_data, total_trading_amount = self._to_rows(top_items, trade_date)
+
+        # 4. DB에 일괄 저장/업데이트 (이번 상위 N에 없는 같은 날짜 종목은 순위 해제)
+        await self.repo.save_ranking(trade_date, trading_data, [row['stock_code'] for row in trading_data])
+        synced_count = len(trading_data)
+
+        # 해당 날짜 순위 건수와 저장된 종목들의 히스토리 건수 무효화
+        trading_count_cache.invalidate_group("ranking", trade_date)
+        for row in trading_data:
+            trading_count_cache.invalidate_group("history", row['stock_code'])
+
+        # 5. 최신 순위 스냅샷 갱신 (조회 API는 DB 대신 스냅샷을 반환)
+        await self.publish_latest_snapshot(trade_date)
+
+        return TradingSyncResponse(
+            trade_date=trade_date,
+            synced_count=synced_count,
+            total_trading_amount=total_trading_amount
+        )
+
+    async def sync_intraday_ranking(
+        self,
+        trade_date: Optional[date] = None,
+        limit: int = 100,
+        market_type: MarketType = MarketType.ALL,
+        include_managed: MangStkIncls = MangStkIncls.EXCLUDE
+    ) -> TradingSyncResponse:
+        """장중 거래대금 순위 갱신 (변경된 행만 저장)
+
+        현재 게시된 최신 순위 스냅샷을 직전 상태로 보고, 순위/현재가/거래대금 중 하나라도
+        바뀐 종목(새로 진입한 종목 포함)만 한 번의 일괄 upsert로 저장합니다.
+        상위 N에서 빠진 종목은 같은 트랜잭션에서 순위를 비워 순위 조회와 스냅샷에서 제외합니다.
+        바뀐 행도 빠진 종목도 없으면 DB에 쓰지 않고 스냅샷도 그대로 둡니다.
+
+        Args:
+            trade_date: 거래일자 (None이면 오늘)
+            limit: 상위 N개만 비교/저장
+            market_type: 시장 유형
+            include_managed: 관리종목 포함 여부
+
+        Returns:
+            동기화 결과 (synced_count는 실제 저장한 행 수)
+        """
+        if trade_date is None:
+            trade_date = date.today()
+
+        rank_response = await self.rank_service.get_top_trading_volume_stocks(
+            mrkt_tp=market_type,
+            mang_stk_incls=include_managed,
+            stex_tp=StexType.KRX
+        )
+        trading_data, total_trading_amount = self._to_rows(
+            rank_response.trde_prica_upper[:limit], trade_date
+        )
+        # 빈 응답을 "전 종목이 순위권 밖"으로 해석하지 않도록 아무것도 쓰지 않음
+        if not trading_data:
+            return TradingSyncResponse(trade_date=trade_date, synced_count=0, total_trading_amount=0)
+
+        # 직전 상태: 같은 거래일의 스냅샷 (재시작 직후면 DB에서 한 번 적재, 날짜가 바뀌었으면 전체 저장)
+        snapshot = await self.get_latest_snapshot()
+        previous = {}
+        if snapshot is not None and snapshot.trade_date == trade_date:
+            previous = {row['stock_code']: row for row in snapshot.rankings}
+
+        changed = [
+            row for row in trading_data
+            if row['stock_code'] not in previous
+            or any(row[field] != previous[row['stock_code']][field] for field in INTRADAY_DIFF_FIELDS)
+        ]
+        ranked_codes = [row['stock_code'] for row in trading_data]
+        exited = set(previous) - set(ranked_codes)
+
+        if changed or exited:
+            # 바뀐 행 upsert와 순위권 밖으로 밀려난 종목의 순위 해제를 한 트랜잭션으로
+            await self.repo.save_ranking(trade_date, changed, ranked_codes)
+
+            # 새로 진입하거나 빠진 종목이 있을 때만 건수가 바뀜
+            new_codes = [row['stock_code'] for row in changed if row['stock_code'] not in previous]
+            if new_codes or exited:
+                trading_count_cache.invalidate_group("ranking", trade_date)
+                for code in new_codes:
+                    trading_count_cache.invalidate_group("history", code)
+
+            await self.publish_latest_snapshot(trade_date)
+
+        return TradingSyncResponse(
+            trade_date=trade_date,
+            synced_count=len(changed),
+            total_trading_amount=total_trading_amount
+        )
+
+    @staticmethod
+    def _to_rows(top_items: list, trade_date: date) -> Tuple[List[dict], int]:
+        """키움 순위 항목 → DB 저장 형식 (변환 실패 항목은 건너뜀)
+
+        Returns:
+            (저장용 행 리스트, 총 거래대금)
+        """
         trading_data = []
         total_trading_amount = 0
 
@@ -99,33 +207,51 @@ class TradingService:
                 print(f"데이터 변환 오류 - 종목: {item.stk_nm}, 에러: {e}")
                 continue
 
-        # 4. DB에 일괄 저장/업데이트
-        synced_count = await self.repo.bulk_upsert(trading_data)
-
-        return TradingSyncResponse(
-            trade_date=trade_date,
-            synced_count=synced_count,
-            total_trading_amount=total_trading_amount
-        )
+        return trading_data, total_trading_amount
 
     async def get_ranking_by_date(
         self,
         trade_date: date,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        with_total: bool = True
     ) -> TradingRankingResponse:
         """특정 날짜의 거래대금 순위 조회
 
         Args:
             trade_date: 거래일자
-            skip: 건너뛸 개수
+            skip: 건너뛸 개수 (cursor가 있으면 무시)
             limit: 조회 개수
+            cursor: 이전 응답의 next_cursor
+            with_total: 전체 개수 포함 여부
 
         Returns:
             순위 정보
         """
-        rankings = await self.repo.get_ranking_by_date(trade_date, skip, limit)
-        total = await self.repo.count_by_date(trade_date)
+        after = None
+        if cursor:
+            payload = decode_cursor(cursor)
+            if payload.get("d") != trade_date.isoformat():
+                raise ValueError("커서와 거래일자가 다릅니다")
+            after = (int(payload["r"]), int(payload["id"]))
+
+        # 한 건 더 읽어 다음 페이지 존재 여부 판단
+        rankings = list(await self.repo.get_ranking_by_date(trade_date, skip, limit + 1, after))
+
+        next_cursor = None
+        if len(rankings) > limit:
+            rankings = rankings[:limit]
+            last = rankings[-1]
+            next_cursor = encode_cursor({"d": trade_date.isoformat(), "r": last.current_rank, "id": last.id})
+
+        total = None
+        if with_total:
+            total = await self._cached_count(
+                ("ranking", trade_date),
+                trade_date,
+                lambda: self.repo.count_by_date(trade_date)
+            )
 
         ranking_responses = [
             StockTradingDailyResponse.model_validate(r) for r in rankings
@@ -134,7 +260,8 @@ class TradingService:
         return TradingRankingResponse(
             trade_date=trade_date,
             rankings=ranking_responses,
-            total_count=total
+            total_count=total,
+            next_cursor=next_cursor
         )
 
     async def get_stock_history(
@@ -143,7 +270,9 @@ class TradingService:
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
         skip: int = 0,
-        limit: int = 30
+        limit: int = 30,
+        cursor: Optional[str] = None,
+        with_total: bool = True
     ) -> StockTradingHistoryResponse:
         """특정 종목의 거래 히스토리 조회
 
@@ -151,25 +280,44 @@ class TradingService:
             stock_code: 종목코드
             start_date: 시작일자
             end_date: 종료일자
-            skip: 건너뛸 개수
+            skip: 건너뛸 개수 (cursor가 있으면 무시)
             limit: 조회 개수
+            cursor: 이전 응답의 next_cursor
+            with_total: 전체 개수 포함 여부
 
         Returns:
             종목별 거래 히스토리
         """
-        history = await self.repo.get_stock_history(
-            stock_code, start_date, end_date, skip, limit
-        )
-        total = await self.repo.count_stock_history(
-            stock_code, start_date, end_date
-        )
+        before = None
+        if cursor:
+            payload = decode_cursor(cursor)
+            if payload.get("s") != stock_code:
+                raise ValueError("커서와 종목코드가 다릅니다")
+            before = date.fromisoformat(payload["d"])
+
+        history = list(await self.repo.get_stock_history(
+            stock_code, start_date, end_date, skip, limit + 1, before
+        ))
+
+        next_cursor = None
+        if len(history) > limit:
+            history = history[:limit]
+            next_cursor = encode_cursor({"s": stock_code, "d": history[-1].trade_date.isoformat()})
+
+        total = None
+        if with_total:
+            total = await self._cached_count(
+                ("history", stock_code, start_date, end_date),
+                end_date,
+                lambda: self.repo.count_stock_history(stock_code, start_date, end_date)
+            )
 
         if not history:
             return StockTradingHistoryResponse(
                 stock_code=stock_code,
                 stock_name="",
                 history=[],
-                total_count=0
+                total_count=total
             )
 
         history_responses = [
@@ -180,5 +328,79 @@ class TradingService:
             stock_code=stock_code,
             stock_name=history[0].stock_name if history else "",
             history=history_responses,
-            total_count=total
+            total_count=total,
+            next_cursor=next_cursor
         )
+
+    async def publish_latest_snapshot(self, trade_date: date) -> Optional[RankingSnapshot]:
+        """trade_date의 순위를 읽어 최신 순위 스냅샷으로 게시
+
+        현재 스냅샷보다 이전 거래일이면 게시하지 않습니다.
+
+        Returns:
+            게시된 스냅샷 (게시하지 않았으면 None)
+        """
+        current = ranking_snapshot_store.get()
+        if current is not None and trade_date < current.trade_date:
+            return None
+
+        # 버전을 먼저 읽어야 그 사이 다른 프로세스가 쓴 변경이 다음 확인에서 드러난다
+        version = (trade_date, *await self.repo.get_ranking_version(trade_date))
+        rows = await self.repo.get_ranking_by_date(trade_date, 0, LATEST_SNAPSHOT_MAX_ROWS)
+        snapshot = RankingSnapshot.build(
+            trade_date,
+            [StockTradingDailyResponse.model_validate(r).model_dump() for r in rows],
+            version
+        )
+        return snapshot if ranking_snapshot_store.publish(snapshot) else None
+
+    async def get_latest_snapshot(self) -> Optional[RankingSnapshot]:
+        """최신 순위 스냅샷 조회
+
+        게시된 스냅샷이 TRADING_SNAPSHOT_TTL_SECONDS 안에 DB와 비교된 것이면 DB를 조회하지 않습니다.
+        그보다 오래됐으면 최근 거래일과 그 날짜의 (최종 수정일시, 건수)만 가볍게 조회해서,
+        다른 프로세스(배치 워커 등)가 동기화해 버전이 바뀐 경우에만 다시 만듭니다.
+        재시작 직후처럼 스냅샷이 없으면 DB의 가장 최근 거래일로 만들어 둡니다.
+
+        Returns:
+            스냅샷 (저장된 순위가 없으면 None)
+        """
+        snapshot = ranking_snapshot_store.get()
+        if snapshot is not None and ranking_snapshot_store.is_fresh(settings.TRADING_SNAPSHOT_TTL_SECONDS):
+            return snapshot
+
+        # 동시에 들어온 요청은 확인이 끝날 때까지 현재 스냅샷을 그대로 사용
+        ranking_snapshot_store.mark_checked()
+        latest_date = await self.repo.get_latest_trade_date()
+        if latest_date is None:
+            return snapshot
+
+        if snapshot is not None and snapshot.trade_date == latest_date:
+            version = (latest_date, *await self.repo.get_ranking_version(latest_date))
+            if version == snapshot.version:
+                return snapshot
+
+        await self.publish_latest_snapshot(latest_date)
+        return ranking_snapshot_store.get()
+
+    @staticmethod
+    async def _cached_count(
+        key: tuple,
+        last_date: Optional[date],
+        count: Callable[[], Awaitable[int]]
+    ) -> int:
+        """건수 조회 (trading_count_cache)
+
+        지난 날짜까지만 보는 건수는 동기화 후 바뀌지 않으므로 만료 없이 보관하고,
+        오늘(또는 기간 끝 미지정)이 포함되면 TRADING_COUNT_CACHE_TTL_SECONDS 동안만 보관합니다.
+        어느 쪽이든 해당 날짜/종목을 다시 동기화하면 무효화됩니다.
+        """
+        total = trading_count_cache.get(key)
+        if total is None:
+            generation = trading_count_cache.generation(key)
+            total = await count()
+            immutable = last_date is not None and last_date < date.today()
+            trading_count_cache.set(
+                key, total, ttl=float("inf") if immutable else None, generation=generation
+            )
+        return total
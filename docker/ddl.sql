@@ -21,6 +21,23 @@ CREATE TABLE data_sync_schedule (
     INDEX idx_is_enabled (is_enabled)
 );
 
+-- 배치 항목별 체크포인트 (중단된 실행 재개 / 실패 항목 재시도)
+CREATE TABLE batch_checkpoint (
+    id BIGINT PRIMARY KEY AUTO_INCREMENT,
+
+    table_name VARCHAR(100) NOT NULL COMMENT '대상 테이블명',
+    run_key VARCHAR(32) NOT NULL COMMENT '실행 단위 (예: 기준일자)',
+    item_key VARCHAR(32) NOT NULL COMMENT '처리 항목 (예: 종목코드)',
+    status VARCHAR(20) NOT NULL COMMENT '상태(RUNNING/DONE/FAILED)',
+    page_key VARCHAR(255) COMMENT '이어서 조회할 next-key',
+    record_count INT DEFAULT 0 COMMENT '저장 건수',
+    error_message TEXT COMMENT '에러 메시지',
+    updated_at DATETIME COMMENT '수정일시',
+
+    UNIQUE KEY idx_batch_checkpoint_item (table_name, run_key, item_key),
+    INDEX idx_batch_checkpoint_status (table_name, run_key, status)
+);
+
 CREATE TABLE stocks (
     id INT PRIMARY KEY AUTO_INCREMENT,
 
@@ -33,6 +50,7 @@ CREATE TABLE stocks (
     audit_info VARCHAR(100) COMMENT '감리구분',
     reg_day VARCHAR(8) COMMENT '상장일(YYYYMMDD)',
     last_price VARCHAR(20) COMMENT '최종가격',
+    market_cap BIGINT NOT NULL DEFAULT 0 COMMENT '시가총액(상장주식수 x 최종가격)',
     state VARCHAR(256) COMMENT '종목상태',
 
     -- 시장 정보
@@ -53,7 +71,16 @@ CREATE TABLE stocks (
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정일시',
     is_active BOOLEAN DEFAULT TRUE COMMENT '활성화여부',
 
-    INDEX idx_code (code)
+    INDEX idx_code (code),
+
+    -- 종목 리스트 정렬별 키셋 페이지네이션 (정렬 컬럼, id)
+    INDEX idx_stocks_market_cap (market_cap, id),
+    INDEX idx_stocks_name (name, id),
+    INDEX idx_stocks_created_at (created_at, id),
+    INDEX idx_stocks_market (market_code, id),
+    INDEX idx_stocks_market_market_cap (market_code, market_cap, id),
+    INDEX idx_stocks_market_name (market_code, name, id),
+    INDEX idx_stocks_market_created_at (market_code, created_at, id)
 );
 
 -- 섹터/업종 마스터 테이블
@@ -136,6 +163,7 @@ CREATE TABLE stock_trading_daily (
     -- 인덱스
     UNIQUE KEY unique_stock_date (stock_code, trade_date),
     INDEX idx_trade_date (trade_date),
+    INDEX idx_trade_date_rank (trade_date, current_rank, id),
     INDEX idx_stock_code (stock_code),
     INDEX idx_current_rank (current_rank),
     INDEX idx_trading_amount (trading_amount)
@@ -355,3 +383,34 @@ CREATE TABLE stock_chart_monthly (
     UNIQUE KEY idx_chart_monthly_unique (stock_code, dt),
     INDEX idx_chart_monthly_dt (dt)
 ) COMMENT='주식 월봉 차트 데이터';
+
+-- 차트 증분 동기화 워터마크 (종목/타임프레임별 마지막 저장 봉)
+CREATE TABLE chart_sync_watermark (
+    id BIGINT PRIMARY KEY AUTO_INCREMENT,
+
+    stock_code VARCHAR(32) NOT NULL COMMENT '종목코드',
+    timeframe VARCHAR(10) NOT NULL COMMENT '타임프레임 (minute, day, week, month)',
+    last_ts VARCHAR(14) NOT NULL COMMENT '저장된 마지막 봉 시점 (YYYYMMDD 또는 YYYYMMDDHHMMSS)',
+
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP COMMENT '생성일시',
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정일시',
+
+    UNIQUE KEY idx_chart_watermark_unique (timeframe, stock_code)
+) COMMENT='차트 증분 동기화 워터마크';
+
+-- 워터마크 도입 이전에 적재된 차트 데이터가 있으면 한 번 실행 (이후에는 동기화가 끝까지 성공한 종목만 기록)
+-- INSERT IGNORE INTO chart_sync_watermark (stock_code, timeframe, last_ts)
+--     SELECT stock_code, 'minute', MAX(cntr_tm) FROM stock_chart_minute GROUP BY stock_code
+--     UNION ALL SELECT stock_code, 'day', MAX(dt) FROM stock_chart_daily GROUP BY stock_code
+--     UNION ALL SELECT stock_code, 'week', MAX(dt) FROM stock_chart_weekly GROUP BY stock_code
+--     UNION ALL SELECT stock_code, 'month', MAX(dt) FROM stock_chart_monthly GROUP BY stock_code;
+
+-- 키움 접근 토큰 (워커/배치 공유, TOKEN_STORE=mysql)
+CREATE TABLE kiwoom_token (
+    id INT PRIMARY KEY COMMENT '항상 1 (단일 행)',
+    token VARCHAR(512) NOT NULL COMMENT '접근 토큰',
+    expires_dt VARCHAR(14) COMMENT '만료일시 (YYYYMMDDHHMMSS)',
+
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP COMMENT '생성일시',
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정일시'
+) COMMENT='키움 접근 토큰 (워커/배치 공유)';
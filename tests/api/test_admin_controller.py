@@ -0,0 +1,17 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.admin import admin_router
+
+
+def test_pools_aggregates_db_http_and_cache_stats():
+    app = FastAPI()
+    app.include_router(admin_router)
+
+    response = TestClient(app).get("/admin/pools")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert set(body) == {"db", "http", "caches"}
+    assert set(body["caches"]) == {"chart", "stock_count", "trading_count"}
+    assert "hit_ratio" in body["caches"]["chart"]
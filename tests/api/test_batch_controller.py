@@ -0,0 +1,65 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.batch import batch_controller
+
+
+@pytest.fixture
+def client(monkeypatch):
+    calls = []
+
+    async def fake_run_job_by_name(*args):
+        calls.append(args)
+
+    async def fake_summary(table_name, run_key=None):
+        runs = [
+            {"run_key": "20260110", "counts": {"DONE": 5}, "failed_items": []},
+            {"run_key": "20260109", "counts": {"DONE": 3, "FAILED": 2}, "failed_items": ["000660", "005930"]},
+        ]
+        return [run for run in runs if run_key in (None, run["run_key"])]
+
+    monkeypatch.setattr(batch_controller, "run_job_by_name", fake_run_job_by_name)
+    monkeypatch.setattr(batch_controller.DbBatchCheckpoint, "summary", staticmethod(fake_summary))
+    app = FastAPI()
+    app.include_router(batch_controller.router)
+    test_client = TestClient(app)
+    test_client.calls = calls
+    return test_client
+
+
+def test_run_job_passes_run_key(client):
+    response = client.post("/batch/jobs/chart_daily/run", params={"run_key": "20260109"})
+
+    assert response.status_code == 200
+    assert client.calls == [("chart_daily", True, False, "20260109")]
+
+
+def test_run_job_rejects_run_key_for_job_without_checkpoints(client):
+    response = client.post("/batch/jobs/trading_ranking/run", params={"run_key": "20260109"})
+
+    assert response.status_code == 400
+    assert client.calls == []
+
+
+def test_retry_failed_targets_latest_run_with_failures(client):
+    # 날짜가 바뀐 뒤(오늘 run_key엔 실패 없음)에도 실패가 남은 실행을 재시도
+    response = client.post("/batch/jobs/chart_daily/retry-failed")
+
+    assert response.status_code == 200
+    assert response.json()["run_key"] == "20260109"
+    assert client.calls == [("chart_daily", True, True, "20260109")]
+
+
+def test_retry_failed_without_failed_items_is_not_found(client):
+    response = client.post("/batch/jobs/chart_daily/retry-failed", params={"run_key": "20260110"})
+
+    assert response.status_code == 404
+    assert client.calls == []
+
+
+def test_retry_failed_rejects_job_without_checkpoints(client):
+    response = client.post("/batch/jobs/trading_ranking/retry-failed")
+
+    assert response.status_code == 400
+    assert client.calls == []
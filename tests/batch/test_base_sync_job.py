@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from app.batch.jobs import base_sync_job as base_sync_job_module
+from app.batch.jobs.base_sync_job import BaseSyncJob
+
+
+class FakeRunContext:
+    def __init__(self, table_name):
+        self.table_name = table_name
+        self.enabled = True
+        self.history_id = 1
+        self.heartbeat_interval = 1.0
+        self.heartbeats = []
+        self.result = None
+
+    async def __aenter__(self):
+        FakeRunContext.last = self
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+    async def heartbeat(self, count):
+        self.heartbeats.append(count)
+
+    async def succeed(self, count):
+        self.result = ("SUCCESS", count)
+
+    async def fail(self, error_message):
+        self.result = ("FAILED", error_message)
+
+
+class SlowJob(BaseSyncJob):
+    """체크포인트 없이 오래 걸리는 작업 (진행 건수만 갱신)"""
+
+    def __init__(self):
+        super().__init__("slow_job")
+
+    async def execute(self) -> int:
+        for _ in range(5):
+            self.progress.record_count += 10
+            await asyncio.sleep(0.5)
+        return self.progress.record_count
+
+
+@pytest.fixture
+def fast_clock(monkeypatch):
+    monkeypatch.setattr(base_sync_job_module, "JobRunContext", FakeRunContext)
+    real_sleep = asyncio.sleep
+
+    async def fast_sleep(seconds, *args, **kwargs):
+        # 작업/heartbeat 대기를 100배 빠르게
+        await real_sleep(seconds / 100, *args, **kwargs)
+
+    real_wait_for = asyncio.wait_for
+
+    async def fast_wait_for(awaitable, timeout):
+        return await real_wait_for(awaitable, timeout / 100)
+
+    monkeypatch.setattr(asyncio, "sleep", fast_sleep)
+    monkeypatch.setattr(asyncio, "wait_for", fast_wait_for)
+
+
+def test_job_without_checkpoint_sends_heartbeats(fast_clock):
+    asyncio.run(SlowJob().run())
+
+    run = FakeRunContext.last
+    assert run.result == ("SUCCESS", 50)
+    assert run.heartbeats
+    assert run.heartbeats == sorted(run.heartbeats)
+
+
+class SlowHeartbeatRunContext(FakeRunContext):
+    """진행 기록(쿼리)이 작업보다 오래 걸리는 실행 컨텍스트"""
+
+    async def heartbeat(self, count):
+        self.heartbeats.append(("start", count))
+        await asyncio.sleep(2)
+        self.heartbeats.append(("done", count))
+
+
+def test_job_end_does_not_interrupt_running_heartbeat(fast_clock, monkeypatch):
+    monkeypatch.setattr(base_sync_job_module, "JobRunContext", SlowHeartbeatRunContext)
+
+    asyncio.run(SlowJob().run())
+
+    run = SlowHeartbeatRunContext.last
+    assert run.result == ("SUCCESS", 50)
+    # 작업이 끝날 때 진행 중이던 기록도 끝까지 수행된 뒤 종료
+    events = [event for event, _ in run.heartbeats]
+    assert events[-1] == "done"
+    assert events.count("start") == events.count("done")
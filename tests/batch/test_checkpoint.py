@@ -0,0 +1,68 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from sqlalchemy.dialects import mysql
+
+from app.batch import checkpoint as checkpoint_module
+from app.batch.checkpoint import DbBatchCheckpoint
+from app.config import settings
+
+
+class FakeResult:
+    rowcount = 3
+
+
+class FakeSession:
+    """실행한 SQL 문장을 기록하는 세션"""
+
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt.compile(dialect=mysql.dialect()))
+        return FakeResult()
+
+    async def commit(self):
+        pass
+
+
+def fake_get_session(session):
+    async def get_session():
+        yield session
+    return get_session
+
+
+def test_prune_deletes_rows_older_than_retention(monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(checkpoint_module, "get_session", fake_get_session(session))
+    monkeypatch.setattr(settings, "BATCH_CHECKPOINT_RETENTION_DAYS", 7)
+
+    deleted = asyncio.run(DbBatchCheckpoint("chart_daily", "20260110").prune_expired())
+
+    assert deleted == 3
+    [stmt] = session.statements
+    assert str(stmt).startswith("DELETE FROM batch_checkpoint")
+    # 이 작업의 모든 실행(run_key)이 대상
+    assert "run_key" not in str(stmt)
+    assert stmt.params["table_name_1"] == "chart_daily"
+    cutoff = stmt.params["updated_at_1"]
+    assert abs(cutoff - (datetime.now() - timedelta(days=7))) < timedelta(minutes=1)
+
+
+def test_prune_disabled_with_zero_retention(monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(checkpoint_module, "get_session", fake_get_session(session))
+    monkeypatch.setattr(settings, "BATCH_CHECKPOINT_RETENTION_DAYS", 0)
+
+    assert asyncio.run(DbBatchCheckpoint("chart_daily", "20260110").prune_expired()) == 0
+    assert session.statements == []
+
+
+def test_clear_done_keeps_failed_items_of_the_run(monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(checkpoint_module, "get_session", fake_get_session(session))
+
+    asyncio.run(DbBatchCheckpoint("chart_daily", "20260110").clear_done())
+
+    [stmt] = session.statements
+    assert stmt.params == {"table_name_1": "chart_daily", "run_key_1": "20260110", "status_1": "DONE"}
@@ -0,0 +1,137 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from app.common.auth_client import AuthClient
+from app.common.token_store import MemoryTokenStore, StoredToken
+
+
+def expires_in(**delta):
+    return (datetime.now() + timedelta(**delta)).strftime("%Y%m%d%H%M%S")
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self.body = body
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.body
+
+
+class FakeTokenTransport:
+    """토큰 발급 요청마다 새 토큰(token-1, token-2, ...)을 돌려주는 전송 계층"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.issued = 0
+
+    async def post(self, url, headers=None, json=None):
+        self.issued += 1
+        await asyncio.sleep(self.delay)
+        return FakeResponse({
+            "return_code": 0,
+            "token": f"token-{self.issued}",
+            "expires_dt": expires_in(hours=12),
+            "token_type": "bearer",
+        })
+
+
+def unauthorized():
+    request = httpx.Request("GET", "https://kiwoom.test/api")
+    return httpx.HTTPStatusError("401", request=request, response=httpx.Response(401, request=request))
+
+
+def make_client(transport, store=None):
+    return AuthClient(transport=transport, token_store=store or MemoryTokenStore())
+
+
+def test_concurrent_callers_share_one_token_request():
+    transport = FakeTokenTransport(delay=0.01)
+    client = make_client(transport)
+
+    async def run():
+        return await asyncio.gather(*(client.ensure_token() for _ in range(10)))
+
+    tokens = asyncio.run(run())
+
+    assert transport.issued == 1
+    assert set(tokens) == {"token-1"}
+
+
+def test_token_close_to_expiry_is_refreshed_in_background():
+    transport = FakeTokenTransport()
+    client = make_client(transport)
+    client._set_token("old", expires_in(minutes=5))
+
+    async def run():
+        token = await client.ensure_token()
+        await client._refresh_task
+        return token
+
+    assert asyncio.run(run()) == "old"
+    assert transport.issued == 1
+    assert client.token == "token-1"
+
+
+def test_unauthorized_call_is_retried_once_with_new_token():
+    transport = FakeTokenTransport()
+    client = make_client(transport)
+    client._set_token("revoked", expires_in(hours=1))
+    used = []
+
+    async def call(token):
+        used.append(token)
+        if token == "revoked":
+            raise unauthorized()
+        return "ok"
+
+    assert asyncio.run(client.call_with_token(call)) == "ok"
+    assert used == ["revoked", "token-1"]
+    assert transport.issued == 1
+
+
+def test_rejected_token_in_store_is_not_reused():
+    store = MemoryTokenStore()
+    transport = FakeTokenTransport()
+    client = make_client(transport, store)
+    client._set_token("revoked", expires_in(hours=1))
+
+    async def run():
+        await store.save(StoredToken("revoked", expires_in(hours=1)))
+
+        async def call(token):
+            if token == "revoked":
+                raise unauthorized()
+            return token
+
+        return await client.call_with_token(call)
+
+    assert asyncio.run(run()) == "token-1"
+
+
+def test_second_unauthorized_is_raised():
+    client = make_client(FakeTokenTransport())
+
+    async def call(token):
+        raise unauthorized()
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(client.call_with_token(call))
+
+
+def test_empty_token_in_store_is_replaced():
+    store = MemoryTokenStore()
+    transport = FakeTokenTransport()
+    client = make_client(transport, store)
+
+    async def run():
+        await store.save(StoredToken("", None))
+        return await client.ensure_token()
+
+    assert asyncio.run(run()) == "token-1"
+    assert transport.issued == 1
@@ -0,0 +1,18 @@
+import pytest
+
+from app.common.cursor import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    payload = {"o": "name_asc", "v": "삼성전자", "id": 42}
+
+    cursor = encode_cursor(payload)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == payload
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "bnVsbA", "WzEsMl0"])  # 깨진 문자열, null, 리스트
+def test_decode_rejects_malformed_cursor(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
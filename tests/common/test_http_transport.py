@@ -0,0 +1,48 @@
+import asyncio
+
+from app.common.http_transport import KiwoomHttpTransport
+
+
+def test_client_replaced_on_new_loop_closes_previous_pool():
+    transport = KiwoomHttpTransport()
+
+    async def get_client():
+        return transport.client
+
+    first = asyncio.run(get_client())
+
+    async def replace():
+        second = transport.client
+        # 이전 풀 종료 태스크가 돌 수 있도록 한 번 양보
+        await asyncio.sleep(0)
+        await asyncio.gather(*transport._closing)
+        return second
+
+    second = asyncio.run(replace())
+
+    assert second is not first
+    assert first.is_closed
+    asyncio.run(transport.aclose())
+
+
+def test_stats_degrades_when_pool_internals_missing():
+    transport = KiwoomHttpTransport()
+
+    async def run():
+        client = transport.client
+        client._transport = object()  # httpx 내부 구조가 바뀐 경우
+        return transport.stats()
+
+    stats = asyncio.run(run())
+
+    assert stats["open_connections"] is None
+    assert stats["idle_connections"] is None
+    assert stats["max_connections"] == transport.limits.max_connections
+
+
+def test_explicit_zero_limits_are_kept():
+    transport = KiwoomHttpTransport(max_keepalive_connections=0, keepalive_expiry=0.0, timeout=0.0)
+
+    assert transport.limits.max_keepalive_connections == 0
+    assert transport.limits.keepalive_expiry == 0.0
+    assert transport.timeout == 0.0
@@ -0,0 +1,118 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.common.pagination import paginate
+
+
+def page(number, next_key=None):
+    return SimpleNamespace(number=number, cont_yn="Y" if next_key else "N", next_key=next_key)
+
+
+class FakeApi:
+    """next-key → 페이지 응답, 호출 순서와 조회 시작/완료를 기록"""
+
+    def __init__(self, pages, fail_on=None, block_on=None):
+        self.pages = pages
+        self.fail_on = fail_on
+        self.block_on = block_on
+        self.calls = []
+        self.events = []
+
+    async def fetch(self, cont_yn, next_key):
+        self.calls.append((cont_yn, next_key))
+        self.events.append(f"start {next_key}")
+        await asyncio.sleep(0)
+        if next_key is not None and next_key == self.block_on:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                self.events.append(f"cancelled {next_key}")
+                raise
+        if next_key is not None and next_key == self.fail_on:
+            raise RuntimeError(next_key)
+        self.events.append(f"done {next_key}")
+        return self.pages[next_key]
+
+
+PAGES = {None: page(1, "k2"), "k2": page(2, "k3"), "k3": page(3)}
+
+
+def collect(api, **kwargs):
+    async def main():
+        numbers = []
+        async for p in paginate(api.fetch, **kwargs):
+            await asyncio.sleep(0)  # 호출자의 처리 (DB 저장 등)
+            api.events.append(f"processed {p.number}")
+            numbers.append(p.number)
+        return numbers
+
+    return asyncio.run(main())
+
+
+def test_follows_next_key_until_cont_yn_is_not_y():
+    api = FakeApi(PAGES)
+
+    assert collect(api) == [1, 2, 3]
+    assert api.calls == [(None, None), ("Y", "k2"), ("Y", "k3")]
+
+
+def test_prefetch_overlaps_next_request_with_caller_processing():
+    api = FakeApi(PAGES)
+
+    collect(api)
+
+    assert api.events.index("start k2") < api.events.index("processed 1")
+
+
+def test_without_prefetch_next_page_starts_after_caller_finishes():
+    api = FakeApi(PAGES)
+
+    collect(api, prefetch=False)
+
+    assert api.events.index("processed 1") < api.events.index("start k2")
+
+
+def test_max_pages_limits_requests():
+    api = FakeApi(PAGES)
+
+    assert collect(api, max_pages=2) == [1, 2]
+    assert len(api.calls) == 2
+
+
+def test_stop_when_yields_matching_page_then_stops():
+    api = FakeApi(PAGES)
+
+    assert collect(api, stop_when=lambda p: p.number == 2) == [1, 2]
+    assert api.calls == [(None, None), ("Y", "k2")]
+
+
+def test_start_key_resumes_from_saved_next_key():
+    api = FakeApi(PAGES)
+
+    assert collect(api, start_key="k3") == [3]
+    assert api.calls == [("Y", "k3")]
+
+
+def test_breaking_out_cancels_prefetched_request():
+    api = FakeApi(PAGES, block_on="k2")
+
+    async def main():
+        pages = paginate(api.fetch)
+        async for p in pages:
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            break
+        await pages.aclose()
+
+    asyncio.run(main())
+
+    assert "cancelled k2" in api.events
+
+
+def test_fetch_error_propagates_to_caller():
+    api = FakeApi(PAGES, fail_on="k3")
+
+    with pytest.raises(RuntimeError):
+        collect(api)
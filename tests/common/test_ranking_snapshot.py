@@ -0,0 +1,30 @@
+import json
+from datetime import date
+
+from app.common.cursor import decode_cursor
+from app.common.ranking_snapshot import RankingSnapshot
+
+TRADE_DATE = date(2026, 1, 9)
+ROWS = [{"id": 100 + rank, "stock_code": f"{rank:06d}", "current_rank": rank} for rank in range(1, 6)]
+
+
+def test_full_page_is_prebuilt_body():
+    snapshot = RankingSnapshot.build(TRADE_DATE, ROWS)
+
+    body, etag = snapshot.page(0, 100)
+
+    assert body is snapshot.body
+    assert etag == snapshot.etag
+    assert json.loads(body)["data"]["total_count"] == 5
+
+
+def test_page_slice_reports_total_of_whole_snapshot():
+    snapshot = RankingSnapshot.build(TRADE_DATE, ROWS)
+
+    body, etag = snapshot.page(0, 2)
+    data = json.loads(body)["data"]
+
+    assert [row["current_rank"] for row in data["rankings"]] == [1, 2]
+    assert data["total_count"] == 5
+    assert decode_cursor(data["next_cursor"]) == {"d": "2026-01-09", "r": 2, "id": 102}
+    assert etag != snapshot.etag
@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from app.common import rate_limiter as rate_limiter_module
+from app.common.rate_limiter import TokenBucketRateLimiter
+
+
+class FakeClock:
+    """asyncio.sleep이 실제로 기다리지 않고 시계만 앞으로 옮기는 가짜 시계
+
+    토큰 간격이 이진수로 정확히 표현되는 rate(4, 8)만 써서 부동소수 오차 없이 비교한다.
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(seconds, *args, **kwargs):
+        clock.now += seconds
+        await real_sleep(0)
+
+    monkeypatch.setattr(rate_limiter_module.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return clock
+
+
+def test_burst_up_to_capacity_then_one_token_per_interval(clock):
+    limiter = TokenBucketRateLimiter(rate=4, capacity=2)
+    started = clock.now
+    times = []
+
+    async def main():
+        for _ in range(5):
+            await limiter.acquire()
+            times.append(round(clock.now - started, 6))
+
+    asyncio.run(main())
+
+    assert times == [0.0, 0.0, 0.25, 0.5, 0.75]
+
+
+def test_waiters_are_served_in_arrival_order(clock):
+    limiter = TokenBucketRateLimiter(rate=8, capacity=1)
+    served = []
+
+    async def worker(index):
+        await limiter.acquire()
+        served.append((index, round(clock.now - 1000.0, 6)))
+
+    async def main():
+        await asyncio.gather(*(worker(index) for index in range(5)))
+
+    asyncio.run(main())
+
+    assert [index for index, _ in served] == [0, 1, 2, 3, 4]
+    assert [at for _, at in served] == [0.0, 0.125, 0.25, 0.375, 0.5]
+
+
+def test_idle_time_refills_only_up_to_capacity(clock):
+    limiter = TokenBucketRateLimiter(rate=8, capacity=3)
+
+    async def main():
+        for _ in range(3):
+            await limiter.acquire()
+        clock.now += 60  # 오래 쉬어도 capacity까지만 채워짐
+        started = clock.now
+        for _ in range(4):
+            await limiter.acquire()
+        return round(clock.now - started, 6)
+
+    assert asyncio.run(main()) == 0.125
+
+
+def test_rate_must_be_positive():
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter(rate=0)
@@ -0,0 +1,27 @@
+import asyncio
+import os
+import stat
+
+from app.common.token_store import FileTokenStore, StoredToken
+
+
+def test_file_store_creates_owner_only_token_file(tmp_path):
+    path = tmp_path / "nested" / "kiwoom_token.json"
+    store = FileTokenStore(str(path))
+
+    async def run():
+        async with store.lock():
+            await store.save(StoredToken("secret", "20261231235959"))
+        return await store.load()
+
+    loaded = asyncio.run(run())
+
+    assert loaded == StoredToken("secret", "20261231235959")
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert stat.S_IMODE(os.stat(path.parent).st_mode) == 0o700
+
+
+def test_file_store_expands_home(monkeypatch, tmp_path):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    store = FileTokenStore("~/.cache/stock-service/kiwoom_token.json")
+    assert store.path == str(tmp_path / ".cache" / "stock-service" / "kiwoom_token.json")
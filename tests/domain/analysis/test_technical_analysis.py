@@ -0,0 +1,171 @@
+"""NumPy로 바꾼 분석 로직이 이전(순수 파이썬) 구현과 같은 결과를 내는지 비교"""
+import random
+from collections import defaultdict
+
+import numpy as np
+import pytest
+
+from app.domain.analysis.services.technical_analysis_service import (
+    TechnicalAnalysisService,
+    to_ohlcv_arrays,
+)
+from app.domain.chart.dto.response.chart_item import DayChartItem
+
+service = TechnicalAnalysisService()
+
+
+def random_bars(seed, count=240):
+    """호가 단위(10원)로 움직여 같은 고가/저가가 자주 나오는 일봉"""
+    rng = random.Random(seed)
+    price = 50000
+    bars = []
+    for day in range(count):
+        price = max(1000, price + rng.randint(-30, 30) * 10)
+        high = price + rng.randint(0, 20) * 10
+        low = price - rng.randint(0, 20) * 10
+        bars.append(DayChartItem(
+            cur_prc=str(price), trde_qty=str(rng.randint(0, 5) * 1000), trde_prica="0",
+            dt=f"2025{day:04d}", open_pric=str(price), high_pric=str(high), low_pric=str(low),
+            pred_pre="0", pred_pre_sig="3",
+        ))
+    return bars
+
+
+# ── 이전 구현 (기준) ─────────────────────────────────────────────────────────
+
+def reference_local_highs(chart_data, window):
+    highs = []
+    for i in range(window, len(chart_data) - window):
+        current = float(chart_data[i].high_pric)
+        if all(
+            current >= float(chart_data[j].high_pric)
+            for j in range(i - window, i + window + 1) if j != i
+        ):
+            highs.append(current)
+    return highs
+
+
+def reference_local_lows(chart_data, window):
+    lows = []
+    for i in range(window, len(chart_data) - window):
+        current = float(chart_data[i].low_pric)
+        if all(
+            current <= float(chart_data[j].low_pric)
+            for j in range(i - window, i + window + 1) if j != i
+        ):
+            lows.append(current)
+    return lows
+
+
+def reference_volume_profile(chart_data, price_bins):
+    min_price = min(float(d.low_pric) for d in chart_data)
+    max_price = max(float(d.high_pric) for d in chart_data)
+    price_step = (max_price - min_price) / price_bins
+    volume_by_bin = defaultdict(int)
+    for data in chart_data:
+        avg_price = (float(data.high_pric) + float(data.low_pric)) / 2
+        bin_index = min(int((avg_price - min_price) / price_step), price_bins - 1)
+        volume_by_bin[bin_index] += int(data.trde_qty)
+    return sorted(volume_by_bin.items(), key=lambda x: x[1], reverse=True), min_price, price_step
+
+
+def reference_clusters(prices, tolerance):
+    """이전 구현: 기존 클러스터 기준가를 전부 훑어 첫 번째로 맞는 곳에 넣음"""
+    clusters = {}
+    for price in sorted(prices):
+        for cluster_key in list(clusters.keys()):
+            if abs(price - cluster_key) / cluster_key <= tolerance:
+                clusters[cluster_key].append(price)
+                break
+        else:
+            clusters[price] = [price]
+    return [(sum(members) / len(members), len(members)) for members in clusters.values()]
+
+
+# ── user-006: 로컬 고점/저점, 거래량 프로파일 ──────────────────────────────────
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("window", [1, 3, 5])
+def test_local_extrema_match_nested_loop_version(seed, window):
+    chart_data = random_bars(seed)
+    bars = to_ohlcv_arrays(chart_data)
+
+    highs = service._find_local_highs(bars.high, window)
+    lows = service._find_local_lows(bars.low, window)
+
+    assert bars.high[highs].tolist() == reference_local_highs(chart_data, window)
+    assert bars.low[lows].tolist() == reference_local_lows(chart_data, window)
+
+
+def test_local_extrema_need_a_full_window():
+    bars = to_ohlcv_arrays(random_bars(0, count=4))
+
+    assert len(service._find_local_highs(bars.high, 2)) == 0
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("price_bins", [10, 50])
+def test_volume_profile_matches_dict_version(seed, price_bins):
+    chart_data = random_bars(seed)
+    sorted_bins, min_price, price_step = reference_volume_profile(chart_data, price_bins)
+    total_volume = sum(int(d.trde_qty) for d in chart_data)
+
+    result = service.find_volume_profile("005930", "day", chart_data, "20250000", "20250239", price_bins)
+
+    top = sorted_bins[:max(int(len(sorted_bins) * 0.2), 5)]
+    assert [(level.volume, level.percentage) for level in result.high_volume_levels] == [
+        (volume, round(volume / total_volume * 100, 2)) for _, volume in top
+    ]
+    assert [level.price_range for level in result.high_volume_levels] == [
+        f"{int(min_price + b * price_step)}-{int(min_price + b * price_step + price_step)}" for b, _ in top
+    ]
+    assert result.poc == round(min_price + sorted_bins[0][0] * price_step + price_step / 2, 2)
+
+    value_area_bins, accumulated = [], 0
+    for bin_idx, volume in sorted_bins:
+        value_area_bins.append(bin_idx)
+        accumulated += volume
+        if accumulated >= total_volume * 0.7:
+            break
+    assert result.value_area_low == round(min_price + min(value_area_bins) * price_step, 2)
+    assert result.value_area_high == round(min_price + (max(value_area_bins) + 1) * price_step, 2)
+
+
+# ── user-007: 한 번 순회하는 가격대 클러스터링 ─────────────────────────────────
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("tolerance", [0.0, 0.005, 0.01, 0.05])
+def test_single_pass_clustering_matches_quadratic_version(seed, tolerance):
+    chart_data = random_bars(seed)
+    bars = to_ohlcv_arrays(chart_data)
+    indices = service._find_local_highs(bars.high, 2)
+
+    clusters = service._cluster_price_levels(bars.high, indices, tolerance)
+
+    expected = reference_clusters(bars.high[indices].tolist(), tolerance)
+    assert [(cluster.price, cluster.touches) for cluster in clusters] == pytest.approx(expected)
+
+
+def test_cluster_reports_price_band_and_last_touch():
+    # 인덱스 7의 100.5가 마지막 터치, 110은 1% 밖이라 별도 클러스터
+    prices = to_ohlcv_arrays(random_bars(0, count=10)).high.copy()
+    prices[[1, 4, 7, 9]] = [100.0, 101.0, 100.5, 110.0]
+
+    clusters = service._cluster_price_levels(prices, np.array([1, 4, 7, 9]), 0.01)
+
+    assert [(c.min_price, c.max_price, c.touches, c.last_index) for c in clusters] == [
+        (100.0, 101.0, 3, 7),
+        (110.0, 110.0, 1, 9),
+    ]
+
+
+def test_resistance_levels_match_previous_output():
+    chart_data = random_bars(1)
+
+    result = service.find_resistance_support_levels("005930", "day", chart_data, "20250000", "20250239")
+
+    highs = reference_local_highs(chart_data, 5)
+    expected = sorted(
+        (round(price, 2), touches) for price, touches in reference_clusters(highs, 0.01) if touches >= 2
+    )
+    assert [(level.price, level.touches) for level in result.resistance_levels] == expected
@@ -0,0 +1,114 @@
+"""차트 동기화 테스트용 가짜 키움 API / DB (커밋된 내용만 FakeChartDb에 반영)"""
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+from app.domain.chart.repositories.chart_repository import ChartRepository
+
+
+def day_page(dates: List[str], next_key: Optional[str] = None) -> SimpleNamespace:
+    """최신순 일봉 페이지 (next_key가 있으면 연속조회 가능)"""
+    return SimpleNamespace(
+        items=[SimpleNamespace(dt=dt) for dt in dates],
+        cont_yn="Y" if next_key else "N",
+        next_key=next_key,
+    )
+
+
+class FakeKiwoomChart(ChartRepository):
+    """next-key → 페이지 사전으로 응답하는 ka10081, fail_on의 next-key 요청은 실패"""
+
+    def __init__(self, pages: Dict[Optional[str], SimpleNamespace], fail_on: Optional[str] = None):
+        self.pages = pages
+        self.fail_on = fail_on
+        self.requested: List[Optional[str]] = []
+
+    async def get_day_chart(self, stk_cd, base_dt, upd_stkpc_tp, cont_yn=None, next_key=None):
+        self.requested.append(next_key)
+        if self.fail_on is not None and next_key == self.fail_on:
+            raise RuntimeError(f"키움 API 오류: {next_key}")
+        return self.pages[next_key]
+
+
+class FakeChartDb:
+    def __init__(self, watermarks: Optional[Dict[str, str]] = None, active_codes: Optional[List[str]] = None):
+        self.bars: Dict[str, set] = {}
+        self.watermarks: Dict[str, str] = dict(watermarks or {})
+        self.watermark_writes: List[tuple] = []
+        self.active_codes = active_codes or []
+
+
+class _FakeChartDbRepository:
+    def __init__(self, db: FakeChartDb):
+        self.db = db
+        self.pending_bars: List[tuple] = []
+        self.pending_watermarks: List[tuple] = []
+
+    async def bulk_upsert_daily(self, stock_code, items) -> int:
+        self.pending_bars.extend((stock_code, item.dt) for item in items)
+        return len(items)
+
+    async def advance_watermark(self, stock_code, timeframe, last_ts) -> None:
+        self.pending_watermarks.append((stock_code, timeframe, last_ts))
+
+    async def get_watermarks(self, timeframe):
+        return dict(self.db.watermarks)
+
+
+class _FakeStockRepository:
+    def __init__(self, db: FakeChartDb):
+        self.db = db
+
+    async def find_active_codes(self):
+        return list(self.db.active_codes)
+
+
+class FakeChartUnitOfWork:
+    """ChartUnitOfWork 대체 (commit 전 쓰기는 버려짐)"""
+
+    def __init__(self, db: FakeChartDb):
+        self.db = db
+
+    async def __aenter__(self):
+        self.chart_repo = _FakeChartDbRepository(self.db)
+        self.stock_repo = _FakeStockRepository(self.db)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.chart_repo.pending_bars.clear()
+        self.chart_repo.pending_watermarks.clear()
+
+    async def commit(self):
+        repo = self.chart_repo
+        for stock_code, dt in repo.pending_bars:
+            self.db.bars.setdefault(stock_code, set()).add(dt)
+        for stock_code, timeframe, last_ts in repo.pending_watermarks:
+            self.db.watermark_writes.append((stock_code, timeframe, last_ts))
+            self.db.watermarks[stock_code] = max(self.db.watermarks.get(stock_code, last_ts), last_ts)
+        repo.pending_bars.clear()
+        repo.pending_watermarks.clear()
+
+
+class FakeCheckpoint:
+    """DbBatchCheckpoint와 같은 규칙의 메모리 체크포인트 (item_key → (status, page_key))"""
+
+    def __init__(self, states: Optional[Dict[str, tuple]] = None, retry_failed: bool = False):
+        self.states: Dict[str, tuple] = states if states is not None else {}
+        self.retry_failed = retry_failed
+
+    async def plan(self, item_keys):
+        if self.retry_failed:
+            return {key: None for key in item_keys if self.states.get(key, (None,))[0] == "FAILED"}
+        return {
+            key: self.states[key][1] if key in self.states else None
+            for key in item_keys
+            if self.states.get(key, (None,))[0] != "DONE"
+        }
+
+    async def save_page(self, item_key, page_key):
+        self.states[item_key] = ("RUNNING", page_key)
+
+    async def mark_done(self, item_key, record_count):
+        self.states[item_key] = ("DONE", None)
+
+    async def mark_failed(self, item_key, error_message):
+        self.states[item_key] = ("FAILED", self.states.get(item_key, (None, None))[1])
@@ -0,0 +1,15 @@
+from app.config import settings
+from app.domain.chart.services.chart_service import ChartService
+
+
+def test_window_with_watermark_is_not_page_bounded():
+    assert ChartService._batch_window("20260105") == {"start_dt": "20260105"}
+
+
+def test_window_without_watermark_uses_default_pages(monkeypatch):
+    monkeypatch.setattr(settings, "CHART_BATCH_MAX_PAGES", 1)
+    assert ChartService._batch_window(None) == {"start_dt": None, "max_pages": 1}
+
+
+def test_window_without_watermark_zero_pages_means_full_history():
+    assert ChartService._batch_window(None, 0) == {"start_dt": None, "max_pages": None}
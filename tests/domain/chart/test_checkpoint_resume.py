@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from app.config import settings
+from app.domain.chart.services import chart_service as chart_service_module
+from app.domain.chart.services.chart_service import ChartService
+from tests.domain.chart.fakes import (
+    FakeChartDb,
+    FakeChartUnitOfWork,
+    FakeCheckpoint,
+    FakeKiwoomChart,
+    day_page,
+)
+
+CODE = "005930"
+OLD_WATERMARK = "20260101"
+
+PAGES = {
+    None: day_page(["20260110", "20260109", "20260108"], next_key="k2"),
+    "k2": day_page(["20260107", "20260106", "20260105"], next_key="k3"),
+    "k3": day_page(["20260104", "20260103", "20260102"]),
+}
+
+
+@pytest.fixture
+def db(monkeypatch):
+    db = FakeChartDb(watermarks={CODE: OLD_WATERMARK}, active_codes=[CODE])
+    monkeypatch.setattr(chart_service_module, "ChartUnitOfWork", lambda: FakeChartUnitOfWork(db))
+    monkeypatch.setattr(settings, "CHART_SYNC_COMMIT_SIZE", 3)
+    return db
+
+
+def run_batch(kiwoom, checkpoint):
+    service = ChartService(kiwoom)
+    return asyncio.run(service.batch_sync_day_chart("20260110", checkpoint=checkpoint, max_workers=1))
+
+
+def test_resumed_stock_fetches_remaining_pages_after_crash(db):
+    checkpoint = FakeCheckpoint()
+
+    # 1차 실행: 두 페이지 커밋 후 세 번째 페이지에서 실패
+    first = run_batch(FakeKiwoomChart(PAGES, fail_on="k3"), checkpoint)
+
+    assert first.failed == 1
+    assert checkpoint.states[CODE] == ("FAILED", "k3")
+    assert db.watermarks[CODE] == OLD_WATERMARK
+
+    # 2차 실행: 같은 run_key로 이어서, 저장된 next-key부터 조회
+    kiwoom = FakeKiwoomChart(PAGES)
+    second = run_batch(kiwoom, checkpoint)
+
+    assert kiwoom.requested == ["k3"]
+    assert second.success == 1
+    assert second.record_count == 3
+    assert db.bars[CODE] == {f"202601{day:02d}" for day in range(2, 11)}
+    assert checkpoint.states[CODE] == ("DONE", None)
+    # 워터마크는 이어서 받은 구간 끝까지 전진 (다음 증분은 겹쳐 받을 뿐 빈 구간 없음)
+    assert db.watermark_writes == [(CODE, "day", "20260104")]
+
+
+def test_retry_failed_starts_failed_stock_from_first_page(db):
+    checkpoint = FakeCheckpoint({CODE: ("FAILED", "k3")}, retry_failed=True)
+    kiwoom = FakeKiwoomChart(PAGES)
+
+    result = run_batch(kiwoom, checkpoint)
+
+    assert kiwoom.requested == [None, "k2", "k3"]
+    assert result.record_count == 9
+    assert db.watermark_writes == [(CODE, "day", "20260110")]
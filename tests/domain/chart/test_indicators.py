@@ -0,0 +1,116 @@
+"""지표 계산을 교과서식 순수 파이썬 계산과 비교"""
+import math
+import random
+import statistics
+
+import numpy as np
+import pytest
+
+from app.domain.chart.indicators import bollinger, ema, macd, rsi, sma
+
+NAN = float("nan")
+
+
+def closes(seed=0, count=200):
+    rng = random.Random(seed)
+    price, values = 10000.0, []
+    for _ in range(count):
+        price = max(100.0, price + rng.randint(-50, 50) * 10)
+        values.append(price)
+    return values
+
+
+def reference_ema(values, period):
+    out = [NAN] * len(values)
+    start = next((i for i, v in enumerate(values) if not math.isnan(v)), None)
+    if start is None or start + period > len(values):
+        return out
+    prev = sum(values[start:start + period]) / period
+    out[start + period - 1] = prev
+    for i in range(start + period, len(values)):
+        prev = values[i] * 2 / (period + 1) + prev * (1 - 2 / (period + 1))
+        out[i] = prev
+    return out
+
+
+def reference_rsi(values, period):
+    out = [NAN] * len(values)
+    changes = [b - a for a, b in zip(values, values[1:])]
+    avg_gain = sum(max(c, 0) for c in changes[:period]) / period
+    avg_loss = sum(max(-c, 0) for c in changes[:period]) / period
+    for i in range(period, len(values)):
+        if i > period:
+            change = changes[i - 1]
+            avg_gain = (avg_gain * (period - 1) + max(change, 0)) / period
+            avg_loss = (avg_loss * (period - 1) + max(-change, 0)) / period
+        if avg_loss == 0:
+            out[i] = 100.0 if avg_gain > 0 else 50.0
+        else:
+            out[i] = 100 - 100 / (1 + avg_gain / avg_loss)
+    return out
+
+
+def assert_series(actual, expected):
+    assert np.allclose(np.asarray(actual), np.asarray(expected, dtype=float), equal_nan=True, rtol=1e-9)
+
+
+def test_sma_small_series():
+    assert_series(sma(np.array([1, 2, 3, 4, 5]), 3), [NAN, NAN, 2, 3, 4])
+    assert_series(sma(np.array([1, 2]), 3), [NAN, NAN])
+
+
+def test_ema_seeds_with_simple_average():
+    # alpha = 0.5, 시드 = (1+2+3)/3 → 이후 값마다 1씩 뒤처짐
+    assert_series(ema(np.arange(1, 8, dtype=float), 3), [NAN, NAN, 2, 3, 4, 5, 6])
+
+
+@pytest.mark.parametrize("period", [5, 20, 60])
+def test_sma_and_ema_match_reference(period):
+    values = closes()
+
+    expected_sma = [NAN] * (period - 1) + [
+        sum(values[i - period + 1:i + 1]) / period for i in range(period - 1, len(values))
+    ]
+    assert_series(sma(np.array(values), period), expected_sma)
+    assert_series(ema(np.array(values), period), reference_ema(values, period))
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_rsi_matches_wilder_reference(seed):
+    values = closes(seed)
+
+    assert_series(rsi(np.array(values), 14), reference_rsi(values, 14))
+
+
+def test_rsi_extremes():
+    assert rsi(np.arange(1, 30, dtype=float), 14)[-1] == 100.0
+    assert rsi(np.full(30, 5.0), 14)[-1] == 50.0
+    assert np.isnan(rsi(np.arange(10, dtype=float), 14)).all()
+
+
+def test_macd_matches_reference():
+    values = closes(1)
+    fast, slow = reference_ema(values, 12), reference_ema(values, 26)
+    macd_line = [f - s for f, s in zip(fast, slow)]
+    signal_line = reference_ema(macd_line, 9)
+
+    actual_macd, actual_signal, histogram = macd(np.array(values))
+
+    assert_series(actual_macd, macd_line)
+    assert_series(actual_signal, signal_line)
+    assert_series(histogram, [m - s for m, s in zip(macd_line, signal_line)])
+    # 시그널은 MACD가 처음 유효해진 뒤 9봉째부터
+    assert np.flatnonzero(~np.isnan(actual_signal))[0] == 25 + 8
+
+
+def test_bollinger_uses_population_std():
+    values = closes(2)
+    upper, middle, lower = bollinger(np.array(values), 20, 2.0)
+
+    for i in range(19, len(values)):
+        window = values[i - 19:i + 1]
+        mean, std = statistics.fmean(window), statistics.pstdev(window)
+        assert middle[i] == pytest.approx(mean)
+        assert upper[i] == pytest.approx(mean + 2 * std)
+        assert lower[i] == pytest.approx(mean - 2 * std)
+    assert np.isnan(upper[:19]).all()
@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+from app.config import settings
+from app.domain.chart.services import chart_service as chart_service_module
+from app.domain.chart.services.chart_service import ChartService
+from tests.domain.chart.fakes import FakeChartDb, FakeChartUnitOfWork, FakeKiwoomChart, day_page
+
+CODE = "005930"
+
+# 최신순 3페이지 (키움 연속조회 순서)
+PAGES = {
+    None: day_page(["20260110", "20260109", "20260108"], next_key="k2"),
+    "k2": day_page(["20260107", "20260106", "20260105"], next_key="k3"),
+    "k3": day_page(["20260104", "20260103", "20260102"]),
+}
+
+
+@pytest.fixture
+def db(monkeypatch):
+    db = FakeChartDb()
+    monkeypatch.setattr(chart_service_module, "ChartUnitOfWork", lambda: FakeChartUnitOfWork(db))
+    # 페이지마다 커밋되도록 커밋 단위를 페이지 크기로
+    monkeypatch.setattr(settings, "CHART_SYNC_COMMIT_SIZE", 3)
+    return db
+
+
+def sync(kiwoom, **kwargs):
+    service = ChartService(kiwoom)
+    return asyncio.run(service._sync_day_history(CODE, "20260110", "1", track_watermark=True, **kwargs))
+
+
+def test_watermark_not_moved_when_sync_fails_mid_stream(db):
+    kiwoom = FakeKiwoomChart(PAGES, fail_on="k3")
+
+    with pytest.raises(RuntimeError):
+        sync(kiwoom)
+
+    # 최신 페이지는 커밋됐지만 과거 페이지를 못 받았으므로 워터마크는 그대로
+    assert "20260110" in db.bars[CODE]
+    assert db.watermark_writes == []
+    assert CODE not in db.watermarks
+
+
+def test_watermark_advanced_once_after_reaching_end_of_history(db):
+    kiwoom = FakeKiwoomChart(PAGES)
+
+    saved = sync(kiwoom)
+
+    assert saved == 9
+    assert db.watermark_writes == [(CODE, "day", "20260110")]
+
+
+def test_watermark_advanced_after_crossing_start_dt(db):
+    kiwoom = FakeKiwoomChart(PAGES)
+
+    saved = sync(kiwoom, start_dt="20260106")
+
+    # 시작일을 넘는 페이지(k2)까지만 조회
+    assert kiwoom.requested == [None, "k2"]
+    assert saved == 5
+    assert db.watermark_writes == [(CODE, "day", "20260110")]
+
+
+def test_range_sync_does_not_touch_watermark(db):
+    service = ChartService(FakeKiwoomChart(PAGES))
+
+    asyncio.run(service._sync_day_history(CODE, "20260110", "1", start_dt="20260102", end_dt="20260105"))
+
+    assert db.bars[CODE] == {"20260102", "20260103", "20260104", "20260105"}
+    assert db.watermark_writes == []
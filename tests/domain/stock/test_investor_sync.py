@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+
+from app.config import settings
+from app.domain.stock.dto.investor_daily_trade_stock import InvestorDailyTradeStock, InvestorDailyTradeStockRequest
+from app.domain.stock.services import stock_service as stock_service_module
+from app.domain.stock.services.stock_service import StockService, combination_key
+from tests.domain.chart.fakes import FakeCheckpoint
+
+# 매매구분/시장/거래소를 고정하고 투자자구분만 전체 → 12개 조합
+REQUEST = InvestorDailyTradeStockRequest(strt_dt="20260105", end_dt="20260110", trde_tp="1", mrkt_tp="001", stex_tp="1")
+INDIVIDUAL = "1:001:8000:1"
+FOREIGN = "1:001:9000:1"
+
+
+def trade(stk_cd):
+    return InvestorDailyTradeStock(
+        stk_cd=stk_cd, stk_nm=stk_cd, netslmt_qty="1", netslmt_amt="1", prsm_avg_pric="1", cur_prc="1",
+        pre_sig="2", pred_pre="0", avg_pric_pre="0", pre_rt="0", dt_trde_qty="1",
+    )
+
+
+class FakeStockApi:
+    """조합별로 지정한 횟수만큼 실패한 뒤 응답하는 키움 API (failures=-1이면 항상 실패)"""
+
+    def __init__(self, failures=None):
+        self.failures = dict(failures or {})
+        self.calls = []
+
+    async def get_investor_daily_trade_stock(self, req):
+        key = combination_key(req)
+        self.calls.append(key)
+        remaining = self.failures.get(key, 0)
+        if remaining:
+            self.failures[key] = remaining - 1
+            raise RuntimeError(f"조회 실패 {key}")
+        return [trade(req.invsr_tp)]
+
+
+class FakeStockUnitOfWork:
+    def __init__(self, saved):
+        self.investor_daily_trade_repo = self
+        self.saved = saved
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def bulk_upsert_many(self, results):
+        self.saved.extend(combination_key(req) for req, _ in results)
+
+    async def commit(self):
+        pass
+
+
+@pytest.fixture
+def saved(monkeypatch):
+    saved = []
+    monkeypatch.setattr(stock_service_module, "StockUnitOfWork", lambda: FakeStockUnitOfWork(saved))
+    monkeypatch.setattr(settings, "INVESTOR_SYNC_MAX_RETRIES", 2)
+    monkeypatch.setattr(settings, "INVESTOR_SYNC_RETRY_BACKOFF", 0)
+    return saved
+
+
+def sync(api, checkpoint=None):
+    return asyncio.run(StockService(api).sync_investor_daily_trade_stock(REQUEST, checkpoint=checkpoint))
+
+
+def test_combination_recovers_within_retries(saved):
+    api = FakeStockApi({INDIVIDUAL: 2})
+
+    result = sync(api)
+
+    assert result.failed_combinations == []
+    assert len(result.trades) == 12
+    assert api.calls.count(INDIVIDUAL) == 3
+    assert INDIVIDUAL in saved
+
+
+def test_failed_combination_is_reported_and_marked_failed(saved):
+    api = FakeStockApi({FOREIGN: -1})
+    checkpoint = FakeCheckpoint()
+
+    result = sync(api, checkpoint)
+
+    assert result.failed_combinations == [FOREIGN]
+    assert api.calls.count(FOREIGN) == 3
+    assert len(result.trades) == 11
+    assert FOREIGN not in saved
+    assert checkpoint.states[FOREIGN][0] == "FAILED"
+    assert checkpoint.states[INDIVIDUAL][0] == "DONE"
+
+
+def test_retry_failed_fetches_only_failed_combinations(saved):
+    api = FakeStockApi()
+    checkpoint = FakeCheckpoint(states={FOREIGN: ("FAILED", None), INDIVIDUAL: ("DONE", None)}, retry_failed=True)
+
+    result = sync(api, checkpoint)
+
+    assert api.calls == [FOREIGN]
+    assert result.failed_combinations == []
+    assert checkpoint.states[FOREIGN][0] == "DONE"
+
+
+def test_all_combinations_failing_raises_after_marking(saved):
+    api = FakeStockApi({f"1:001:{invsr_tp}:1": -1 for invsr_tp in stock_service_module.INVESTOR_TYPES})
+    checkpoint = FakeCheckpoint()
+
+    with pytest.raises(RuntimeError):
+        sync(api, checkpoint)
+
+    assert saved == []
+    assert {status for status, _ in checkpoint.states.values()} == {"FAILED"}
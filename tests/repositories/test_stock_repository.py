@@ -0,0 +1,87 @@
+import asyncio
+
+from sqlalchemy.dialects import mysql
+from sqlalchemy.sql import Insert, Select
+
+from app.config import settings
+from app.repositories.stock_repository import StockRepository, _UPSERT_COLUMNS
+
+
+def stock_row(code, **values):
+    row = {column: None for column in _UPSERT_COLUMNS}
+    row.update(code=code, name=f"종목{code}", is_active=True, market_cap=0, **values)
+    return row
+
+
+class _Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def mappings(self):
+        return self.rows
+
+
+class FakeSession:
+    """저장된 종목 행을 돌려주고, upsert로 쓰인 종목코드를 기록"""
+
+    def __init__(self, stored):
+        self.stored = {row["code"]: row for row in stored}
+        self.written = []
+        self.compiled = []
+
+    async def execute(self, stmt):
+        if isinstance(stmt, Select):
+            return _Result(list(self.stored.values()))
+        assert isinstance(stmt, Insert)
+        compiled = stmt.compile(dialect=mysql.dialect())
+        self.compiled.append(compiled)
+        params = compiled.params
+        self.written.append(sorted(value for key, value in params.items() if key.startswith("code_m")))
+        return _Result([])
+
+
+def test_bulk_upsert_counts_from_stored_values(monkeypatch):
+    monkeypatch.setattr(settings, "STOCK_UPSERT_CHUNK_SIZE", 2)
+    session = FakeSession([
+        stock_row("000001", last_price="100"),
+        stock_row("000002", last_price="200"),
+    ])
+    rows = [
+        stock_row("000001", last_price="100"),  # 동일
+        stock_row("000002", last_price="210"),  # 변경
+        stock_row("000003", last_price="300"),  # 신규
+    ]
+
+    counts = asyncio.run(StockRepository(session).bulk_upsert(rows))
+
+    assert counts == {"inserted": 1, "updated": 1, "unchanged": 1}
+    # 동일 행은 쓰지 않는다 (청크 2개: [동일, 변경], [신규])
+    assert session.written == [["000002"], ["000003"]]
+
+
+def test_bulk_upsert_skips_statement_when_nothing_changed():
+    rows = [stock_row("000001", last_price="100")]
+    session = FakeSession(rows)
+
+    counts = asyncio.run(StockRepository(session).bulk_upsert(rows))
+
+    assert counts == {"inserted": 0, "updated": 0, "unchanged": 1}
+    assert session.written == []
+
+
+def test_bulk_upsert_stamps_inserts_and_updates_with_one_clock():
+    session = FakeSession([stock_row("000001", last_price="100")])
+    rows = [
+        stock_row("000001", last_price="110"),  # 변경
+        stock_row("000002", last_price="200"),  # 신규
+    ]
+
+    asyncio.run(StockRepository(session).bulk_upsert(rows))
+
+    [compiled] = session.compiled
+    stamps = {value for key, value in compiled.params.items() if key.startswith(("created_at_m", "updated_at_m"))}
+    assert len(stamps) == 1
+    # 변경 행은 삽입 값의 updated_at으로 갱신하고 created_at은 유지
+    on_duplicate = str(compiled).split("ON DUPLICATE KEY UPDATE")[1]
+    assert "updated_at = VALUES(updated_at)" in on_duplicate
+    assert "created_at" not in on_duplicate
@@ -0,0 +1,14 @@
+import pytest
+
+from app.common.cache import trading_count_cache
+from app.common.ranking_snapshot import ranking_snapshot_store
+
+
+@pytest.fixture(autouse=True)
+def clear_trading_caches():
+    """순위 스냅샷 / 건수 캐시는 모듈 전역이므로 테스트마다 비운다"""
+    ranking_snapshot_store.clear()
+    trading_count_cache.clear()
+    yield
+    ranking_snapshot_store.clear()
+    trading_count_cache.clear()
@@ -0,0 +1,84 @@
+"""거래대금 순위 서비스 테스트용 stock_trading_daily 행 / 메모리 TradingRepository"""
+from datetime import date, datetime
+from types import SimpleNamespace
+from typing import List, Optional
+
+TRADE_DATE = date(2026, 1, 9)
+SAVED_AT = datetime(2026, 1, 9, 16)
+
+
+def trading_row(id, current_rank=None, stock_code=None, trade_date=TRADE_DATE, **values):
+    """stock_trading_daily 한 행 (지정하지 않은 값은 None, 종목코드는 id로 생성)"""
+    stock_code = stock_code or f"{id:06d}"
+    row = SimpleNamespace(
+        id=id, stock_code=stock_code, stock_name=f"종목{stock_code}", trade_date=trade_date,
+        current_price=None, change_amount=None, change_rate=None,
+        trading_amount=None, trading_volume=None, previous_trading_volume=None,
+        sell_bid=None, buy_bid=None, current_rank=current_rank, previous_rank=None,
+        created_at=SAVED_AT, updated_at=SAVED_AT,
+    )
+    vars(row).update(values)
+    return row
+
+
+class FakeTradingRepository:
+    """TradingRepository의 조회 조건(순위권/키셋)과 save_ranking 의미를 메모리에서 재현
+
+    rows는 다른 프로세스가 쓴 것처럼 테스트에서 바로 바꿀 수 있고, 조회/저장 횟수를 기록한다.
+    """
+
+    def __init__(self, rows: Optional[List[SimpleNamespace]] = None):
+        self.rows = list(rows or [])
+        self.ranking_reads = 0
+        self.version_reads = 0
+        self.writes = 0
+
+    def row(self, stock_code, trade_date=TRADE_DATE) -> Optional[SimpleNamespace]:
+        return next((r for r in self.rows if r.stock_code == stock_code and r.trade_date == trade_date), None)
+
+    def _ranked(self, trade_date):
+        ranked = (r for r in self.rows if r.trade_date == trade_date and r.current_rank is not None)
+        return sorted(ranked, key=lambda r: (r.current_rank, r.id))
+
+    def _history(self, stock_code):
+        return sorted((r for r in self.rows if r.stock_code == stock_code), key=lambda r: r.trade_date, reverse=True)
+
+    async def save_ranking(self, trade_date, trading_data, ranked_codes):
+        self.writes += 1
+        now = datetime.now()
+        for data in trading_data:
+            row = self.row(data["stock_code"], trade_date)
+            if row is None:
+                row = trading_row(len(self.rows) + 1, trade_date=trade_date, created_at=now)
+                self.rows.append(row)
+            vars(row).update(data, updated_at=now)
+        exited = [r for r in self._ranked(trade_date) if r.stock_code not in ranked_codes]
+        for row in exited:
+            row.current_rank = None
+            row.updated_at = now
+        return len(exited)
+
+    async def get_latest_trade_date(self):
+        return max((r.trade_date for r in self.rows), default=None)
+
+    async def get_ranking_version(self, trade_date):
+        self.version_reads += 1
+        rows = [r for r in self.rows if r.trade_date == trade_date]
+        return max((r.updated_at for r in rows), default=None), len(rows)
+
+    async def get_ranking_by_date(self, trade_date, skip=0, limit=100, after=None):
+        self.ranking_reads += 1
+        rows = self._ranked(trade_date)
+        rows = [r for r in rows if (r.current_rank, r.id) > after] if after else rows[skip:]
+        return rows[:limit]
+
+    async def count_by_date(self, trade_date):
+        return len(self._ranked(trade_date))
+
+    async def get_stock_history(self, stock_code, start_date=None, end_date=None, skip=0, limit=30, before=None):
+        rows = self._history(stock_code)
+        rows = [r for r in rows if r.trade_date < before] if before else rows[skip:]
+        return rows[:limit]
+
+    async def count_stock_history(self, stock_code, start_date=None, end_date=None):
+        return len(self._history(stock_code))
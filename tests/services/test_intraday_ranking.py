@@ -0,0 +1,72 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.common.ranking_snapshot import ranking_snapshot_store
+from app.config import settings
+from app.services.trading_service import TradingService
+from tests.services.fakes import TRADE_DATE, FakeTradingRepository
+
+
+def rank_item(code, rank, amount):
+    return SimpleNamespace(
+        stk_cd=code, stk_nm=f"종목{code}", cur_prc="1000", pred_pre="10", flu_rt="1.00",
+        sel_bid="1001", buy_bid="999", trde_prica=str(amount), now_trde_qty="100",
+        pred_trde_qty="90", now_rank=str(rank), pred_rank="",
+    )
+
+
+class FakeRankService:
+    def __init__(self):
+        self.items = []
+
+    async def get_top_trading_volume_stocks(self, **kwargs):
+        return SimpleNamespace(trde_prica_upper=self.items)
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(settings, "TRADING_SNAPSHOT_TTL_SECONDS", 60.0)
+    return TradingService(FakeTradingRepository(), FakeRankService())
+
+
+def sync(service, *items):
+    service.rank_service.items = list(items)
+    return asyncio.run(service.sync_intraday_ranking(trade_date=TRADE_DATE, limit=3))
+
+
+def test_stock_leaving_top_n_is_unranked(service):
+    sync(service, rank_item("A", 1, 300), rank_item("B", 2, 200), rank_item("C", 3, 100))
+
+    # C가 순위권 밖으로, D가 새로 3위
+    result = sync(service, rank_item("A", 1, 300), rank_item("B", 2, 200), rank_item("D", 3, 150))
+
+    assert result.synced_count == 1
+    repo = service.repo
+    assert repo.row("C").current_rank is None
+    ranked = sorted((row.current_rank, row.stock_code) for row in repo.rows if row.current_rank)
+    assert ranked == [(1, "A"), (2, "B"), (3, "D")]
+
+    snapshot = ranking_snapshot_store.get()
+    assert [row["stock_code"] for row in snapshot.rankings] == ["A", "B", "D"]
+
+
+def test_exit_without_other_changes_still_writes(service):
+    sync(service, rank_item("A", 1, 300), rank_item("B", 2, 200), rank_item("C", 3, 100))
+
+    # 상위 N이 줄어든 응답 (남은 종목은 그대로)
+    result = sync(service, rank_item("A", 1, 300), rank_item("B", 2, 200))
+
+    assert result.synced_count == 0
+    assert service.repo.writes == 2
+    assert [row["stock_code"] for row in ranking_snapshot_store.get().rankings] == ["A", "B"]
+
+
+def test_empty_response_does_not_unrank_everything(service):
+    sync(service, rank_item("A", 1, 300), rank_item("B", 2, 200))
+
+    sync(service)
+
+    assert service.repo.writes == 1
+    assert [row["stock_code"] for row in ranking_snapshot_store.get().rankings] == ["A", "B"]
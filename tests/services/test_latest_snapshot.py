@@ -0,0 +1,51 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from app.config import settings
+from app.services.trading_service import TradingService
+from tests.services.fakes import FakeTradingRepository, trading_row
+
+SAVED_AT = datetime(2026, 1, 9, 10)
+
+
+@pytest.fixture
+def repo():
+    return FakeTradingRepository([
+        trading_row(1, 1, current_price=1000, updated_at=SAVED_AT),
+        trading_row(2, 2, current_price=900, updated_at=SAVED_AT),
+    ])
+
+
+def latest(repo):
+    return asyncio.run(TradingService(repo, rank_service=None).get_latest_snapshot())
+
+
+def test_fresh_snapshot_is_served_without_db(repo, monkeypatch):
+    monkeypatch.setattr(settings, "TRADING_SNAPSHOT_TTL_SECONDS", 60.0)
+    first = latest(repo)
+    reads = (repo.ranking_reads, repo.version_reads)
+
+    assert latest(repo) is first
+    assert (repo.ranking_reads, repo.version_reads) == reads
+
+
+def test_stale_snapshot_kept_when_db_version_unchanged(repo, monkeypatch):
+    monkeypatch.setattr(settings, "TRADING_SNAPSHOT_TTL_SECONDS", 0.0)
+    first = latest(repo)
+
+    assert latest(repo) is first
+    assert repo.ranking_reads == 1
+
+
+def test_stale_snapshot_rebuilt_after_write_by_another_process(repo, monkeypatch):
+    monkeypatch.setattr(settings, "TRADING_SNAPSHOT_TTL_SECONDS", 0.0)
+    first = latest(repo)
+
+    repo.rows[0] = trading_row(1, 1, current_price=1100, updated_at=datetime(2026, 1, 9, 10, 1))
+    second = latest(repo)
+
+    assert second is not first
+    assert second.rankings[0]["current_price"] == 1100
+    assert second.etag != first.etag
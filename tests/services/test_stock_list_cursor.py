@@ -0,0 +1,88 @@
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.common.cache import stock_count_cache
+from app.repositories.stock_repository import StockRepository
+from app.services.stock_service import StockService
+
+BASE_TIME = datetime(2026, 1, 1, 9, 0, 0, 123456)
+
+
+def make_stock(id, market_cap, name, minutes):
+    created_at = BASE_TIME + timedelta(minutes=minutes)
+    return SimpleNamespace(
+        id=id, code=f"{id:06d}", name=name, market_cap=market_cap,
+        created_at=created_at, updated_at=created_at, is_active=True,
+        list_count=None, audit_info=None, reg_day=None, last_price=None, state=None,
+        market_code="0", market_name=None, up_name=None, up_size_name=None,
+        company_class_name=None, order_warning=None, nxt_enable=None,
+    )
+
+
+# 시가총액/생성일시 동률이 섞인 종목
+STOCKS = [
+    make_stock(1, 500, "가", 0),
+    make_stock(2, 300, "나", 1),
+    make_stock(3, 500, "다", 1),
+    make_stock(4, 100, "라", 2),
+    make_stock(5, 300, "마", 2),
+    make_stock(6, 500, "바", 3),
+    make_stock(7, 0, "사", 3),
+]
+
+
+class FakeStockRepository:
+    """StockRepository.get_all의 키셋 조건을 메모리에서 재현"""
+
+    parse_order = staticmethod(StockRepository.parse_order)
+
+    async def get_all(self, skip=0, limit=100, market_code=None, start_date=None, end_date=None,
+                      order_by=None, after=None):
+        column, descending = self.parse_order(order_by)
+        key = lambda stock: (getattr(stock, column.key), stock.id)
+        rows = sorted(STOCKS, key=key, reverse=descending)
+        if after is not None:
+            rows = [row for row in rows if (key(row) < after if descending else key(row) > after)]
+        else:
+            rows = rows[skip:]
+        return rows[:limit]
+
+    async def count_all(self, market_code=None, start_date=None, end_date=None):
+        return len(STOCKS)
+
+
+@pytest.fixture(autouse=True)
+def clear_count_cache():
+    stock_count_cache.clear()
+
+
+def read_all_pages(order_by, limit=2):
+    service = StockService(FakeStockRepository())
+    ids, cursor = [], None
+    while True:
+        page = asyncio.run(service.get_stock_list(limit=limit, order_by=order_by, cursor=cursor))
+        ids.extend(stock.id for stock in page.stocks)
+        cursor = page.next_cursor
+        if cursor is None:
+            return ids
+
+
+@pytest.mark.parametrize("order_by", [None, "market_cap_desc", "market_cap_asc", "name_asc", "created_at_desc"])
+def test_cursor_pages_cover_every_stock_once(order_by):
+    column, descending = StockRepository.parse_order(order_by)
+    expected = [
+        stock.id for stock in sorted(STOCKS, key=lambda s: (getattr(s, column.key), s.id), reverse=descending)
+    ]
+
+    assert read_all_pages(order_by) == expected
+
+
+def test_cursor_rejects_different_order():
+    service = StockService(FakeStockRepository())
+    page = asyncio.run(service.get_stock_list(limit=2, order_by="name_asc"))
+
+    with pytest.raises(ValueError):
+        asyncio.run(service.get_stock_list(limit=2, order_by="market_cap_desc", cursor=page.next_cursor))
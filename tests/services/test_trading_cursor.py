@@ -0,0 +1,65 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from app.services.trading_service import TradingService
+from tests.services.fakes import TRADE_DATE, FakeTradingRepository, trading_row
+
+# 같은 순위가 둘인 거래일 (순위, id 순)
+RANKINGS = [
+    trading_row(10, 1),
+    trading_row(12, 2),
+    trading_row(11, 2),
+    trading_row(13, 3),
+    trading_row(14, 4),
+]
+# 순위 거래일 이전의 한 종목 이력
+HISTORY = [trading_row(100 + i, 1, stock_code="005930", trade_date=TRADE_DATE - timedelta(days=1 + i)) for i in range(5)]
+
+
+@pytest.fixture
+def service():
+    return TradingService(FakeTradingRepository(RANKINGS + HISTORY), rank_service=None)
+
+
+def read_all(fetch, items_of):
+    ids, cursor = [], None
+    while True:
+        page = asyncio.run(fetch(cursor))
+        ids.extend(row.id for row in items_of(page))
+        cursor = page.next_cursor
+        if cursor is None:
+            return ids
+
+
+def test_ranking_cursor_pages_cover_every_row_once(service):
+    ids = read_all(
+        lambda cursor: service.get_ranking_by_date(TRADE_DATE, limit=2, cursor=cursor),
+        lambda page: page.rankings,
+    )
+
+    assert ids == [10, 11, 12, 13, 14]
+
+
+def test_ranking_cursor_rejects_other_trade_date(service):
+    page = asyncio.run(service.get_ranking_by_date(TRADE_DATE, limit=2))
+
+    with pytest.raises(ValueError):
+        asyncio.run(service.get_ranking_by_date(TRADE_DATE - timedelta(days=1), limit=2, cursor=page.next_cursor))
+
+
+def test_history_cursor_pages_cover_every_day_once(service):
+    ids = read_all(
+        lambda cursor: service.get_stock_history("005930", limit=2, cursor=cursor),
+        lambda page: page.history,
+    )
+
+    assert ids == [100, 101, 102, 103, 104]
+
+
+def test_history_cursor_rejects_other_stock(service):
+    page = asyncio.run(service.get_stock_history("005930", limit=2))
+
+    with pytest.raises(ValueError):
+        asyncio.run(service.get_stock_history("000660", limit=2, cursor=page.next_cursor))